@@ -17,16 +17,18 @@ def check_dependency(name):
     except Exception as e:
         return f"Error: {e}"
 
-# Diagnostic info
-diagnostics = {
-    "sys_path": sys.path,
-    "cwd": os.getcwd(),
-    "files_root": str(os.listdir(root_dir)) if os.path.exists(root_dir) else "N/A",
-    "files_src": str(os.listdir(os.path.join(root_dir, "src"))) if os.path.exists(os.path.join(root_dir, "src")) else "N/A",
-    "dep_fastapi": check_dependency("fastapi"),
-    "dep_pydantic": check_dependency("pydantic"),
-    "dep_sentient": check_dependency("sentient_agent_framework"),
-}
+# Diagnostic info, only gathered when startup failed so cold starts skip the
+# directory listings and dependency probes
+def collect_diagnostics():
+    return {
+        "sys_path": sys.path,
+        "cwd": os.getcwd(),
+        "files_root": str(os.listdir(root_dir)) if os.path.exists(root_dir) else "N/A",
+        "files_src": str(os.listdir(os.path.join(root_dir, "src"))) if os.path.exists(os.path.join(root_dir, "src")) else "N/A",
+        "dep_fastapi": check_dependency("fastapi"),
+        "dep_pydantic": check_dependency("pydantic"),
+        "dep_sentient": check_dependency("sentient_agent_framework"),
+    }
 
 try:
     # Try importing the main app
@@ -40,6 +42,9 @@ try:
 
 except BaseException as e:
     # Fallback app for ANY error (ImportError, SyntaxError, SystemExit, etc.)
+    startup_error = e
+    startup_traceback = traceback.format_exc()
+    diagnostics = collect_diagnostics()
     from fastapi import FastAPI, Request
     from fastapi.responses import JSONResponse
     
@@ -51,9 +56,9 @@ except BaseException as e:
             status_code=500,
             content={
                 "error": "Critical Startup Error",
-                "type": type(e).__name__,
-                "message": str(e),
-                "traceback": traceback.format_exc(),
+                "type": type(startup_error).__name__,
+                "message": str(startup_error),
+                "traceback": startup_traceback,
                 "diagnostics": diagnostics
             }
         )
@@ -7,6 +7,8 @@ const CONFIG = {
         ? 'http://localhost:8000/api'
         : 'https://polyseek-sentient-agent-production.up.railway.app/api',
     MOCK_MODE: false,
+    // Use the progressive SSE endpoint so stage results show up as they arrive
+    STREAMING: true,
 };
 
 
@@ -90,6 +92,9 @@ async function analyzeMarket(marketUrl, depth, perspective) {
     try {
         if (CONFIG.MOCK_MODE) {
             await simulateAnalysis(marketUrl, depth, perspective);
+        } else if (CONFIG.STREAMING) {
+            const data = await analyzeMarketStream(marketUrl, depth, perspective);
+            displayResults(data);
         } else {
             const response = await fetch(`${CONFIG.API_BASE_URL}/analyze`, {
                 method: 'POST',
@@ -161,6 +166,81 @@ async function analyzeMarket(marketUrl, depth, perspective) {
     }
 }
 
+// Status line shown for each progressive stage event
+const STREAM_STATUS = {
+    RECEIVED: 'Fetching market data...',
+    MARKET_METADATA: 'Market loaded. Reading page context and news...',
+    CONTEXT: 'Page context collected...',
+    SIGNALS: 'External signals collected. Running analysis...',
+    DEEP_MODE: 'Deep analysis: planning...',
+    DEEP_PLAN: 'Deep analysis: critiquing the plan...',
+    DEEP_CRITIQUE: 'Deep analysis: writing the final report...',
+    CACHED: 'Loaded a recent analysis for this market...',
+};
+
+async function analyzeMarketStream(marketUrl, depth, perspective) {
+    const response = await fetch(`${CONFIG.API_BASE_URL}/analyze/stream`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            market_url: marketUrl,
+            depth: depth,
+            perspective: perspective,
+        }),
+    });
+
+    if (!response.ok) {
+        const responseText = await response.text();
+        let errorMessage = `API error: ${response.status} ${response.statusText}`;
+        try {
+            const errorData = JSON.parse(responseText);
+            errorMessage = errorData.detail || errorData.message || errorData.error || errorMessage;
+        } catch (parseError) {
+            errorMessage = responseText || errorMessage;
+        }
+        throw new Error(errorMessage);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    const result = { json: null, markdown: '' };
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        // SSE events are separated by a blank line
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const rawEvent = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            const dataLine = rawEvent.split('\n').find((line) => line.startsWith('data: '));
+            if (!dataLine) continue;
+            const event = JSON.parse(dataLine.slice(6));
+
+            if (rawEvent.startsWith('event: error')) {
+                throw new Error(event.error || 'Analysis failed');
+            }
+            if (event.type === 'ANALYSIS_JSON') {
+                result.json = event.data;
+            } else if (event.type === 'ANALYSIS_MARKDOWN') {
+                result.markdown += event.chunk;
+            } else if (STREAM_STATUS[event.type]) {
+                updateLoadingStatus(STREAM_STATUS[event.type]);
+            }
+        }
+    }
+
+    if (!result.json) {
+        throw new Error('Analysis stream ended before a result was received');
+    }
+    return result;
+}
+
 // Fallback mock markets
 const getMockMarkets = () => [
     {
@@ -0,0 +1,137 @@
+"""Compare HTML parser backends on saved market pages.
+
+Each backend runs in a fresh interpreter that parses every fixture with
+``scrape_context._parse_dom``, reporting the best parse time, the peak
+Python heap (tracemalloc) and the process peak RSS, which also covers
+allocations made inside C parsers. Rules and comment bodies are checked
+against the ``html.parser`` output so a faster backend cannot change what is
+extracted. The ``__NEXT_DATA__`` fast path is listed alongside for pages
+that embed it.
+
+    python scripts/bench_html_parse.py --runs 20
+"""
+
+import argparse
+import dataclasses
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "scripts", "fixtures")
+
+BACKENDS = ("html.parser", "lxml", "html5lib")
+# Pseudo-backend timing the embedded-JSON fast path instead of a DOM parse
+NEXT_DATA = "__NEXT_DATA__"
+
+
+def run_worker(backend: str, paths, runs: int) -> None:
+    """Parse the fixtures with ``backend`` and print one JSON line of results."""
+    import resource
+    import tracemalloc
+
+    from polyseek_sentient.config import ScrapeSettings
+    from polyseek_sentient.scrape_context import _extract_next_data, _parse_dom, _parse_next_data
+
+    def parse_next_data(html, settings):
+        data = _extract_next_data(html)
+        return _parse_next_data(data, settings) if data is not None else (None, [])
+
+    parse = parse_next_data if backend == NEXT_DATA else _parse_dom
+    settings = dataclasses.replace(ScrapeSettings(), html_parser=backend)
+    results = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as handle:
+            html = handle.read()
+        if backend == NEXT_DATA and _extract_next_data(html) is None:
+            continue
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            rules, comments = parse(html, settings)
+            timings.append(time.perf_counter() - started)
+        tracemalloc.start()
+        parse(html, settings)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[os.path.basename(path)] = {
+            "best_ms": min(timings) * 1000,
+            "heap_peak_kb": peak / 1024,
+            "rules": rules,
+            "comments": [body for body, _ in comments],
+        }
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"maxrss_kb": maxrss / (1024 if sys.platform == "darwin" else 1), "files": results}))
+
+
+def measure(backend: str, paths, runs: int):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.join(ROOT, "src"), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, __file__, "--worker", backend, "--runs", str(runs), *paths],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+    )
+    if proc.returncode != 0:
+        sys.exit(f"Benchmarking {backend} failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixtures", nargs="*", help="HTML files (default: scripts/fixtures/*.html)")
+    parser.add_argument("--runs", type=int, default=10, help="Parses per fixture; the best run counts")
+    parser.add_argument("--backend", action="append", help="Backends to compare (default: all installed)")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    paths = args.fixtures or sorted(glob.glob(os.path.join(FIXTURES, "*.html")))
+    if not paths:
+        sys.exit("No fixtures found")
+
+    if args.worker:
+        run_worker(args.worker, paths, max(1, args.runs))
+        return
+
+    from bs4.builder import builder_registry
+
+    backends = args.backend or [name for name in BACKENDS if builder_registry.lookup(name) is not None]
+    if "html.parser" not in backends:
+        backends.insert(0, "html.parser")
+    backends.append(NEXT_DATA)
+    reports = {backend: measure(backend, paths, args.runs) for backend in backends}
+    baseline = reports["html.parser"]
+
+    mismatches = []
+    for path in paths:
+        name = os.path.basename(path)
+        size_kb = os.path.getsize(path) / 1024
+        print(f"\n{name} ({size_kb:.0f} KB)")
+        for backend, report in reports.items():
+            result = report["files"].get(name)
+            if result is None:
+                continue
+            speedup = baseline["files"][name]["best_ms"] / result["best_ms"]
+            print(
+                f"  {backend:12} {result['best_ms']:8.2f} ms  x{speedup:4.1f}"
+                f"  heap peak {result['heap_peak_kb']:8.0f} KB"
+            )
+            expected = baseline["files"][name]
+            extracted = (result["rules"], result["comments"])
+            if backend != NEXT_DATA and extracted != (expected["rules"], expected["comments"]):
+                mismatches.append(f"{backend} on {name}")
+
+    print("\nProcess peak RSS:")
+    for backend, report in reports.items():
+        print(f"  {backend:12} {report['maxrss_kb'] / 1024:8.1f} MB")
+    for mismatch in mismatches:
+        print(f"\nFAIL: extraction differs from html.parser: {mismatch}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Measure cold-start import time of the API and fail when it exceeds a budget.
+
+Runs ``python -X importtime`` in fresh interpreters, reports the best
+cumulative time for the target module and the slowest imports, and exits
+non-zero when the budget is exceeded or a heavy dependency is imported
+eagerly.
+
+    python scripts/bench_import_time.py --budget-ms 800
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dependencies that should only load on the first request needing them
+LAZY_MODULES = ("httpx", "bs4", "feedparser", "litellm")
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure(module: str):
+    """Return {module: (self_us, cumulative_us)} for one cold import of ``module``."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.join(ROOT, "src"), env.get("PYTHONPATH")]))
+    env.pop("PYTHONIMPORTTIME", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+    )
+    if proc.returncode != 0:
+        sys.exit(f"Importing {module} failed:\n{proc.stderr}")
+    timings = {}
+    for line in proc.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            timings[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="polyseek_sentient.main")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("IMPORT_TIME_BUDGET_MS", "1000")),
+        help="Maximum cumulative import time of --module (default: IMPORT_TIME_BUDGET_MS or 1000)",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to sample; the best run counts")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to list")
+    args = parser.parse_args()
+
+    runs = [measure(args.module) for _ in range(max(1, args.runs))]
+    best = min(runs, key=lambda timings: timings[args.module][1])
+    total_ms = best[args.module][1] / 1000
+
+    print(f"{args.module}: {total_ms:.1f} ms (best of {len(runs)}, budget {args.budget_ms:.0f} ms)")
+    print("\nSlowest imports by self time:")
+    for name, (self_us, cumulative_us) in sorted(best.items(), key=lambda item: -item[1][0])[: args.top]:
+        print(f"  {self_us / 1000:8.1f} ms self  {cumulative_us / 1000:8.1f} ms total  {name}")
+
+    failures = []
+    eager = [name for name in LAZY_MODULES if name in best]
+    if eager:
+        failures.append(f"heavy dependencies imported at startup: {', '.join(eager)}")
+    if total_ms > args.budget_ms:
+        failures.append(f"import time {total_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+    for failure in failures:
+        print(f"\nFAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Measure sentiment scoring throughput on comment-sized texts.
+
+Compares the per-text substring heuristics the scraper and signal clients
+used before ``sentiment.LexiconScorer`` with the compiled scorer, called once
+per text and once per batch. Texts are the comments extracted from the saved
+market pages, repeated up to ``--texts``.
+
+    python scripts/bench_sentiment.py --texts 20000
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "scripts", "fixtures")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+
+def baseline_comment(text: str):
+    # scrape_context._heuristic_sentiment and _mentions_ratio before the shared scorer
+    text_lower = text.lower()
+    pro_score = sum(word in text_lower for word in ("yes", "win", "likely", "bull"))
+    con_score = sum(word in text_lower for word in ("no", "lose", "unlikely", "bear"))
+    label = "pro" if pro_score > con_score else "con" if con_score > pro_score else "neutral"
+    mentions = len(re.findall(r"@[\w:-]+", text))
+    return label, min(1.0, mentions / max(len(text.split()), 1))
+
+
+def load_texts(count: int):
+    from polyseek_sentient.config import ScrapeSettings
+    from polyseek_sentient.scrape_context import _parse_dom
+
+    bodies = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES, "*.html"))):
+        with open(path, encoding="utf-8") as handle:
+            bodies.extend(body for body, _ in _parse_dom(handle.read(), ScrapeSettings())[1])
+    if not bodies:
+        sys.exit("No comments found in fixtures")
+    return [bodies[i % len(bodies)] for i in range(count)]
+
+
+def best_rate(fn, texts, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn(texts)
+        best = min(best, time.perf_counter() - started)
+    return len(texts) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=10000, help="Texts scored per run")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per variant; the best run counts")
+    args = parser.parse_args()
+
+    from polyseek_sentient.sentiment import DEFAULT_SCORER
+
+    texts = load_texts(max(1, args.texts))
+    variants = {
+        "substring baseline": lambda batch: [baseline_comment(text) for text in batch],
+        "scorer per text": lambda batch: [DEFAULT_SCORER.score(text) for text in batch],
+        "scorer batch": DEFAULT_SCORER.score_many,
+    }
+    rates = {name: best_rate(fn, texts, max(1, args.runs)) for name, fn in variants.items()}
+    baseline = rates["substring baseline"]
+    print(f"{len(texts)} texts, {sum(map(len, texts)) / len(texts):.0f} chars on average")
+    for name, rate in rates.items():
+        print(f"  {name:20} {rate:12,.0f} texts/s  x{rate / baseline:4.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Admission control: bounded concurrency with a bounded, time-limited wait queue."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Deque, Optional
+
+from .config import AdmissionSettings, Settings
+from .metrics import ADMISSION_REJECTIONS, QUEUE_DEPTH
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when work is turned away; carries the HTTP status and retry hint."""
+
+    def __init__(self, status_code: int, retry_after: float, reason: str):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class AdmissionTicket:
+    """A held slot; ``release`` is idempotent so every exit path may call it."""
+
+    def __init__(self, controller: "AdmissionController"):
+        self._controller = controller
+        self._released = False
+
+    def release(self) -> None:
+        if not self._released:
+            self._released = True
+            self._controller._release()
+
+
+class AdmissionController:
+    """Lets ``max_concurrent`` holders run and queues at most ``max_queue`` more.
+
+    When the queue is full ``acquire`` fails fast with a 429; a queued caller
+    that is not admitted within ``queue_timeout`` seconds gets a 503. Passing
+    ``None`` for either limit makes the queue unbounded or the wait untimed.
+    Slots are handed to waiters in FIFO order.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int,
+        max_queue: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+        retry_after: float = 10.0,
+    ):
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @classmethod
+    def from_settings(cls, settings: AdmissionSettings) -> "AdmissionController":
+        return cls(
+            "admission",
+            max_concurrent=settings.max_concurrent,
+            max_queue=settings.max_queue,
+            queue_timeout=settings.queue_timeout_seconds or None,
+            retry_after=settings.retry_after_seconds,
+        )
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def check(self) -> None:
+        """Raise the rejection ``acquire`` would raise right away, without taking a slot."""
+        busy = self.active >= self.max_concurrent or self._waiters
+        if busy and self.max_queue is not None and len(self._waiters) >= self.max_queue:
+            ADMISSION_REJECTIONS.inc(queue=self.name, reason="queue_full")
+            raise AdmissionRejected(429, self.retry_after, "Server is at capacity, retry later")
+
+    async def acquire(self) -> AdmissionTicket:
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+            return AdmissionTicket(self)
+        self.check()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        QUEUE_DEPTH.inc(queue=self.name)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except BaseException as exc:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up; pass it on
+                self._release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(exc, asyncio.TimeoutError):
+                ADMISSION_REJECTIONS.inc(queue=self.name, reason="queue_timeout")
+                raise AdmissionRejected(
+                    503, self.retry_after, "Timed out waiting for capacity, retry later"
+                ) from None
+            raise
+        finally:
+            QUEUE_DEPTH.dec(queue=self.name)
+        return AdmissionTicket(self)
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        ticket = await self.acquire()
+        try:
+            yield
+        finally:
+            ticket.release()
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+        }
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)  # slot moves straight to the next waiter
+                return
+        self.active -= 1
+
+
+@lru_cache(maxsize=None)
+def get_llm_limiter(settings: Settings) -> AdmissionController:
+    """Process-wide cap on concurrent LLM completions; excess calls wait their turn."""
+    return AdmissionController("llm", max_concurrent=settings.llm.max_concurrency)
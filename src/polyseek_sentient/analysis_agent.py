@@ -3,16 +3,25 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Optional
+import math
+import time
+from dataclasses import dataclass, replace
+from operator import attrgetter
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from .config import Settings, load_settings
+from .admission import get_llm_limiter
+from .config import DedupSettings, Settings, load_settings
+from .dedup import collapse_near_duplicates
+from .metrics import EVIDENCE_DUPLICATES, LLM_ERRORS, LLM_LATENCY
 
 if TYPE_CHECKING:
-    from .fetch_market import MarketData
+    from .fetch_market import EventData, MarketData
     from .scrape_context import MarketContext
     from .signals_client import SignalRecord
 
+# Receives intermediate deep-mode results, e.g. ("plan", {...}) and ("critique", {...})
+AnalysisStepHook = Callable[[str, Dict], Awaitable[None]]
+
 
 @dataclass
 class AnalysisRequest:
@@ -26,11 +35,15 @@ class AnalysisRequest:
 async def run_analysis(
     request: AnalysisRequest,
     settings: Optional[Settings] = None,
+    on_step: Optional[AnalysisStepHook] = None,
 ) -> Dict:
     """Invoke the LLM to compute verdict / drivers / sources.
     
     For 'quick' mode: Single-pass analysis.
     For 'deep' mode: Planner → Critic → Follow-up → Final (4-step analysis).
+    For 'event' mode: Single pass over every outcome of a multi-market event;
+    markets outside an event fall back to quick mode.
+    ``on_step`` is awaited with each intermediate deep-mode result.
     """
     # Lazy import litellm
     try:
@@ -42,17 +55,92 @@ async def run_analysis(
     if settings.app.offline_mode or acompletion is None or not settings.llm.api_key:
         return _offline_analysis(request)
 
+    request = _collapse_evidence(request, settings.dedup)
+    if request.depth == "event" and request.market.event is not None:
+        return await _run_event_analysis(request, settings)
     if request.depth == "deep":
-        return await _run_deep_analysis(request, settings)
+        return await _run_deep_analysis(request, settings, on_step)
     else:
         return await _run_quick_analysis(request, settings)
 
 
+def _collapse_evidence(request: AnalysisRequest, settings: DedupSettings) -> AnalysisRequest:
+    """Merge reposted comments and syndicated signals so each is prompted once.
+
+    Only items with the same sentiment label merge. The first copy is kept
+    and its ``duplicate_count`` covers the rest.
+    """
+    if not settings.enabled:
+        return request
+    sentiment = attrgetter("sentiment")
+    comment_groups = collapse_near_duplicates(
+        request.context.comments, lambda c: c.body, settings.similarity, key=sentiment
+    )
+    signal_groups = collapse_near_duplicates(
+        request.signals, lambda s: f"{s.title}\n{s.snippet}", settings.similarity, key=sentiment
+    )
+    EVIDENCE_DUPLICATES.inc(len(request.context.comments) - len(comment_groups), kind="comment")
+    EVIDENCE_DUPLICATES.inc(len(request.signals) - len(signal_groups), kind="signal")
+    comments = [_merge(group) for group in comment_groups]
+    signals = [_merge(group) for group in signal_groups]
+    return replace(request, context=replace(request.context, comments=comments), signals=signals)
+
+
+def _merge(group: List):
+    first = group[0]
+    if len(group) == 1:
+        return first
+    return replace(first, duplicate_count=sum(item.duplicate_count for item in group))
+
+
+# How to read the lines of ``_evidence_blocks``; shown after the evidence
+# headers of every analysis prompt
+_POLARITY_LEGEND = "lexicon polarity from -1 con to +1 pro"
+COMMENTS_LEGEND = f"({_POLARITY_LEGEND}; xN marks a comment reposted N times)"
+SIGNALS_LEGEND = f"({_POLARITY_LEGEND}; xN marks a story syndicated N times)"
+
+
+def _copies(count: int) -> str:
+    return f" (x{count})" if count > 1 else ""
+
+
+def _evidence_blocks(request: AnalysisRequest) -> Tuple[str, str]:
+    """Render the comment and signal lists shared by the analysis prompts."""
+    comments_block = "\n".join(
+        f"- ({c.sentiment} {c.sentiment_score:+.2f}) [{c.comment_id}]{_copies(c.duplicate_count)} {c.body[:200]}"
+        for c in request.context.comments
+    ) or "No on-platform discussion available."
+    signals_block = "\n".join(
+        f"- {s.source_type}:{s.source} [{s.sentiment} {s.sentiment_score:+.2f}]{_copies(s.duplicate_count)} ({s.url}) {s.title}"
+        for s in request.signals
+    ) or "No external signals were retrieved."
+    return comments_block, signals_block
+
+
 async def _run_quick_analysis(
     request: AnalysisRequest,
     settings: Settings,
 ) -> Dict:
     """Quick mode: Single-pass analysis."""
+    return await _run_single_pass(_build_user_prompt(request), settings, step="quick")
+
+
+async def _run_event_analysis(
+    request: AnalysisRequest,
+    settings: Settings,
+) -> Dict:
+    """Event mode: one completion assesses every outcome of a multi-market event."""
+    event = request.market.event
+    result = await _run_single_pass(_build_event_prompt(request), settings, step="event")
+    if result.get("metadata", {}).get("error"):
+        return result
+    result["outcomes"] = _reconcile_outcomes(result.get("outcomes"), event)
+    result["metadata"]["event_id"] = event.event_id
+    return result
+
+
+async def _run_single_pass(user_prompt: str, settings: Settings, step: str) -> Dict:
+    """Run one JSON completion for ``user_prompt`` and check the required fields."""
     system_prompt = (
         "You are Polyseek Sentient, a rigorous prediction market analyst. "
         "You must analyze provided market data, comments, and external signals. "
@@ -61,8 +149,6 @@ async def _run_quick_analysis(
         "Do not include any text before or after the JSON. "
         "Do not wrap the JSON in markdown code blocks."
     )
-    user_prompt = _build_user_prompt(request)
-    
     # Detect if using Gemini model
     is_gemini = "gemini" in settings.llm.model.lower()
     
@@ -83,9 +169,7 @@ async def _run_quick_analysis(
         completion_params["response_format"] = {"type": "json_object"}
     
     try:
-        # Lazy import litellm
-        from litellm import acompletion
-        response = await acompletion(**completion_params)
+        response = await _acompletion(completion_params, step=step, settings=settings)
         content = response["choices"][0]["message"]["content"]
     except Exception as e:
         print(f"[ERROR] LLM API call failed: {str(e)}")
@@ -135,13 +219,14 @@ async def _run_quick_analysis(
         return _create_error_response(f"LLM response missing fields: {missing_fields}")
     
     result["metadata"] = result.get("metadata", {})
-    result["metadata"]["mode"] = "quick"
+    result["metadata"]["mode"] = step
     return result
 
 
 async def _run_deep_analysis(
     request: AnalysisRequest,
     settings: Settings,
+    on_step: Optional[AnalysisStepHook] = None,
 ) -> Dict:
     """Deep mode: Planner → Critic → Follow-up → Final (4-step analysis)."""
     system_prompt = (
@@ -171,15 +256,15 @@ async def _run_deep_analysis(
     if not is_gemini:
         planner_params["response_format"] = {"type": "json_object"}
     
-    # Lazy import litellm
-    from litellm import acompletion
-    planner_response = await acompletion(**planner_params)
+    planner_response = await _acompletion(planner_params, step="planner", settings=settings)
     plan_content = planner_response["choices"][0]["message"]["content"]
     plan = _parse_response_json(plan_content)
     
     # Ensure plan is a dict
     if not isinstance(plan, dict):
         plan = {"analysis_plan": [], "key_questions": [], "information_gaps": []}
+    if on_step:
+        await on_step("plan", plan)
     
     # Step 2: Critic - Critically evaluate the plan and identify gaps
     critic_prompt = _build_critic_prompt(request, plan)
@@ -196,15 +281,15 @@ async def _run_deep_analysis(
     if not is_gemini:
         critic_params["response_format"] = {"type": "json_object"}
     
-    # Lazy import litellm
-    from litellm import acompletion
-    critic_response = await acompletion(**critic_params)
+    critic_response = await _acompletion(critic_params, step="critic", settings=settings)
     critique_content = critic_response["choices"][0]["message"]["content"]
     critique = _parse_response_json(critique_content)
     
     # Ensure critique is a dict
     if not isinstance(critique, dict):
         critique = {"gaps": [], "follow_up_queries": [], "biases": [], "recommendations": []}
+    if on_step:
+        await on_step("critique", critique)
     
     # Step 3: Follow-up - Gather additional data if gaps identified
     additional_signals = list(request.signals)  # Copy original signals
@@ -234,9 +319,7 @@ async def _run_deep_analysis(
     if not is_gemini:
         final_params["response_format"] = {"type": "json_object"}
     
-    # Lazy import litellm
-    from litellm import acompletion
-    final_response = await acompletion(**final_params)
+    final_response = await _acompletion(final_params, step="final", settings=settings)
     final_content = final_response["choices"][0]["message"]["content"]
     result = _parse_response_json(final_content)
     
@@ -281,6 +364,27 @@ async def _run_deep_analysis(
     return result
 
 
+async def _acompletion(params: Dict, step: str, settings: Settings):
+    """Run one LLM completion, recording latency and failures per model and step.
+
+    Calls share a process-wide concurrency limit so a burst of analyses queues
+    here instead of hitting the provider all at once.
+    """
+    # Lazy import litellm
+    from litellm import acompletion
+
+    model = params["model"]
+    async with get_llm_limiter(settings).admit():
+        started = time.perf_counter()
+        try:
+            return await acompletion(**params)
+        except Exception:
+            LLM_ERRORS.inc(model=model, step=step)
+            raise
+        finally:
+            LLM_LATENCY.observe(time.perf_counter() - started, model=model, step=step)
+
+
 def _build_planner_prompt(request: AnalysisRequest) -> str:
     """Build prompt for planning phase."""
     market = request.market
@@ -375,14 +479,7 @@ def _build_final_prompt(request: AnalysisRequest, plan: Dict, critique: Dict) ->
     market = request.market
     context = request.context
     rules = context.resolution_rules or "N/A"
-    comments_block = "\n".join(
-        f"- ({c.sentiment}) [{c.comment_id}] {c.body[:200]}"
-        for c in context.comments
-    ) or "No on-platform discussion available."
-    signals_block = "\n".join(
-        f"- {s.source_type}:{s.source} [{s.sentiment}] ({s.url}) {s.title}"
-        for s in request.signals
-    ) or "No external signals were retrieved."
+    comments_block, signals_block = _evidence_blocks(request)
     
     plan_summary = json.dumps(plan.get("analysis_plan", []), indent=2)
     critique_summary = json.dumps({
@@ -417,10 +514,10 @@ Now perform the final deep analysis with MAXIMUM RIGOR and INSIGHT.
 
 === EVIDENCE BASE ===
 
-Platform Discussion:
+Platform Discussion {COMMENTS_LEGEND}:
 {comments_block}
 
-External Intelligence:
+External Intelligence {SIGNALS_LEGEND}:
 {signals_block}
 
 === ANALYTICAL FRAMEWORK ===
@@ -519,14 +616,7 @@ def _build_user_prompt(request: AnalysisRequest) -> str:
     market = request.market
     context = request.context
     rules = context.resolution_rules or "N/A"
-    comments_block = "\n".join(
-        f"- ({c.sentiment}) [{c.comment_id}] {c.body[:200]}"
-        for c in context.comments
-    ) or "No on-platform discussion available."
-    signals_block = "\n".join(
-        f"- {s.source_type}:{s.source} [{s.sentiment}] ({s.url}) {s.title}"
-        for s in request.signals
-    ) or "No external signals were retrieved."
+    comments_block, signals_block = _evidence_blocks(request)
 
     return f"""Analyze this prediction market and return ONLY a JSON object (no markdown, no explanation).
 
@@ -553,10 +643,10 @@ MARKET DATA:
 - Volume 24h: {market.volume_24h}
 - Resolution Rules: {rules}
 
-PLATFORM COMMENTS:
+PLATFORM COMMENTS {COMMENTS_LEGEND}:
 {comments_block}
 
-EXTERNAL SIGNALS:
+EXTERNAL SIGNALS {SIGNALS_LEGEND}:
 {signals_block}
 
 ANALYSIS INSTRUCTIONS:
@@ -594,6 +684,114 @@ NOW ANALYZE THE MARKET AND RETURN ONLY THE JSON OBJECT:
 """
 
 
+def _build_event_prompt(request: AnalysisRequest) -> str:
+    market = request.market
+    event = market.event
+    context = request.context
+    rules = context.resolution_rules or "N/A"
+    implied = event.implied_probabilities()
+    outcomes_block = "\n".join(
+        f"- {label}: YES={_format_price(price)}"
+        + (f", implied {probability * 100:.1f}%" if not math.isnan(probability) else "")
+        + (f", volume 24h {volume:.0f}" if not math.isnan(volume) else "")
+        + ("" if active else " (closed)")
+        for label, price, probability, volume, active in zip(
+            event.labels, event.yes_prices, implied, event.volumes_24h, event.active
+        )
+    )
+    exclusivity = (
+        "Exactly one outcome resolves YES; probabilities should sum to about 100."
+        if event.mutually_exclusive
+        else "Outcomes are independent; each resolves YES or NO on its own."
+    )
+    comments_block, signals_block = _evidence_blocks(request)
+
+    return f"""Analyze every outcome of this multi-market prediction event and return ONLY a JSON object (no markdown, no explanation).
+
+REQUIRED JSON STRUCTURE:
+{{
+  "verdict": "<label of the most likely outcome>" | "UNCERTAIN",
+  "confidence_pct": <number 0-100>,
+  "summary": "<comprehensive 3-5 sentence analysis of the event as a whole>",
+  "outcomes": [
+    {{"label": "<outcome label exactly as listed>", "verdict": "YES" | "NO" | "UNCERTAIN", "probability_pct": <number 0-100>, "rationale": "<one sentence>"}}
+  ],
+  "key_drivers": [
+    {{"text": "<detailed explanation>", "source_ids": ["SRC1", "SRC2"]}}
+  ],
+  "uncertainty_factors": ["<factor 1>", "<factor 2>"],
+  "sources": [
+    {{"id": "SRC1", "title": "<title>", "url": "<url>", "type": "market|comment|sns|news", "sentiment": "pro|con|neutral"}}
+  ]
+}}
+
+EVENT DATA:
+- Title: {event.title}
+- Category: {market.category}
+- Deadline: {market.deadline}
+- Resolution Rules: {rules}
+- {exclusivity}
+
+OUTCOMES (current market prices):
+{outcomes_block}
+
+PLATFORM COMMENTS {COMMENTS_LEGEND}:
+{comments_block}
+
+EXTERNAL SIGNALS {SIGNALS_LEGEND}:
+{signals_block}
+
+ANALYSIS INSTRUCTIONS:
+1. Return one entry in "outcomes" for EVERY outcome listed above, using its label verbatim
+2. probability_pct is your estimated probability that the outcome resolves YES
+3. Use the market prices as base probabilities and explain material deviations in the rationale
+4. Cite source IDs in key_drivers (use provided IDs or create synthetic ones like SRC1, SRC2)
+5. If evidence is insufficient, the top-level verdict MUST be "UNCERTAIN"
+6. Ensure sources[].type is exactly: "market", "comment", "sns", or "news"
+
+NOW ANALYZE THE EVENT AND RETURN ONLY THE JSON OBJECT:
+"""
+
+
+def _format_price(price: float) -> str:
+    return "n/a" if math.isnan(price) else f"{price:.3f}"
+
+
+def _reconcile_outcomes(outcomes, event: EventData) -> List[Dict]:
+    """Line the model's outcomes up with the event's markets.
+
+    Unknown labels are dropped; markets the model skipped keep their
+    market-implied probability. Rows are ordered by probability.
+    """
+    by_label: Dict[str, Dict] = {}
+    for outcome in outcomes if isinstance(outcomes, list) else []:
+        if isinstance(outcome, dict) and outcome.get("label"):
+            by_label.setdefault(str(outcome["label"]).strip().lower(), outcome)
+
+    implied = event.implied_probabilities() if event.mutually_exclusive else event.yes_prices
+    rows = []
+    for index, label in enumerate(event.labels):
+        price = event.yes_prices[index]
+        outcome = by_label.get(label.strip().lower()) or {}
+        try:
+            probability = min(100.0, max(0.0, float(outcome["probability_pct"])))
+        except (KeyError, TypeError, ValueError):
+            outcome = {}
+            probability = 0.0 if math.isnan(implied[index]) else implied[index] * 100
+        rows.append(
+            {
+                "label": label,
+                "market_id": event.market_ids[index],
+                "verdict": outcome.get("verdict") or "UNCERTAIN",
+                "probability_pct": probability,
+                "market_price": None if math.isnan(price) else price,
+                "rationale": outcome.get("rationale") or ("" if outcome else "Not assessed; market-implied probability."),
+            }
+        )
+    rows.sort(key=lambda row: row["probability_pct"], reverse=True)
+    return rows
+
+
 def _parse_response_json(raw: str) -> Dict:
     """Parse JSON response with fallback handling for malformed JSON."""
     import re
@@ -781,7 +979,7 @@ def _create_error_response(error_message: str) -> Dict:
 
 
 def _offline_analysis(request: AnalysisRequest) -> Dict:
-    return {
+    result = {
         "verdict": "UNCERTAIN",
         "confidence_pct": 50.0,
         "summary": "Offline mode stub analysis. Connect to network for real results.",
@@ -804,3 +1002,7 @@ def _offline_analysis(request: AnalysisRequest) -> Dict:
         "analysis_timestamp": None,
         "metadata": {"offline": True},
     }
+    if request.depth == "event" and request.market.event is not None:
+        result["outcomes"] = _reconcile_outcomes(None, request.market.event)
+        result["metadata"]["mode"] = "event"
+    return result
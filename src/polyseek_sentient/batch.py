@@ -0,0 +1,49 @@
+"""Bounded-concurrency fan-out used by the batch analysis endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, List, Sequence, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def map_unordered(
+    items: Sequence[T],
+    func: Callable[[T], Awaitable[R]],
+    concurrency: int,
+) -> AsyncIterator[Tuple[int, T, Union[R, Exception]]]:
+    """Run ``func`` over ``items`` with at most ``concurrency`` calls in flight.
+
+    Yields ``(index, item, result)`` as soon as each call finishes; a failing
+    call yields its exception instead of aborting the rest. Closing the
+    iterator early cancels the outstanding work.
+    """
+    pending: "asyncio.Queue[Tuple[int, T]]" = asyncio.Queue()
+    for index, item in enumerate(items):
+        pending.put_nowait((index, item))
+    finished: "asyncio.Queue[Tuple[int, T, Union[R, Exception]]]" = asyncio.Queue()
+
+    async def _worker() -> None:
+        while True:
+            try:
+                index, item = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                result: Union[R, Exception] = await func(item)
+            except Exception as exc:
+                result = exc
+            await finished.put((index, item, result))
+
+    workers: List[asyncio.Task] = [
+        asyncio.create_task(_worker()) for _ in range(max(1, min(concurrency, len(items))))
+    ]
+    try:
+        for _ in range(len(items)):
+            yield await finished.get()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,139 @@
+"""Single-flight coalescing of identical concurrent work."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Runs at most one computation per key; concurrent callers share its result.
+
+    A caller that is cancelled (e.g. a client disconnect) detaches without
+    cancelling the computation the other callers are waiting on.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved when every caller detached
+
+
+class EventBroadcast:
+    """Records a producer's events and replays them to every subscriber.
+
+    Exposes an ``asyncio.Queue``-style ``put`` so it can stand in for the queue
+    behind an SSE response handler; putting ``None`` ends the stream.
+    """
+
+    def __init__(self):
+        self._events: List[Any] = []
+        self._closed = False
+        self._changed = asyncio.Condition()
+
+    async def put(self, item: Any) -> None:
+        async with self._changed:
+            if item is None:
+                self._closed = True
+            elif not self._closed:
+                self._events.append(item)
+            self._changed.notify_all()
+
+    async def close(self) -> None:
+        await self.put(None)
+
+    async def events(self) -> AsyncIterator[Any]:
+        """Yield every event from the start, then live events until closed."""
+        index = 0
+        while True:
+            async with self._changed:
+                while index >= len(self._events) and not self._closed:
+                    await self._changed.wait()
+                pending = self._events[index:]
+                closed = self._closed
+            for item in pending:
+                yield item
+            index += len(pending)
+            if closed and index >= len(self._events):
+                return
+
+
+@dataclass
+class _StreamFlight:
+    broadcast: EventBroadcast = field(default_factory=EventBroadcast)
+    task: Optional[asyncio.Task] = None
+    subscribers: int = 0
+
+
+class StreamCoalescer:
+    """Single-flight for event streams: late joiners get the full event log."""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _StreamFlight] = {}
+
+    async def subscribe(
+        self,
+        key: Hashable,
+        producer: Callable[[EventBroadcast], Awaitable[None]],
+    ) -> AsyncIterator[Any]:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _StreamFlight()
+            flight.task = asyncio.create_task(self._produce(key, flight, producer))
+            self._flights[key] = flight
+        flight.subscribers += 1
+        try:
+            async for item in flight.broadcast.events():
+                yield item
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.task.done():
+                # Nobody is listening any more; stop the work and let the next
+                # request start a fresh flight.
+                self._detach(key, flight)
+                flight.task.cancel()
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def has_flight(self, key: Hashable) -> bool:
+        return key in self._flights
+
+    async def _produce(
+        self,
+        key: Hashable,
+        flight: _StreamFlight,
+        producer: Callable[[EventBroadcast], Awaitable[None]],
+    ) -> None:
+        try:
+            await producer(flight.broadcast)
+        except Exception:
+            logger.exception("Coalesced stream producer for %s failed", key)
+        finally:
+            self._detach(key, flight)
+            await flight.broadcast.close()
+
+    def _detach(self, key: Hashable, flight: _StreamFlight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
@@ -12,6 +12,8 @@ from typing import Optional
 class APISettings:
     polymarket_base: str = os.getenv("POLYMARKET_API_BASE", "https://gamma-api.polymarket.com")
     kalshi_base: str = os.getenv("KALSHI_API_BASE", "https://trading-api.kalshi.com")
+    # Query /events and /markets together for slugs not yet in the slug memo
+    polymarket_parallel_lookup: bool = os.getenv("POLYMARKET_PARALLEL_LOOKUP", "0") == "1"
     kalshi_api_key: Optional[str] = os.getenv("KALSHI_API_KEY")
     kalshi_api_secret: Optional[str] = os.getenv("KALSHI_API_SECRET")
     news_api_key: Optional[str] = os.getenv("NEWS_API_KEY")
@@ -25,6 +27,104 @@ class ScrapeSettings:
     timeout_seconds: float = float(os.getenv("SCRAPE_TIMEOUT", "8.0"))
     max_comments: int = int(os.getenv("SCRAPE_MAX_COMMENTS", "20"))
     max_comment_chars: int = int(os.getenv("SCRAPE_MAX_COMMENT_CHARS", "500"))
+    # BeautifulSoup tree builder: "auto" picks lxml when installed, else html.parser
+    html_parser: str = os.getenv("SCRAPE_HTML_PARSER", "auto")
+    # Pages are read up to this many bytes; the rest is never downloaded
+    max_bytes: int = int(os.getenv("SCRAPE_MAX_BYTES", "5000000"))
+    # Scan pages while they download and stop once rules and comments are found
+    streaming: bool = os.getenv("SCRAPE_STREAMING", "1") == "1"
+    # Secret keying comment ids and author aliases; keep it fixed so they stay stable
+    identity_key: str = os.getenv("COMMENT_ID_KEY", "")
+    # Read Polymarket comments from the comments API instead of the page HTML
+    comments_api: bool = os.getenv("SCRAPE_COMMENTS_API", "1") == "1"
+    comments_page_size: int = int(os.getenv("SCRAPE_COMMENTS_PAGE_SIZE", "40"))
+
+
+@dataclass(frozen=True)
+class ParseSettings:
+    # "thread" parses on the default thread pool; "process" on warm worker
+    # processes, one pool per workload
+    mode: str = os.getenv("PARSE_EXECUTOR", "thread")
+    scrape_workers: int = int(os.getenv("PARSE_SCRAPE_WORKERS", "2"))
+    rss_workers: int = int(os.getenv("PARSE_RSS_WORKERS", "1"))
+    start_method: str = os.getenv("PARSE_START_METHOD", "spawn")
+
+
+@dataclass(frozen=True)
+class DedupSettings:
+    # Collapse near-duplicate comments and signals before they are prompted
+    enabled: bool = os.getenv("EVIDENCE_DEDUP", "1") == "1"
+    # 0-1; texts whose SimHashes agree on at least this share of bits are merged
+    similarity: float = float(os.getenv("EVIDENCE_DEDUP_SIMILARITY", "0.85"))
+
+
+@dataclass(frozen=True)
+class HTTPSettings:
+    max_connections: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+    max_keepalive_connections: int = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    keepalive_expiry: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30.0"))
+    http2: bool = os.getenv("HTTP_ENABLE_HTTP2", "1") == "1"
+    # Idempotent requests are retried with decorrelated-jitter backoff;
+    # attempts counts the first try, so 1 disables retries
+    retry_attempts: int = int(os.getenv("HTTP_RETRY_ATTEMPTS", "3"))
+    retry_base_delay: float = float(os.getenv("HTTP_RETRY_BASE_DELAY", "0.1"))
+    retry_max_delay: float = float(os.getenv("HTTP_RETRY_MAX_DELAY", "2.0"))
+    # Send a second copy of a GET still unanswered after the host's p95 latency
+    hedge_requests: bool = os.getenv("HTTP_HEDGE_REQUESTS", "1") == "1"
+    hedge_min_samples: int = int(os.getenv("HTTP_HEDGE_MIN_SAMPLES", "20"))
+    # Consecutive failures that open a host's circuit, and how long it stays open
+    breaker_failures: int = int(os.getenv("HTTP_BREAKER_FAILURES", "5"))
+    breaker_reset_seconds: float = float(os.getenv("HTTP_BREAKER_RESET", "30"))
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    analysis_ttl_seconds: float = float(os.getenv("ANALYSIS_CACHE_TTL", "900"))
+    analysis_max_entries: int = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "512"))
+    # A cached verdict is recomputed once the YES price moves by more than this
+    analysis_price_threshold: float = float(
+        os.getenv("ANALYSIS_CACHE_PRICE_THRESHOLD") or os.getenv("ANALYSIS_CACHE_PRICE_BUCKET", "0.02")
+    )
+    analysis_sqlite_path: Optional[str] = os.getenv("ANALYSIS_CACHE_PATH") or None
+    # Market metadata: served as-is for the TTL, then served stale for up to the
+    # stale window while a conditional request revalidates it in the background
+    market_ttl_seconds: float = float(os.getenv("MARKET_CACHE_TTL", "30"))
+    market_stale_seconds: float = float(os.getenv("MARKET_CACHE_STALE_WINDOW", "120"))
+    market_max_entries: int = int(os.getenv("MARKET_CACHE_MAX_ENTRIES", "2048"))
+    # SQLite file remembering whether each Polymarket slug is an event or a market
+    slug_memo_path: Optional[str] = os.getenv("SLUG_MEMO_PATH") or None
+
+
+@dataclass(frozen=True)
+class AdmissionSettings:
+    # Analyses running at once; further requests wait in a bounded queue
+    max_concurrent: int = int(os.getenv("ADMISSION_MAX_CONCURRENT", "8"))
+    max_queue: int = int(os.getenv("ADMISSION_MAX_QUEUE", "16"))
+    queue_timeout_seconds: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "30"))
+    retry_after_seconds: int = int(os.getenv("ADMISSION_RETRY_AFTER", "10"))
+
+
+@dataclass(frozen=True)
+class JobSettings:
+    # Off for read-only or serverless deployments, where /api/jobs then answers 503
+    enabled: bool = os.getenv("JOBS_ENABLED", "1") == "1"
+    # Shared by every process serving jobs; relative paths resolve from the working directory
+    store_path: str = os.getenv("JOB_STORE_PATH", os.path.join("data", "jobs.sqlite"))
+    workers: int = int(os.getenv("JOB_WORKERS", "2"))
+    # A running job is renewed by its owner; once the lease lapses another process may take it
+    lease_seconds: float = float(os.getenv("JOB_LEASE_SECONDS", "60"))
+    # Finished jobs older than this are deleted when the worker pool starts
+    retention_seconds: float = float(os.getenv("JOB_RETENTION", "86400"))
+
+
+@dataclass(frozen=True)
+class TrendingSettings:
+    refresh_seconds: float = float(os.getenv("TRENDING_REFRESH_SECONDS", "300"))
+    limit: int = int(os.getenv("TRENDING_LIMIT", "12"))
+    # Kalshi's open-market listing is unordered and paged; at most this many pages are ranked
+    kalshi_max_pages: int = int(os.getenv("TRENDING_KALSHI_MAX_PAGES", "20"))
+    # Browser/CDN freshness for /api/trending responses
+    max_age_seconds: int = int(os.getenv("TRENDING_MAX_AGE", "60"))
 
 
 @dataclass(frozen=True)
@@ -38,17 +138,29 @@ class LLMSettings:
     )
     temperature: float = float(os.getenv("LLM_TEMPERATURE", "0.2"))
     max_tokens: int = int(os.getenv("LLM_MAX_TOKENS", "8192"))  # Increased from 2048 to 8192 for deep analysis
+    max_concurrency: int = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
 
 
 @dataclass(frozen=True)
 class AppSettings:
     offline_mode: bool = os.getenv("POLYSEEK_OFFLINE", "0") == "1"
+    # Import httpx/bs4/feedparser/litellm at startup instead of on first use
+    preload_modules: bool = os.getenv("POLYSEEK_PRELOAD", "0") == "1"
+    batch_concurrency: int = int(os.getenv("BATCH_CONCURRENCY", "4"))
+    batch_max_markets: int = int(os.getenv("BATCH_MAX_MARKETS", "200"))
 
 
 @dataclass(frozen=True)
 class Settings:
     apis: APISettings = APISettings()
     scrape: ScrapeSettings = ScrapeSettings()
+    parse: ParseSettings = ParseSettings()
+    dedup: DedupSettings = DedupSettings()
+    http: HTTPSettings = HTTPSettings()
+    cache: CacheSettings = CacheSettings()
+    admission: AdmissionSettings = AdmissionSettings()
+    jobs: JobSettings = JobSettings()
+    trending: TrendingSettings = TrendingSettings()
     llm: LLMSettings = LLMSettings()
     app: AppSettings = AppSettings()
 
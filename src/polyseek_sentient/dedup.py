@@ -0,0 +1,114 @@
+"""SimHash near-duplicate collapsing for comments and signals."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+HASH_BITS = 64
+# Texts with fewer features (about five words) only merge on an exact match:
+# one swapped word moves a short text's hash too little to tell them apart
+MIN_FEATURES = 9
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _feature_hash(feature: str) -> str:
+    digest = hashlib.blake2b(feature.encode(), digest_size=HASH_BITS // 8).digest()
+    return format(int.from_bytes(digest, "big"), f"0{HASH_BITS}b")
+
+
+def _features(words: List[str]) -> List[str]:
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of the words and word pairs in ``text``.
+
+    Texts differing in a few words land a few bits apart; case and
+    punctuation are ignored.
+    """
+    return _simhash(_features(_TOKEN.findall(text.lower())))
+
+
+def _simhash(features: List[str]) -> int:
+    if not features:
+        return 0
+    bits = [_feature_hash(feature) for feature in features]
+    # Column-wise vote: a bit is set when most features set it
+    half = len(bits) / 2
+    value = 0
+    for column in zip(*bits):
+        value = (value << 1) | (column.count("1") > half)
+    return value
+
+
+def max_distance(similarity: float) -> int:
+    """Largest Hamming distance between hashes still treated as duplicates."""
+    return min(HASH_BITS - 1, max(0, int((1.0 - similarity) * HASH_BITS)))
+
+
+def _bands(distance: int) -> List[Tuple[int, int]]:
+    # Two hashes at most ``distance`` bits apart agree exactly on at least one of
+    # ``distance + 1`` disjoint bands, so only items sharing a band are compared
+    count = distance + 1
+    edges = [HASH_BITS * index // count for index in range(count + 1)]
+    return [(start, (1 << (end - start)) - 1) for start, end in zip(edges, edges[1:])]
+
+
+def collapse_near_duplicates(
+    items: Sequence[T],
+    text: Callable[[T], str],
+    similarity: float = 0.9,
+    key: Optional[Callable[[T], Hashable]] = None,
+) -> List[List[T]]:
+    """Group ``items`` whose texts are at least ``similarity`` alike (0-1).
+
+    Returns the groups in order of first appearance, each led by its first
+    item, which is kept as the representative. Items only join a group with
+    the same ``key`` (e.g. the sentiment label), so texts differing in the
+    one word that flips their stance stay apart. Texts shorter than
+    ``MIN_FEATURES`` need an exact match after normalization. Every item is
+    compared only with the representatives sharing one of its SimHash bands,
+    so the cost stays close to linear in the number of items.
+    """
+    distance = max_distance(similarity)
+    bands = _bands(distance)
+    buckets: Dict[Tuple[Hashable, int, int], List[int]] = {}
+    exact: Dict[Tuple[Hashable, str], int] = {}
+    hashes: List[int] = []
+    groups: List[List[T]] = []
+    for item in items:
+        group_key = key(item) if key is not None else None
+        words = _TOKEN.findall(text(item).lower())
+        features = _features(words)
+        if len(features) < MIN_FEATURES:
+            normalized = (group_key, " ".join(words))
+            if normalized in exact:
+                groups[exact[normalized]].append(item)
+                continue
+            exact[normalized] = len(groups)
+            hashes.append(0)
+            groups.append([item])
+            continue
+        value = _simhash(features)
+        keys = [(group_key, index, (value >> shift) & mask) for index, (shift, mask) in enumerate(bands)]
+        match = None
+        for band_key in keys:
+            for group_index in buckets.get(band_key, ()):
+                if (hashes[group_index] ^ value).bit_count() <= distance:
+                    match = group_index
+                    break
+            if match is not None:
+                break
+        if match is not None:
+            groups[match].append(item)
+            continue
+        for band_key in keys:
+            buckets.setdefault(band_key, []).append(len(groups))
+        hashes.append(value)
+        groups.append([item])
+    return groups
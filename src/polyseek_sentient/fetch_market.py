@@ -2,16 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import json
-from dataclasses import dataclass
+import math
+from array import array
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import Optional
+from functools import partial
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import httpx
 
 from .config import Settings, load_settings
+from .market_cache import get_market_cache, get_slug_memo
+
+if TYPE_CHECKING:
+    from .http_clients import HTTPClientRegistry
+    from .market_cache import MarketMetadataCache, SlugKindMemo
 
 
 class MarketSource(str, Enum):
@@ -37,6 +46,94 @@ class MarketData:
     source: MarketSource
     url: str
     prices: MarketPrices
+    # Every nested market of the gamma event this market belongs to, if any
+    event: Optional[EventData] = None
+    # Gamma event id, also for single-market events; comments hang off it
+    event_id: Optional[str] = None
+
+
+@dataclass
+class EventData:
+    """All nested markets of a gamma event as a compact outcome table.
+
+    Per-market columns (``market_ids`` .. ``yes_prices``) are indexed by
+    market position. Per-outcome columns hold one row per (market, outcome)
+    pair, with ``outcome_market`` pointing at the row's market. Missing
+    prices are NaN.
+    """
+
+    event_id: str
+    slug: str
+    title: str
+    url: str
+    mutually_exclusive: bool
+    market_ids: List[str]
+    labels: List[str]
+    active: array
+    volumes_24h: array
+    yes_prices: array
+    outcome_market: array
+    outcome_labels: List[str]
+    outcome_prices: array
+
+    def __len__(self) -> int:
+        return len(self.market_ids)
+
+    def implied_probabilities(self) -> array:
+        """YES prices rescaled to sum to 1 across markets (the vig removed)."""
+        total = math.fsum(price for price in self.yes_prices if not math.isnan(price))
+        if total <= 0:
+            return array("d", [math.nan] * len(self.yes_prices))
+        return array("d", [price / total for price in self.yes_prices])
+
+    def overround(self) -> Optional[float]:
+        """How far the YES prices across markets sum above (or below) 1."""
+        priced = [price for price in self.yes_prices if not math.isnan(price)]
+        return math.fsum(priced) - 1 if priced else None
+
+    def market_overrounds(self) -> array:
+        """Per market, the sum of its outcome prices minus 1."""
+        totals = array("d", [0.0] * len(self.market_ids))
+        for market, price in zip(self.outcome_market, self.outcome_prices):
+            totals[market] += price
+        return array("d", [total - 1 for total in totals])
+
+    def market_outcomes(self, index: int) -> List[Tuple[str, float]]:
+        return [
+            (label, price)
+            for market, label, price in zip(self.outcome_market, self.outcome_labels, self.outcome_prices)
+            if market == index
+        ]
+
+    def top_markets(self, limit: int = 5) -> List[Tuple[str, float]]:
+        """The ``limit`` markets with the highest YES price, as ``(label, price)``."""
+        priced = [(label, price) for label, price in zip(self.labels, self.yes_prices) if not math.isnan(price)]
+        return sorted(priced, key=lambda item: item[1], reverse=True)[:limit]
+
+    def to_dict(self) -> Dict:
+        def _clean(values):
+            return [None if math.isnan(value) else value for value in values]
+
+        return {
+            "event_id": self.event_id,
+            "slug": self.slug,
+            "title": self.title,
+            "url": self.url,
+            "mutually_exclusive": self.mutually_exclusive,
+            "markets": [
+                {
+                    "market_id": market_id,
+                    "label": label,
+                    "active": bool(active),
+                    "volume_24h": volume,
+                    "yes_price": yes,
+                }
+                for market_id, label, active, volume, yes in zip(
+                    self.market_ids, self.labels, self.active, _clean(self.volumes_24h), _clean(self.yes_prices)
+                )
+            ],
+            "overround": self.overround(),
+        }
 
 
 class MarketFetchError(RuntimeError):
@@ -53,100 +150,274 @@ def detect_market_source(url: str) -> MarketSource:
     raise MarketFetchError(f"Unsupported market host: {host}")
 
 
+def canonical_market_key(url: str) -> str:
+    """Return a stable ``source:id`` key for a market URL.
+
+    Query strings, fragments, trailing slashes and letter case are ignored so
+    equivalent URLs map to the same key.
+    """
+    source = detect_market_source(url)
+    if source == MarketSource.POLYMARKET:
+        return f"{source.value}:{_extract_polymarket_slug(url).lower()}"
+    return f"{source.value}:{_extract_kalshi_ticker(url)}"
+
+
+@dataclass
+class MarketFetchResult:
+    """Parsed market plus what is needed to revalidate it upstream."""
+
+    market: MarketData
+    endpoint: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
 async def fetch_market_data(
     url: str,
     settings: Optional[Settings] = None,
     client: Optional[httpx.AsyncClient] = None,
 ) -> MarketData:
-    """Fetch metadata for a market URL."""
+    """Fetch metadata for a market URL.
+
+    Results are cached per market and revalidated with conditional requests;
+    see ``market_cache.MarketMetadataCache``.
+    """
     settings = settings or load_settings()
     source = detect_market_source(url)
-    if source == MarketSource.POLYMARKET:
-        return await _fetch_polymarket_data(url, settings, client)
-    return await _fetch_kalshi_data(url, settings, client)
+    if settings.app.offline_mode:
+        return _offline_market(url, source)
+    fetch = _fetch_polymarket_data if source == MarketSource.POLYMARKET else _fetch_kalshi_data
+    cache = get_market_cache(settings)
+    if cache is None:
+        return (await fetch(url, settings, client)).market
+    return await cache.get(
+        canonical_market_key(url),
+        url,
+        lambda previous: fetch(url, settings, client, previous),
+    )
+
+
+async def fetch_markets_bulk(
+    urls: Iterable[str],
+    settings: Optional[Settings] = None,
+    clients: Optional[HTTPClientRegistry] = None,
+    cache: Optional[MarketMetadataCache] = None,
+    memo: Optional[SlugKindMemo] = None,
+) -> Dict[str, Union[MarketData, MarketFetchError]]:
+    """Fetch metadata for many market URLs with a handful of batched requests.
+
+    Polymarket slugs are resolved through multi-slug gamma queries and Kalshi
+    tickers through the multi-ticker markets listing. Returns a result per
+    URL; a URL that cannot be resolved maps to its ``MarketFetchError``
+    instead of failing the batch. Fresh market-cache entries are reused and
+    fetched markets are added to the cache. ``cache`` and ``memo`` default
+    to the process-wide instances for ``settings``.
+    """
+    settings = settings or load_settings()
+    results: Dict[str, Union[MarketData, MarketFetchError]] = {}
+    urls_by_key: Dict[str, List[str]] = {}
+    for url in dict.fromkeys(urls):
+        try:
+            key = canonical_market_key(url)
+        except MarketFetchError as exc:
+            results[url] = exc
+            continue
+        if settings.app.offline_mode:
+            results[url] = _offline_market(url, detect_market_source(url))
+        else:
+            urls_by_key.setdefault(key, []).append(url)
+
+    if cache is None:
+        cache = get_market_cache(settings)
+    if memo is None:
+        memo = get_slug_memo(settings)
+    pending: Dict[MarketSource, Dict[str, str]] = {source: {} for source in MarketSource}
+    for key, key_urls in urls_by_key.items():
+        cached = cache.peek(key) if cache is not None else None
+        if cached is not None:
+            results.update({url: replace(cached.market, url=url) for url in key_urls})
+        else:
+            pending[detect_market_source(key_urls[0])][key] = key_urls[0]
+
+    fetched = await asyncio.gather(
+        _bulk_fetch(partial(_bulk_polymarket, memo=memo), MarketSource.POLYMARKET, pending, settings, clients),
+        _bulk_fetch(_bulk_kalshi, MarketSource.KALSHI, pending, settings, clients),
+    )
+    for outcomes in fetched:
+        for key, outcome in outcomes.items():
+            if isinstance(outcome, MarketFetchResult):
+                if cache is not None:
+                    cache.store(key, outcome)
+                outcome = outcome.market
+            for url in urls_by_key[key]:
+                results[url] = replace(outcome, url=url) if isinstance(outcome, MarketData) else outcome
+    return results
+
+
+# Slugs or tickers per batched upstream request
+BULK_CHUNK_SIZE = 50
+
+BulkOutcomes = Dict[str, Union[MarketFetchResult, MarketFetchError]]
+
+
+async def _bulk_fetch(
+    fetch: Callable[[httpx.AsyncClient, Dict[str, str], Settings], Awaitable[BulkOutcomes]],
+    source: MarketSource,
+    pending: Dict[MarketSource, Dict[str, str]],
+    settings: Settings,
+    clients: Optional[HTTPClientRegistry],
+) -> BulkOutcomes:
+    if not pending[source]:
+        return {}
+    client = clients.get(source.value) if clients else None
+    close_client = client is None
+    client = client or httpx.AsyncClient(timeout=10)
+    try:
+        return await fetch(client, pending[source], settings)
+    finally:
+        if close_client:
+            await client.aclose()
+
+
+async def _bulk_polymarket(
+    client: httpx.AsyncClient,
+    pending: Dict[str, str],
+    settings: Settings,
+    memo: SlugKindMemo,
+) -> BulkOutcomes:
+    """Resolve ``{key: url}`` through multi-slug ``/events`` and ``/markets`` queries.
+
+    Slugs the memo knows as markets query ``/markets`` first, all others
+    ``/events``; whatever a first pass leaves unresolved tries the other
+    endpoint.
+    """
+    keys = {_extract_polymarket_slug(url).lower(): key for key, url in pending.items()}
+    outcomes: BulkOutcomes = {}
+
+    async def _resolve(kind: str, slugs: List[str]) -> List[str]:
+        """Query ``kind`` for ``slugs``; return the slugs it did not resolve."""
+        chunks = [slugs[i:i + BULK_CHUNK_SIZE] for i in range(0, len(slugs), BULK_CHUNK_SIZE)]
+        responses = await asyncio.gather(
+            *(
+                client.get(
+                    f"{settings.apis.polymarket_base}/{kind}",
+                    params=[("slug", slug) for slug in chunk] + [("limit", len(chunk))],
+                )
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        unresolved = []
+        for chunk, resp in zip(chunks, responses):
+            try:
+                if isinstance(resp, BaseException):
+                    raise resp
+                resp.raise_for_status()
+                items = resp.json()
+            except (httpx.HTTPError, ValueError) as exc:
+                error = MarketFetchError(f"Failed to fetch Polymarket data: {exc}")
+                outcomes.update({keys[slug]: error for slug in chunk})
+                continue
+            by_slug = {
+                str(item.get("slug", "")).lower(): item
+                for item in (items if isinstance(items, list) else [])
+                if isinstance(item, dict)
+            }
+            for slug in chunk:
+                url = pending[keys[slug]]
+                item = by_slug.get(slug)
+                market = _parse_polymarket(kind, [item], slug, url) if item is not None else None
+                if market is None:
+                    unresolved.append(slug)
+                    continue
+                memo.set(slug, kind)
+                outcomes[keys[slug]] = MarketFetchResult(
+                    market=market, endpoint=f"{settings.apis.polymarket_base}/{kind}?slug={slug}"
+                )
+        return unresolved
+
+    as_markets = [slug for slug in keys if memo.get(slug) == "markets"]
+    as_events = [slug for slug in keys if memo.get(slug) != "markets"]
+    retry_markets, retry_events = await asyncio.gather(_resolve("events", as_events), _resolve("markets", as_markets))
+    missing = await asyncio.gather(_resolve("markets", retry_markets), _resolve("events", retry_events))
+    for slug in (slug for slugs in missing for slug in slugs):
+        outcomes[keys[slug]] = MarketFetchError(f"No market found for slug '{slug}'")
+    return outcomes
+
+
+async def _bulk_kalshi(
+    client: httpx.AsyncClient,
+    pending: Dict[str, str],
+    settings: Settings,
+) -> BulkOutcomes:
+    """Resolve ``{key: url}`` through the multi-ticker Kalshi markets listing."""
+    keys = {_extract_kalshi_ticker(url): key for key, url in pending.items()}
+    tickers = list(keys)
+    chunks = [tickers[i:i + BULK_CHUNK_SIZE] for i in range(0, len(tickers), BULK_CHUNK_SIZE)]
+    responses = await asyncio.gather(
+        *(
+            client.get(
+                f"{settings.apis.kalshi_base}/trade-api/v2/markets",
+                params={"tickers": ",".join(chunk), "limit": len(chunk)},
+                headers=_kalshi_headers(settings),
+            )
+            for chunk in chunks
+        ),
+        return_exceptions=True,
+    )
+    outcomes: BulkOutcomes = {}
+    for chunk, resp in zip(chunks, responses):
+        try:
+            if isinstance(resp, BaseException):
+                raise resp
+            resp.raise_for_status()
+            payload = resp.json()
+            if not isinstance(payload, dict):
+                raise ValueError(f"expected a JSON object, got {type(payload).__name__}")
+            listed = payload.get("markets") or []
+        except (httpx.HTTPError, ValueError) as exc:
+            error = MarketFetchError(f"Failed to fetch Kalshi data: {exc}")
+            outcomes.update({keys[ticker]: error for ticker in chunk})
+            continue
+        by_ticker = {
+            str(market.get("ticker", "")).upper(): market
+            for market in (listed if isinstance(listed, list) else [])
+            if isinstance(market, dict)
+        }
+        for ticker in chunk:
+            market = by_ticker.get(ticker)
+            if market is None:
+                outcomes[keys[ticker]] = MarketFetchError(f"No Kalshi market found for ticker '{ticker}'")
+                continue
+            outcomes[keys[ticker]] = MarketFetchResult(
+                market=_parse_kalshi_market({"market": market}, ticker, pending[keys[ticker]]),
+                endpoint=f"{settings.apis.kalshi_base}/trade-api/v2/markets/{ticker}",
+            )
+    return outcomes
 
 
 async def _fetch_polymarket_data(
     url: str,
     settings: Settings,
     client: Optional[httpx.AsyncClient] = None,
-) -> MarketData:
-    if settings.app.offline_mode:
-        return _offline_market(url, MarketSource.POLYMARKET)
+    previous: Optional[MarketFetchResult] = None,
+) -> MarketFetchResult:
     slug = _extract_polymarket_slug(url)
-    # Try /events endpoint first (for event-based markets)
-    endpoint = f"{settings.apis.polymarket_base}/events?slug={slug}"
     close_client = client is None
     client = client or httpx.AsyncClient(timeout=10)
     try:
-        resp = await client.get(endpoint)
-        resp.raise_for_status()
-        payload = resp.json()
-        
-        # Handle /events response (returns event with nested markets)
-        if isinstance(payload, list) and len(payload) > 0:
-            event = payload[0]
-            markets = event.get("markets", [])
-            if markets:
-                # Use the first active market or the first one
-                market = next((m for m in markets if m.get("active")), markets[0])
-                # Parse outcomes and prices
-                outcomes = json.loads(market.get("outcomes", "[]")) if isinstance(market.get("outcomes"), str) else market.get("outcomes", [])
-                outcome_prices = json.loads(market.get("outcomePrices", "[]")) if isinstance(market.get("outcomePrices"), str) else market.get("outcomePrices", [])
-                
-                yes_price = None
-                no_price = None
-                if outcomes and outcome_prices:
-                    for outcome, price in zip(outcomes, outcome_prices):
-                        if outcome.lower() == "yes":
-                            yes_price = float(price) if price else None
-                        elif outcome.lower() == "no":
-                            no_price = float(price) if price else None
-                
-                return MarketData(
-                    market_id=str(market.get("id") or event.get("id")),
-                    title=event.get("title") or market.get("question") or slug,
-                    category=event.get("category"),
-                    rules=event.get("description") or market.get("description") or market.get("resolutionSource"),
-                    deadline=_parse_datetime(event.get("endDate") or market.get("endDate")),
-                    liquidity=_to_float(event.get("liquidity") or market.get("liquidity")),
-                    volume_24h=_to_float(event.get("volume24hr") or market.get("volume24hr")),
-                    source=MarketSource.POLYMARKET,
-                    url=url,
-                    prices=MarketPrices(yes=yes_price, no=no_price),
-                )
-        
-        # Fallback to /markets endpoint
-        endpoint = f"{settings.apis.polymarket_base}/markets?slug={slug}"
-        resp = await client.get(endpoint)
-        resp.raise_for_status()
-        payload = resp.json()
-        
-        if isinstance(payload, list):
-            if not payload:
-                raise MarketFetchError(f"No market found for slug '{slug}'")
-            market = payload[0]
-        else:
-            markets = payload.get("markets") or []
-            if not markets:
-                raise MarketFetchError(f"No market found for slug '{slug}'")
-            market = markets[0]
-
-        return MarketData(
-            market_id=str(market.get("market_id") or market.get("id")),
-            title=market.get("question") or market.get("title") or slug,
-            category=market.get("category"),
-            rules=market.get("resolution_source") or market.get("resolution_criteria"),
-            deadline=_parse_datetime(market.get("end_date") or market.get("close_time")),
-            liquidity=_to_float(market.get("liquidity_in_usd") or market.get("liquidity")),
-            volume_24h=_to_float(market.get("volume24hr")),
-            source=MarketSource.POLYMARKET,
-            url=url,
-            prices=MarketPrices(
-                yes=_to_float(market.get("yesPrice") or market.get("price")),
-                no=_to_float(market.get("noPrice")),
-            ),
-        )
+        if previous is not None:
+            # Revalidate the endpoint that produced the cached market
+            resp = await client.get(previous.endpoint, headers=_conditional_headers(previous))
+            if resp.status_code == 304:
+                return _revalidated(previous, resp)
+            resp.raise_for_status()
+            kind = "events" if "/events?" in previous.endpoint else "markets"
+            market = _parse_polymarket(kind, resp.json(), slug, url)
+            if market is not None:
+                return _fetch_result(market, previous.endpoint, resp)
+
+        return await _lookup_polymarket(client, settings, slug, url)
     except httpx.HTTPError as exc:
         raise MarketFetchError(f"Failed to fetch Polymarket data: {exc}") from exc
     finally:
@@ -154,28 +425,138 @@ async def _fetch_polymarket_data(
             await client.aclose()
 
 
+# Gamma endpoints a slug can resolve through, in the order they are tried
+POLYMARKET_KINDS = ("events", "markets")
+
+
+async def _lookup_polymarket(
+    client: httpx.AsyncClient,
+    settings: Settings,
+    slug: str,
+    url: str,
+) -> MarketFetchResult:
+    """Resolve ``slug`` via ``/events`` or ``/markets``.
+
+    The slug memo sends known slugs straight to the endpoint that resolved
+    them last time. Unknown slugs try ``/events`` first and fall back to
+    ``/markets``, or query both at once when parallel lookup is enabled.
+    """
+    memo = get_slug_memo(settings)
+    known = memo.get(slug)
+
+    async def _request(kind: str) -> Tuple[Optional[MarketData], str, httpx.Response]:
+        endpoint = f"{settings.apis.polymarket_base}/{kind}?slug={slug}"
+        resp = await client.get(endpoint)
+        resp.raise_for_status()
+        return _parse_polymarket(kind, resp.json(), slug, url), endpoint, resp
+
+    if known is None and settings.apis.polymarket_parallel_lookup:
+        outcomes = await asyncio.gather(*(_request(kind) for kind in POLYMARKET_KINDS), return_exceptions=True)
+        for kind, outcome in zip(POLYMARKET_KINDS, outcomes):
+            if not isinstance(outcome, BaseException) and outcome[0] is not None:
+                memo.set(slug, kind)
+                market, endpoint, resp = outcome
+                return _fetch_result(market, endpoint, resp)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+    else:
+        kinds = sorted(POLYMARKET_KINDS, key=lambda kind: kind != known)
+        for kind in kinds:
+            market, endpoint, resp = await _request(kind)
+            if market is not None:
+                memo.set(slug, kind)
+                return _fetch_result(market, endpoint, resp)
+    raise MarketFetchError(f"No market found for slug '{slug}'")
+
+
+def _parse_polymarket(kind: str, payload, slug: str, url: str) -> Optional[MarketData]:
+    if kind == "events":
+        return _parse_polymarket_events(payload, slug, url)
+    try:
+        return _parse_polymarket_markets(payload, slug, url)
+    except MarketFetchError:
+        return None
+
+
+def _parse_polymarket_events(payload, slug: str, url: str) -> Optional[MarketData]:
+    """Parse a gamma ``/events`` response; ``None`` when it has no markets."""
+    # Handle /events response (returns event with nested markets)
+    if not isinstance(payload, list) or not payload:
+        return None
+    event = payload[0]
+    markets = event.get("markets", [])
+    if not markets:
+        return None
+    # Use the first active market or the first one
+    market = next((m for m in markets if m.get("active")), markets[0])
+    event_data = parse_polymarket_event(event, url) if len(markets) > 1 else None
+    return MarketData(
+        market_id=str(market.get("id") or event.get("id")),
+        title=event.get("title") or market.get("question") or slug,
+        category=event.get("category"),
+        rules=event.get("description") or market.get("description") or market.get("resolutionSource"),
+        deadline=_parse_datetime(event.get("endDate") or market.get("endDate")),
+        liquidity=_to_float(event.get("liquidity") or market.get("liquidity")),
+        volume_24h=_to_float(event.get("volume24hr") or market.get("volume24hr")),
+        source=MarketSource.POLYMARKET,
+        url=url,
+        prices=parse_outcome_prices(market),
+        event=event_data,
+        event_id=str(event["id"]) if event.get("id") is not None else None,
+    )
+
+
+def _parse_polymarket_markets(payload, slug: str, url: str) -> MarketData:
+    """Parse a gamma ``/markets`` response."""
+    if isinstance(payload, list):
+        if not payload:
+            raise MarketFetchError(f"No market found for slug '{slug}'")
+        market = payload[0]
+    else:
+        markets = payload.get("markets") or []
+        if not markets:
+            raise MarketFetchError(f"No market found for slug '{slug}'")
+        market = markets[0]
+    events = market.get("events") if isinstance(market.get("events"), list) else []
+    event_id = events[0].get("id") if events and isinstance(events[0], dict) else None
+
+    return MarketData(
+        market_id=str(market.get("market_id") or market.get("id")),
+        title=market.get("question") or market.get("title") or slug,
+        category=market.get("category"),
+        rules=market.get("resolution_source") or market.get("resolution_criteria"),
+        deadline=_parse_datetime(market.get("end_date") or market.get("close_time")),
+        liquidity=_to_float(market.get("liquidity_in_usd") or market.get("liquidity")),
+        volume_24h=_to_float(market.get("volume24hr")),
+        source=MarketSource.POLYMARKET,
+        url=url,
+        prices=MarketPrices(
+            yes=_to_float(market.get("yesPrice") or market.get("price")),
+            no=_to_float(market.get("noPrice")),
+        ),
+        event_id=str(event_id) if event_id is not None else None,
+    )
+
+
 async def _fetch_kalshi_data(
     url: str,
     settings: Settings,
     client: Optional[httpx.AsyncClient] = None,
-) -> MarketData:
-    if settings.app.offline_mode:
-        return _offline_market(url, MarketSource.KALSHI)
+    previous: Optional[MarketFetchResult] = None,
+) -> MarketFetchResult:
     ticker = _extract_kalshi_ticker(url)
     endpoint = f"{settings.apis.kalshi_base}/trade-api/v2/markets/{ticker}"
-    headers = {"accept": "application/json"}
-    if settings.apis.kalshi_api_key and settings.apis.kalshi_api_secret:
-        headers.update(
-            {
-                "kalshi-access-key": settings.apis.kalshi_api_key,
-                "kalshi-secret-key": settings.apis.kalshi_api_secret,
-            }
-        )
+    headers = _kalshi_headers(settings)
+    if previous is not None:
+        headers.update(_conditional_headers(previous))
 
     close_client = client is None
     client = client or httpx.AsyncClient(timeout=10)
     try:
         resp = await client.get(endpoint, headers=headers)
+        if resp.status_code == 304 and previous is not None:
+            return _revalidated(previous, resp)
         resp.raise_for_status()
     except httpx.HTTPError as exc:
         raise MarketFetchError(f"Failed to fetch Kalshi data: {exc}") from exc
@@ -183,7 +564,24 @@ async def _fetch_kalshi_data(
         if close_client:
             await client.aclose()
 
-    market = resp.json().get("market", {})
+    return _fetch_result(_parse_kalshi_market(resp.json(), ticker, url), endpoint, resp)
+
+
+def _kalshi_headers(settings: Settings) -> dict:
+    headers = {"accept": "application/json"}
+    if settings.apis.kalshi_api_key and settings.apis.kalshi_api_secret:
+        headers.update(
+            {
+                "kalshi-access-key": settings.apis.kalshi_api_key,
+                "kalshi-secret-key": settings.apis.kalshi_api_secret,
+            }
+        )
+    return headers
+
+
+def _parse_kalshi_market(payload, ticker: str, url: str) -> MarketData:
+    """Parse a Kalshi ``/markets/{ticker}`` response."""
+    market = payload.get("market", {})
     return MarketData(
         market_id=market.get("id") or ticker,
         title=market.get("title") or ticker,
@@ -201,6 +599,99 @@ async def _fetch_kalshi_data(
     )
 
 
+def _conditional_headers(previous: MarketFetchResult) -> dict:
+    headers = {}
+    if previous.etag:
+        headers["If-None-Match"] = previous.etag
+    if previous.last_modified:
+        headers["If-Modified-Since"] = previous.last_modified
+    return headers
+
+
+def _fetch_result(market: MarketData, endpoint: str, resp: httpx.Response) -> MarketFetchResult:
+    return MarketFetchResult(
+        market=market,
+        endpoint=endpoint,
+        etag=resp.headers.get("etag"),
+        last_modified=resp.headers.get("last-modified"),
+    )
+
+
+def _revalidated(previous: MarketFetchResult, resp: httpx.Response) -> MarketFetchResult:
+    """Return the cached result for a 304, picking up any updated validators."""
+    return MarketFetchResult(
+        market=previous.market,
+        endpoint=previous.endpoint,
+        etag=resp.headers.get("etag") or previous.etag,
+        last_modified=resp.headers.get("last-modified") or previous.last_modified,
+    )
+
+
+def parse_polymarket_event(event: dict, url: str) -> EventData:
+    """Build the outcome table for a gamma event in one pass over its markets."""
+    market_ids: List[str] = []
+    labels: List[str] = []
+    active = array("b")
+    volumes = array("d")
+    yes_prices = array("d")
+    outcome_market = array("I")
+    outcome_labels: List[str] = []
+    outcome_prices = array("d")
+    for index, market in enumerate(event.get("markets") or []):
+        market_ids.append(str(market.get("id")))
+        labels.append(market.get("groupItemTitle") or market.get("question") or str(market.get("id")))
+        active.append(1 if market.get("active") else 0)
+        volume = _to_float(market.get("volume24hr"))
+        volumes.append(math.nan if volume is None else volume)
+        yes = math.nan
+        for outcome, price in zip(*_outcome_lists(market)):
+            price = _to_float(price)
+            price = math.nan if price is None else price
+            outcome_market.append(index)
+            outcome_labels.append(str(outcome))
+            outcome_prices.append(price)
+            if str(outcome).lower() == "yes":
+                yes = price
+        yes_prices.append(yes)
+    return EventData(
+        event_id=str(event.get("id")),
+        slug=event.get("slug") or _extract_polymarket_slug(url),
+        title=event.get("title") or "",
+        url=url,
+        mutually_exclusive=bool(event.get("negRisk")),
+        market_ids=market_ids,
+        labels=labels,
+        active=active,
+        volumes_24h=volumes,
+        yes_prices=yes_prices,
+        outcome_market=outcome_market,
+        outcome_labels=outcome_labels,
+        outcome_prices=outcome_prices,
+    )
+
+
+def _outcome_lists(market: dict) -> Tuple[list, list]:
+    # Gamma returns outcomes and prices either as lists or as JSON-encoded strings
+    outcomes = json.loads(market.get("outcomes", "[]")) if isinstance(market.get("outcomes"), str) else market.get("outcomes", [])
+    outcome_prices = json.loads(market.get("outcomePrices", "[]")) if isinstance(market.get("outcomePrices"), str) else market.get("outcomePrices", [])
+    return outcomes or [], outcome_prices or []
+
+
+def parse_outcome_prices(market: dict) -> MarketPrices:
+    """Read YES/NO prices from a gamma market's ``outcomes``/``outcomePrices``."""
+    outcomes, outcome_prices = _outcome_lists(market)
+
+    yes_price = None
+    no_price = None
+    if outcomes and outcome_prices:
+        for outcome, price in zip(outcomes, outcome_prices):
+            if outcome.lower() == "yes":
+                yes_price = float(price) if price else None
+            elif outcome.lower() == "no":
+                no_price = float(price) if price else None
+    return MarketPrices(yes=yes_price, no=no_price)
+
+
 def _extract_polymarket_slug(url: str) -> str:
     path = urlparse(url).path.strip("/")
     if not path:
@@ -0,0 +1,181 @@
+"""Process-wide pool of keep-alive HTTP clients, one per upstream."""
+
+from __future__ import annotations
+
+import importlib.util
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+from .config import Settings, load_settings
+from .metrics import REGISTRY, UPSTREAM_ERRORS, UPSTREAM_LATENCY
+from .resilience import ResiliencePolicy, ResilientTransport
+
+
+@dataclass(frozen=True)
+class UpstreamConfig:
+    timeout: float
+    http2: bool = False
+    verify: bool = True
+    follow_redirects: bool = False
+    hedge: bool = False
+
+
+# Per-upstream client options. ``http2`` is only honoured for hosts known to
+# speak it; RSS and scrape targets vary too much to assume support. Hedging
+# sends a second copy to a slow host, so only the gamma API and page scrapes
+# opt in; the other upstreams are rate limited or metered per request.
+UPSTREAMS: Dict[str, UpstreamConfig] = {
+    "polymarket": UpstreamConfig(timeout=10, http2=True, hedge=True),
+    "kalshi": UpstreamConfig(timeout=10, http2=True),
+    "scrape": UpstreamConfig(timeout=8.0, hedge=True),
+    "twitter": UpstreamConfig(timeout=10, http2=True),
+    "newsapi": UpstreamConfig(timeout=10),
+    # SSL verification disabled for compatibility with misconfigured feeds.
+    "rss": UpstreamConfig(timeout=15, verify=False, follow_redirects=True),
+}
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class _MeteredTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that counts requests passing through a pool."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport):
+        self._transport = transport
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.requests += 1
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            self.errors += 1
+            UPSTREAM_ERRORS.inc(host=host)
+            raise
+        finally:
+            self.in_flight -= 1
+            UPSTREAM_LATENCY.observe(time.perf_counter() - started, host=host)
+        if response.status_code >= 500:
+            UPSTREAM_ERRORS.inc(host=host)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def stats(self) -> Dict[str, int]:
+        stats = {"requests": self.requests, "errors": self.errors, "in_flight": self.in_flight}
+        # httpx keeps its connection pool private; report none if that changes
+        pool = getattr(self._transport, "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is None:
+            return stats
+        idle = sum(1 for conn in connections if conn.is_idle())
+        stats.update(
+            connections=len(connections),
+            idle_connections=idle,
+            active_connections=len(connections) - idle,
+        )
+        return stats
+
+
+class HTTPClientRegistry:
+    """Hands out shared keep-alive clients per upstream.
+
+    Each client retries idempotent requests, hedges slow GETs and fails fast
+    for hosts whose circuit is open; see ``resilience.ResilientTransport``.
+
+    Use as an async context manager; while open it is the registry returned by
+    ``current_http_clients()`` so fetchers and providers can reuse its pools.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or load_settings()
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._transports: Dict[str, _MeteredTransport] = {}
+
+    def get(self, upstream: str) -> httpx.AsyncClient:
+        """Return the shared client for ``upstream``, creating it on first use."""
+        client = self._clients.get(upstream)
+        if client is None:
+            client = self._create_client(upstream)
+            self._clients[upstream] = client
+        return client
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return request and connection-pool usage for each open client."""
+        return {name: transport.stats() for name, transport in self._transports.items()}
+
+    async def aclose(self) -> None:
+        clients, self._clients = self._clients, {}
+        self._transports = {}
+        for client in clients.values():
+            await client.aclose()
+
+    async def __aenter__(self) -> "HTTPClientRegistry":
+        global _active_registry
+        _active_registry = self
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        global _active_registry
+        if _active_registry is self:
+            _active_registry = None
+        await self.aclose()
+
+    def _create_client(self, upstream: str) -> httpx.AsyncClient:
+        config = UPSTREAMS.get(upstream, UpstreamConfig(timeout=10))
+        http_settings = self.settings.http
+        timeout = self.settings.scrape.timeout_seconds if upstream == "scrape" else config.timeout
+        transport = _MeteredTransport(
+            httpx.AsyncHTTPTransport(
+                verify=config.verify,
+                http2=config.http2 and http_settings.http2 and _h2_available(),
+                limits=httpx.Limits(
+                    max_connections=http_settings.max_connections,
+                    max_keepalive_connections=http_settings.max_keepalive_connections,
+                    keepalive_expiry=http_settings.keepalive_expiry,
+                ),
+            )
+        )
+        self._transports[upstream] = transport
+        return httpx.AsyncClient(
+            transport=ResilientTransport(transport, ResiliencePolicy.from_settings(http_settings, hedge=config.hedge)),
+            timeout=timeout,
+            follow_redirects=config.follow_redirects,
+        )
+
+
+_active_registry: Optional[HTTPClientRegistry] = None
+
+
+def current_http_clients() -> Optional[HTTPClientRegistry]:
+    """Return the registry opened by the server lifespan or CLI run, if any."""
+    return _active_registry
+
+
+def _collect_pool_metrics():
+    clients = current_http_clients()
+    for upstream, stats in (clients.stats() if clients else {}).items():
+        if "connections" not in stats:
+            continue
+        for state in ("active", "idle"):
+            yield (
+                "polyseek_http_pool_connections",
+                {"upstream": upstream, "state": state},
+                stats[f"{state}_connections"],
+            )
+
+
+REGISTRY.add_collector(
+    "polyseek_http_pool_connections", "gauge", "Pooled upstream connections.", _collect_pool_metrics
+)
@@ -0,0 +1,299 @@
+"""Background analysis jobs persisted in a local SQLite table."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import ulid
+
+from .config import JobSettings
+from .metrics import QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# Records a partial result for a job, e.g. ("market", {...})
+ProgressHook = Callable[[str, Dict], Awaitable[None]]
+JobHandler = Callable[["Job", ProgressHook], Awaitable[Dict]]
+
+
+@dataclass
+class Job:
+    id: str
+    status: str
+    request: Dict
+    stages: Dict[str, Dict] = field(default_factory=dict)
+    result: Optional[Dict] = None
+    error: Optional[str] = None
+    created_at: float = 0.0
+    updated_at: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "request": self.request,
+            "stages": self.stages,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class JobStore:
+    """SQLite-backed job table; rows outlive the process that created them.
+
+    Several processes may share one store. A job is run by whoever claims
+    it, and a running job carries its owner and a lease the owner keeps
+    renewing; only jobs whose lease has lapsed are taken over. Methods block
+    on SQLite; async callers go through ``JobWorkerPool``, which runs them in
+    a thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        retention_seconds: float = 86400,
+        lease_seconds: float = 60,
+        owner: Optional[str] = None,
+    ):
+        self.retention_seconds = retention_seconds
+        self.lease_seconds = lease_seconds
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{ulid.ULID()}"
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, status TEXT NOT NULL, request TEXT NOT NULL, "
+            "stages TEXT NOT NULL, result TEXT, error TEXT, "
+            "created_at REAL NOT NULL, updated_at REAL NOT NULL, owner TEXT, lease_until REAL)"
+        )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        for column, kind in (("owner", "TEXT"), ("lease_until", "REAL")):
+            if column not in columns:
+                self._db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        self._db.commit()
+
+    def create(self, request: Dict) -> Job:
+        with self._lock:
+            now = time.time()
+            job = Job(id=str(ulid.ULID()), status=QUEUED, request=request, created_at=now, updated_at=now)
+            self._db.execute(
+                "INSERT INTO jobs (id, status, request, stages, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job.id, job.status, json.dumps(request), "{}", now, now),
+            )
+            self._db.commit()
+            return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, status, request, stages, result, error, created_at, updated_at FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            return Job(
+                id=row[0],
+                status=row[1],
+                request=json.loads(row[2]),
+                stages=json.loads(row[3]),
+                result=json.loads(row[4]) if row[4] else None,
+                error=row[5],
+                created_at=row[6],
+                updated_at=row[7],
+            )
+
+    def set_status(self, job_id: str, status: str, result: Optional[Dict] = None, error: Optional[str] = None) -> bool:
+        """Finish a job this owner is running; false if its lease was lost to another owner."""
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ?, lease_until = NULL "
+                "WHERE id = ? AND status = ? AND owner = ?",
+                (
+                    status,
+                    json.dumps(result, default=str) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                    RUNNING,
+                    self.owner,
+                ),
+            )
+            self._db.commit()
+            return cursor.rowcount == 1
+
+    def record_stage(self, job_id: str, stage: str, data: Dict) -> None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT stages FROM jobs WHERE id = ? AND status = ? AND owner = ?", (job_id, RUNNING, self.owner)
+            ).fetchone()
+            if row is None:
+                return
+            stages = json.loads(row[0])
+            stages[stage] = data
+            self._db.execute(
+                "UPDATE jobs SET stages = ?, updated_at = ? WHERE id = ?",
+                (json.dumps(stages, default=str), time.time(), job_id),
+            )
+            self._db.commit()
+
+    def claim(self, job_id: str) -> bool:
+        """Take ``job_id`` for this owner if it is queued or its lease has lapsed."""
+        with self._lock:
+            now = time.time()
+            cursor = self._db.execute(
+                "UPDATE jobs SET status = ?, owner = ?, lease_until = ?, updated_at = ? "
+                "WHERE id = ? AND (status = ? OR (status = ? AND COALESCE(lease_until, 0) < ?))",
+                (RUNNING, self.owner, now + self.lease_seconds, now, job_id, QUEUED, RUNNING, now),
+            )
+            self._db.commit()
+            return cursor.rowcount == 1
+
+    def renew(self, job_id: str) -> bool:
+        """Extend this owner's lease on ``job_id``; false once it is no longer ours."""
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND owner = ? AND status = ?",
+                (time.time() + self.lease_seconds, job_id, self.owner, RUNNING),
+            )
+            self._db.commit()
+            return cursor.rowcount == 1
+
+    def release(self, job_id: str) -> None:
+        """Put a job this owner was running back in the queue."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, owner = NULL, lease_until = NULL WHERE id = ? AND owner = ? AND status = ?",
+                (QUEUED, job_id, self.owner, RUNNING),
+            )
+            self._db.commit()
+
+    def unfinished(self) -> List[str]:
+        """Return ids of queued jobs and running jobs whose lease lapsed, oldest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id FROM jobs WHERE status = ? OR (status = ? AND COALESCE(lease_until, 0) < ?) "
+                "ORDER BY created_at",
+                (QUEUED, RUNNING, time.time()),
+            ).fetchall()
+            return [row[0] for row in rows]
+
+    def prune(self) -> int:
+        """Delete finished jobs older than the retention window."""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (SUCCEEDED, FAILED, time.time() - self.retention_seconds),
+            )
+            self._db.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class JobWorkerPool:
+    """Runs queued jobs on ``workers`` in-process tasks.
+
+    Queued jobs and jobs whose owner stopped renewing their lease are
+    picked up on ``start``; an interrupted job restarts from the beginning.
+    While a job runs its lease is renewed every third of the lease period.
+    Store calls run in a thread so SQLite never blocks the event loop.
+    """
+
+    def __init__(self, store: JobStore, handler: JobHandler, workers: int = 2):
+        self.store = store
+        self.handler = handler
+        self.workers = max(1, workers)
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+
+    @classmethod
+    def from_settings(cls, settings: JobSettings, handler: JobHandler) -> "JobWorkerPool":
+        store = JobStore(
+            settings.store_path,
+            retention_seconds=settings.retention_seconds,
+            lease_seconds=settings.lease_seconds,
+        )
+        return cls(store, handler, workers=settings.workers)
+
+    async def submit(self, request: Dict) -> Job:
+        job = await asyncio.to_thread(self.store.create, request)
+        self._enqueue(job.id)
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        return await asyncio.to_thread(self.store.get, job_id)
+
+    async def start(self) -> None:
+        await asyncio.to_thread(self.store.prune)
+        for job_id in await asyncio.to_thread(self.store.unfinished):
+            self._enqueue(job_id)
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        QUEUE_DEPTH.dec(self._queue.qsize(), queue="jobs")
+        await asyncio.to_thread(self.store.close)
+
+    def _enqueue(self, job_id: str) -> None:
+        self._queue.put_nowait(job_id)
+        QUEUE_DEPTH.inc(queue="jobs")
+
+    async def _work(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            QUEUE_DEPTH.dec(queue="jobs")
+            # Another process may have claimed it since it was queued here
+            if not await asyncio.to_thread(self.store.claim, job_id):
+                continue
+            job = await asyncio.to_thread(self.store.get, job_id)
+
+            async def progress(stage: str, data: Dict, job_id: str = job_id) -> None:
+                await asyncio.to_thread(self.store.record_stage, job_id, stage, data)
+
+            heartbeat = asyncio.create_task(self._renew(job_id))
+            try:
+                result = await self.handler(job, progress)
+            except asyncio.CancelledError:
+                # Shutting down: hand the job back so the next start resumes it
+                await asyncio.shield(asyncio.to_thread(self.store.release, job_id))
+                raise
+            except Exception as exc:
+                logger.error(f"Job {job_id} failed: {exc}")
+                finished = await asyncio.to_thread(self.store.set_status, job_id, FAILED, None, str(exc))
+            else:
+                finished = await asyncio.to_thread(self.store.set_status, job_id, SUCCEEDED, result)
+            finally:
+                heartbeat.cancel()
+            if not finished:
+                logger.warning(f"Job {job_id} was taken over after its lease lapsed; dropping this result")
+
+    async def _renew(self, job_id: str) -> None:
+        while True:
+            await asyncio.sleep(self.store.lease_seconds / 3)
+            if not await asyncio.to_thread(self.store.renew, job_id):
+                logger.warning(f"Lost the lease on job {job_id}")
+                return
@@ -6,13 +6,15 @@ import argparse
 import asyncio
 import json
 import os
+import sqlite3
 import uuid
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import Optional, List
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from typing import TYPE_CHECKING
 import logging
@@ -96,12 +98,14 @@ class _CLIStream:
         print(f"[{self.name}] (end)")
 
 
-from .analysis_agent import AnalysisRequest, run_analysis
+from .admission import AdmissionController, AdmissionRejected
+from .batch import map_unordered
+from .coalesce import EventBroadcast, SingleFlight, StreamCoalescer
 from .config import Settings, load_settings
-from .fetch_market import MarketData, fetch_market_data
-from .report_formatter import format_response
-from .scrape_context import fetch_market_context
-from .signals_client import gather_signals
+from .jobs import Job, JobWorkerPool, ProgressHook
+from .metrics import QUEUE_DEPTH, REGISTRY, render_metrics
+from .pipeline import StageError, analysis_key, run_analysis_pipeline
+from .trending import TrendingCatalog
 
 
 @dataclass
@@ -120,49 +124,87 @@ class PolyseekSentientAgent(AbstractAgent):
 
     async def assist(self, session, query, response_handler):
         # Lazy import to prevent startup crashes
-        from .analysis_agent import AnalysisRequest, run_analysis
-        from .fetch_market import fetch_market_data
-        from .scrape_context import fetch_market_context
-        from .signals_client import gather_signals
+        from .pipeline import run_analysis_pipeline
 
         payload = _parse_prompt(query.prompt)
         await response_handler.emit_text_block("RECEIVED", f"Analyzing {payload.market_url}")
 
-        market = await fetch_market_data(payload.market_url, self.settings)
-        await response_handler.emit_json(
-            "MARKET_METADATA",
-            {
-                "title": market.title,
-                "deadline": str(market.deadline),
-                "prices": {"yes": market.prices.yes, "no": market.prices.no},
-            },
-        )
-
-        context = await fetch_market_context(payload.market_url, self.settings)
-        signals = await gather_signals(market, self.settings)
-        
-        if payload.depth == "deep":
-            await response_handler.emit_text_block("DEEP_MODE", "Starting deep analysis (Planner → Critic → Follow-up → Final)")
-
-        analysis_payload = await run_analysis(
-            AnalysisRequest(
-                market=market,
-                context=context,
-                signals=signals,
-                depth=payload.depth,
-                perspective=payload.perspective,
-            ),
-            self.settings,
+        async def on_start(stage: str):
+            if stage == "analysis" and payload.depth == "deep":
+                await response_handler.emit_text_block("DEEP_MODE", "Starting deep analysis (Planner → Critic → Follow-up → Final)")
+
+        async def on_complete(stage: str, result):
+            if stage == "market":
+                await response_handler.emit_json(
+                    "MARKET_METADATA",
+                    {
+                        "title": result.title,
+                        "deadline": str(result.deadline),
+                        "prices": {"yes": result.prices.yes, "no": result.prices.no},
+                    },
+                )
+            elif stage == "context":
+                await response_handler.emit_json("CONTEXT", _context_event(result))
+            elif stage == "signals":
+                await response_handler.emit_json("SIGNALS", _signals_event(result))
+
+        async def on_analysis_step(step: str, data: dict):
+            await response_handler.emit_json(f"DEEP_{step.upper()}", data)
+
+        result = await run_analysis_pipeline(
+            payload.market_url,
+            depth=payload.depth,
+            perspective=payload.perspective,
+            settings=self.settings,
+            on_start=on_start,
+            on_complete=on_complete,
+            on_analysis_step=on_analysis_step,
         )
+        logger.info("Stage timings for %s: %s", payload.market_url, result.timings)
+        if result.cached:
+            await response_handler.emit_text_block("CACHED", "Served from the analysis cache")
 
-        model, markdown = format_response(analysis_payload)
-        await response_handler.emit_json("ANALYSIS_JSON", model.model_dump())
+        await response_handler.emit_json("ANALYSIS_JSON", result.model.model_dump())
+        await response_handler.emit_json("STAGE_TIMINGS", result.timings)
         stream = response_handler.create_text_stream("ANALYSIS_MARKDOWN")
-        await stream.emit_chunk(markdown)
+        await stream.emit_chunk(result.markdown)
         await stream.complete()
         await response_handler.complete()
 
 
+def _context_event(context) -> dict:
+    return {
+        "resolution_rules": context.resolution_rules,
+        "comments": [
+            {
+                "comment_id": c.comment_id,
+                "author": c.author,
+                "body": c.body,
+                "sentiment": c.sentiment,
+                "sentiment_score": c.sentiment_score,
+            }
+            for c in context.comments
+        ],
+    }
+
+
+def _signals_event(signals) -> dict:
+    return {
+        "signals": [
+            {
+                "source": s.source,
+                "source_type": s.source_type,
+                "title": s.title,
+                "url": s.url,
+                "sentiment": s.sentiment,
+                "sentiment_score": s.sentiment_score,
+                "timestamp": s.timestamp.isoformat() if s.timestamp else None,
+            }
+            for s in signals
+        ],
+    }
+
+
 def _parse_prompt(prompt: str) -> AgentInput:
     try:
         data = json.loads(prompt)
@@ -188,13 +230,16 @@ async def _run_cli(url: str, depth: str, perspective: str):
         id = "cli-session"
 
     query = _SimpleQuery(prompt=payload)
-    await agent.assist(_SimpleSession(), query, handler)
+    from .http_clients import HTTPClientRegistry
+
+    async with HTTPClientRegistry(agent.settings):
+        await agent.assist(_SimpleSession(), query, handler)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Polyseek Sentient agent demo CLI")
     parser.add_argument("market_url")
-    parser.add_argument("--depth", default="quick", choices=("quick", "deep"))
+    parser.add_argument("--depth", default="quick", choices=("quick", "deep", "event"))
     parser.add_argument("--perspective", default="neutral", choices=("neutral", "devils_advocate"))
     args = parser.parse_args()
     asyncio.run(_run_cli(args.market_url, args.depth, args.perspective))
@@ -204,7 +249,101 @@ def main():
 # FastAPI Application
 # ==========================================
 
-app = FastAPI(title="Polyseek Sentient API")
+async def _run_job(job: Job, progress: ProgressHook) -> dict:
+    """Run a queued analysis job, recording each stage's output as it lands."""
+    settings = load_settings()
+    request = AnalyzeRequest(**job.request)
+
+    async def on_complete(stage: str, result):
+        if stage == "market":
+            await progress("market", {
+                "title": result.title,
+                "deadline": str(result.deadline),
+                "prices": {"yes": result.prices.yes, "no": result.prices.no},
+            })
+        elif stage == "context":
+            await progress("context", _context_event(result))
+        elif stage == "signals":
+            await progress("signals", _signals_event(result))
+
+    result = await run_analysis_pipeline(
+        request.market_url,
+        depth=request.depth,
+        perspective=request.perspective,
+        settings=settings,
+        on_complete=on_complete,
+        on_analysis_step=progress,
+    )
+    return {
+        "markdown": result.markdown,
+        "json": result.model.model_dump(),
+        "timings": result.timings,
+        "cached": result.cached,
+    }
+
+
+_job_pool: Optional[JobWorkerPool] = None
+
+
+def _preload_modules() -> None:
+    """Import the lazily loaded pipeline dependencies up front.
+
+    Long-running servers pay this once at startup instead of on the first
+    request; serverless deployments leave it off to keep cold starts short.
+    """
+    import importlib
+
+    for module in ("fetch_market", "scrape_context", "signals_client", "report_formatter", "result_cache"):
+        importlib.import_module(f".{module}", __package__)
+    try:
+        import litellm  # noqa: F401
+    except ImportError:
+        pass
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _job_pool
+    from .http_clients import HTTPClientRegistry
+    from .parse_pool import get_parser_pools
+
+    settings = load_settings()
+    if not settings.scrape.identity_key:
+        logger.warning(
+            "COMMENT_ID_KEY is not set; comment ids and author aliases can be recomputed from public comments"
+        )
+    if settings.app.preload_modules:
+        _preload_modules()
+    parser_pools = get_parser_pools(settings)
+    parser_pools.start()
+    # Keep-alive clients shared by every request for the lifetime of the server
+    async with HTTPClientRegistry(settings):
+        _job_pool = await _start_job_pool(settings)
+        _trending.start()
+        try:
+            yield
+        finally:
+            await _trending.stop()
+            if _job_pool is not None:
+                await _job_pool.stop()
+                _job_pool = None
+            parser_pools.shutdown()
+
+
+async def _start_job_pool(settings: Settings) -> Optional[JobWorkerPool]:
+    """Start the job workers, or return None (disabling /api/jobs) when the store is unusable."""
+    if not settings.jobs.enabled:
+        return None
+    try:
+        pool = await asyncio.to_thread(JobWorkerPool.from_settings, settings.jobs, _run_job)
+        await pool.start()
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Job store {settings.jobs.store_path!r} is unavailable, /api/jobs is disabled: {e}")
+        return None
+    return pool
+
+
+app = FastAPI(title="Polyseek Sentient API", lifespan=lifespan)
 
 import os
 
@@ -219,43 +358,165 @@ app.add_middleware(
 )
 
 
+# In-flight registries for coalescing identical concurrent analyses
+_analysis_flights = SingleFlight()
+_assist_flights = StreamCoalescer()
+
+# Server-wide cap on running pipelines; only the request that starts a flight
+# takes a slot, coalesced followers ride along for free.
+_admission = AdmissionController.from_settings(load_settings().admission)
+
+# Trending markets, refreshed by the lifespan task; requests read the snapshot
+_trending = TrendingCatalog(load_settings())
+
+
+def _collect_trending_age():
+    age = _trending.age_seconds()
+    if age is not None:
+        yield "polyseek_trending_snapshot_age_seconds", {}, age
+
+
+REGISTRY.add_collector(
+    "polyseek_trending_snapshot_age_seconds",
+    "gauge",
+    "Seconds since the trending catalog was last refreshed.",
+    _collect_trending_age,
+)
+
+REGISTRY.add_collector(
+    "polyseek_coalesced_flights",
+    "gauge",
+    "Distinct analyses currently shared by concurrent requests.",
+    lambda: [
+        ("polyseek_coalesced_flights", {"kind": "analyze"}, _analysis_flights.in_flight()),
+        ("polyseek_coalesced_flights", {"kind": "stream"}, _assist_flights.in_flight()),
+    ],
+)
+
+
+# Error detail prefix for each pipeline stage, kept compatible with the
+# messages the endpoint returned before the stages ran concurrently.
+STAGE_ERROR_MESSAGES = {
+    "market": "Failed to fetch market data",
+    "page": "Failed to fetch market context",
+    "comments": "Failed to fetch market context",
+    "context": "Failed to fetch market context",
+    "signals": "Failed to gather signals",
+    "analysis": "Analysis failed",
+    "format": "Failed to format response",
+}
+
+
 class AnalyzeRequest(BaseModel):
     market_url: str
     depth: str = "quick"
     perspective: str = "neutral"
 
 
+class BatchAnalyzeRequest(BaseModel):
+    market_urls: List[str]
+    depth: str = "quick"
+    perspective: str = "neutral"
+    concurrency: Optional[int] = None
+
+
+async def _run_coalesced(market_url: str, depth: str, perspective: str, settings: Settings):
+    """Run the pipeline, sharing the run with identical in-flight requests."""
+    async def run():
+        async with _admission.admit():
+            return await run_analysis_pipeline(
+                market_url,
+                depth=depth,
+                perspective=perspective,
+                settings=settings,
+            )
+
+    return await _analysis_flights.do(analysis_key(market_url, depth, perspective), run)
+
+
+async def _prefetch_markets(market_urls: List[str], settings: Settings) -> None:
+    """Warm the market cache with a few bulk requests instead of one per market."""
+    from .fetch_market import fetch_markets_bulk
+    from .http_clients import current_http_clients
+    from .market_cache import get_market_cache
+
+    if get_market_cache(settings) is None or settings.app.offline_mode:
+        return
+    try:
+        await fetch_markets_bulk(market_urls, settings, current_http_clients())
+    except Exception as e:
+        # Each market is fetched on its own later; the prefetch only saves requests
+        logger.warning(f"Bulk market prefetch failed: {e}")
+
+
+def _stage_error_detail(error: StageError) -> str:
+    return f"{STAGE_ERROR_MESSAGES.get(error.stage, 'Pipeline failed')}: {str(error.error)}"
+
+
+def _rejection_response(error: AdmissionRejected) -> HTTPException:
+    return HTTPException(
+        status_code=error.status_code,
+        detail=error.reason,
+        headers={"Retry-After": str(int(error.retry_after))},
+    )
+
+
 @app.get("/api/health")
 async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/api/http-pools")
+async def http_pool_stats():
+    """Return request counts and connection-pool usage per upstream."""
+    from .http_clients import current_http_clients
+
+    clients = current_http_clients()
+    return clients.stats() if clients else {}
+
+
+@app.get("/api/metrics")
+async def metrics_endpoint():
+    """Prometheus text exposition of stage, upstream, provider and LLM metrics."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/api/admission")
+async def admission_stats():
+    """Return running and queued analyses against the admission limits."""
+    return _admission.stats()
+
+
+@app.get("/api/cache")
+async def analysis_cache_stats():
+    """Return hit/miss counters for the analysis result cache."""
+    from .result_cache import get_analysis_cache
+
+    cache = get_analysis_cache(load_settings())
+    return cache.stats() if cache else {"enabled": False}
+
+
+@app.get("/api/cache/markets")
+async def market_cache_stats():
+    """Return hit ratio and staleness of the market metadata cache."""
+    from .market_cache import get_market_cache
+
+    cache = get_market_cache(load_settings())
+    return cache.stats() if cache else {"enabled": False}
+
+
 @app.get("/api/trending")
-async def get_trending():
-    """Return mock trending markets for the frontend."""
-    return [
-        {
-            "id": 1,
-            "title": "Will Bitcoin hit $100k in 2024?",
-            "price": "0.65",
-            "volume": "$12M",
-            "url": "https://polymarket.com/event/will-bitcoin-hit-100k-in-2024",
-        },
-        {
-            "id": 2,
-            "title": "Russia x Ukraine Ceasefire in 2025?",
-            "price": "0.15",
-            "volume": "$5M",
-            "url": "https://polymarket.com/event/russia-x-ukraine-ceasefire-in-2025",
-        },
-        {
-            "id": 3,
-            "title": "Will AI surpass human performance in coding by 2026?",
-            "price": "0.42",
-            "volume": "$1.8M",
-            "url": "https://polymarket.com/event/ai-coding-2026",
-        },
-    ]
+async def get_trending(request: Request):
+    """Return the top markets by 24h volume from the in-memory catalog."""
+    snapshot = _trending.snapshot
+    max_age = _trending.settings.trending.max_age_seconds
+    headers = {
+        "ETag": snapshot.etag,
+        "Cache-Control": f"public, max-age={max_age}, stale-while-revalidate={max_age}",
+    }
+    if request.headers.get("if-none-match") == snapshot.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
 
 
 @app.post("/api/analyze")
@@ -270,64 +531,20 @@ async def analyze_market(request: AnalyzeRequest):
                 detail="LLM API key not configured. Please set POLYSEEK_LLM_API_KEY, OPENROUTER_API_KEY, or OPENAI_API_KEY environment variable."
             )
         
-        # 1. Fetch Market Data
-        try:
-            market = await fetch_market_data(request.market_url, settings)
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to fetch market data: {str(e)}"
-            )
-        
-        # 2. Fetch Context
-        try:
-            context = await fetch_market_context(request.market_url, settings)
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to fetch market context: {str(e)}"
-            )
-        
-        # 3. Gather Signals
         try:
-            signals = await gather_signals(market, settings)
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to gather signals: {str(e)}"
-            )
-        
-        # 4. Run Analysis
-        try:
-            analysis_payload = await run_analysis(
-                AnalysisRequest(
-                    market=market,
-                    context=context,
-                    signals=signals,
-                    depth=request.depth,
-                    perspective=request.perspective,
-                ),
-                settings,
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Analysis failed: {str(e)}"
-            )
-        
-        # 5. Format Response
-        try:
-            model, markdown = format_response(analysis_payload)
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to format response: {str(e)}"
-            )
+            result = await _run_coalesced(request.market_url, request.depth, request.perspective, settings)
+        except StageError as e:
+            raise HTTPException(status_code=500, detail=_stage_error_detail(e))
+        except AdmissionRejected as e:
+            raise _rejection_response(e)
+        logger.info("Stage timings for %s: %s", request.market_url, result.timings)
         
         # Construct response matching frontend expectation
         return {
-            "markdown": markdown,
-            "json": model.model_dump()
+            "markdown": result.markdown,
+            "json": result.model.model_dump(),
+            "timings": result.timings,
+            "cached": result.cached,
         }
         
     except HTTPException:
@@ -352,6 +569,92 @@ async def analyze_market(request: AnalyzeRequest):
 
 
 
+@app.post("/api/jobs", status_code=202)
+async def submit_job(request: AnalyzeRequest):
+    """Queue an analysis and return its job id without waiting for the result."""
+    settings = load_settings()
+    if not settings.llm.api_key:
+        raise HTTPException(
+            status_code=500,
+            detail="LLM API key not configured. Please set POLYSEEK_LLM_API_KEY, OPENROUTER_API_KEY, or OPENAI_API_KEY environment variable."
+        )
+    if _job_pool is None:
+        raise HTTPException(status_code=503, detail="Job workers are not running")
+    job = await _job_pool.submit(request.model_dump())
+    return {"job_id": job.id, "status": job.status}
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Return a job's status, partial stage results and, once done, the analysis."""
+    job = await _job_pool.get(job_id) if _job_pool else None
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.to_dict()
+
+
+@app.post("/api/analyze/batch")
+async def analyze_batch(request: BatchAnalyzeRequest):
+    """Analyze many markets, streaming one NDJSON line per market as it finishes.
+
+    Markets run on a bounded worker pool and share the pooled clients, the
+    result cache and in-flight coalescing with /api/analyze.
+    """
+    settings = load_settings()
+    if not settings.llm.api_key:
+        raise HTTPException(
+            status_code=500,
+            detail="LLM API key not configured. Please set POLYSEEK_LLM_API_KEY, OPENROUTER_API_KEY, or OPENAI_API_KEY environment variable."
+        )
+    if not request.market_urls:
+        raise HTTPException(status_code=400, detail="market_urls must not be empty")
+    if len(request.market_urls) > settings.app.batch_max_markets:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.app.batch_max_markets} markets per batch"
+        )
+    concurrency = min(request.concurrency or settings.app.batch_concurrency, settings.app.batch_concurrency)
+
+    waiting = len(request.market_urls)
+
+    async def analyze_one(market_url: str):
+        nonlocal waiting
+        waiting -= 1
+        QUEUE_DEPTH.dec(queue="batch")
+        return await _run_coalesced(market_url, request.depth, request.perspective, settings)
+
+    async def line_generator():
+        QUEUE_DEPTH.inc(waiting, queue="batch")
+        try:
+            async for line in _batch_lines():
+                yield line
+        finally:
+            QUEUE_DEPTH.dec(waiting, queue="batch")
+
+    async def _batch_lines():
+        await _prefetch_markets(request.market_urls, settings)
+        async for index, market_url, result in map_unordered(request.market_urls, analyze_one, concurrency):
+            line = {"index": index, "market_url": market_url}
+            if isinstance(result, StageError):
+                line.update(status="error", error=_stage_error_detail(result))
+            elif isinstance(result, AdmissionRejected):
+                line.update(status="rejected", error=result.reason, retry_after=result.retry_after)
+            elif isinstance(result, Exception):
+                logger.error(f"Batch analysis of {market_url} failed: {result}")
+                line.update(status="error", error=f"Internal server error: {str(result)}")
+            else:
+                line.update(
+                    status="ok",
+                    markdown=result.markdown,
+                    json=result.model.model_dump(),
+                    timings=result.timings,
+                    cached=result.cached,
+                )
+            yield json.dumps(line) + "\n"
+
+    return StreamingResponse(line_generator(), media_type="application/x-ndjson")
+
+
 # SSE Response Handler
 # ==========================================
 
@@ -397,66 +700,51 @@ class AssistRequest(BaseModel):
     stream: bool = True
 
 
-@app.post("/assist")
-async def assist_endpoint(request: AssistRequest):
-    """
-    MCP-compatible assist endpoint that streams responses via SSE.
+async def _stream_agent(prompt: str) -> StreamingResponse:
+    """Run the agent for ``prompt`` and stream its events via SSE.
+
+    The admission slot is taken inside the producer, so only the request
+    that actually starts a flight pays for it, as in ``_run_coalesced``. A
+    full queue is still turned away with a real 429 before the response
+    starts; a queue timeout arrives as an error event on the stream.
     """
     settings = load_settings()
     agent = PolyseekSentientAgent(settings)
-    
-    # Create a queue to bridge the agent's callbacks to the SSE stream
-    queue = asyncio.Queue()
-    handler = SSEResponseHandler(queue)
-    
-    # Create session and query objects
-    class SimpleSession:
-        def __init__(self):
-            self.id = str(ulid.ULID())
+    payload = _parse_prompt(prompt)
+    key = analysis_key(payload.market_url, payload.depth, payload.perspective)
+    if not _assist_flights.has_flight(key):
+        try:
+            _admission.check()
+        except AdmissionRejected as e:
+            raise _rejection_response(e)
+    session, query = _assist_session(prompt)
+
+    async def produce(broadcast: EventBroadcast):
+        # The broadcast stands in for the queue bridging the agent's callbacks
+        # to the SSE stream, so every subscriber of this flight sees them.
+        handler = SSEResponseHandler(broadcast)
+        try:
+            async with _admission.admit():
+                await agent.assist(session, query, handler)
+        except AdmissionRejected as e:
+            error = {"error": e.reason, "status": e.status_code, "retry_after": e.retry_after}
+            await broadcast.put(f"event: error\ndata: {json.dumps(error)}\n\n")
+        except Exception as e:
+            logger.error(f"Agent task error: {e}")
+            await broadcast.put(f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n")
 
-    session = SimpleSession()
-    
-    # Query seems to be a Pydantic model requiring 'id'.
-    # We need to handle the case where Query might be the fallback class or the real one
-    # The fallback class in this file takes 'prompt' in __init__
-    # The real Query class likely takes 'prompt' and 'id'
-    
-    try:
-        # Try to instantiate with id first (for real framework)
-        query = Query(id=str(ulid.ULID()), prompt=request.prompt)
-    except TypeError:
-        # Fallback for dummy class or if signature differs
-        query = Query(prompt=request.prompt)
-        if hasattr(query, 'id'):
-            query.id = str(ulid.ULID())
-    
     async def event_generator():
-        # Start the agent in a background task
-        task = asyncio.create_task(agent.assist(session, query, handler))
-        
+        # Identical concurrent requests attach to the running analysis and
+        # receive its events from the start.
         try:
-            while True:
-                # Wait for the next event from the queue
-                data = await queue.get()
-                
-                if data is None:
-                    break
-                    
+            async for data in _assist_flights.subscribe(key, produce):
                 yield data
-                
         except asyncio.CancelledError:
             logger.info("Client disconnected")
-            task.cancel()
             raise
         except Exception as e:
             logger.error(f"Error in event generator: {e}")
             yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
-        finally:
-            # Ensure the agent task is finished
-            try:
-                await task
-            except Exception as e:
-                logger.error(f"Agent task error: {e}")
 
     return StreamingResponse(
         event_generator(),
@@ -465,10 +753,58 @@ async def assist_endpoint(request: AssistRequest):
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
             "X-Accel-Buffering": "no",
-        }
+        },
     )
 
 
+def _assist_session(prompt: str):
+    """Create the session and query objects ``agent.assist`` expects."""
+    class SimpleSession:
+        def __init__(self):
+            self.id = str(ulid.ULID())
+
+    session = SimpleSession()
+    
+    # Query seems to be a Pydantic model requiring 'id'.
+    # We need to handle the case where Query might be the fallback class or the real one
+    # The fallback class in this file takes 'prompt' in __init__
+    # The real Query class likely takes 'prompt' and 'id'
+    
+    try:
+        # Try to instantiate with id first (for real framework)
+        query = Query(id=str(ulid.ULID()), prompt=prompt)
+    except TypeError:
+        # Fallback for dummy class or if signature differs
+        query = Query(prompt=prompt)
+        if hasattr(query, 'id'):
+            query.id = str(ulid.ULID())
+    return session, query
+
+
+@app.post("/assist")
+async def assist_endpoint(request: AssistRequest):
+    """
+    MCP-compatible assist endpoint that streams responses via SSE.
+    """
+    return await _stream_agent(request.prompt)
+
+
+@app.post("/api/analyze/stream")
+async def analyze_market_stream(request: AnalyzeRequest):
+    """
+    Progressive variant of /api/analyze. Streams MARKET_METADATA, CONTEXT,
+    SIGNALS, deep-mode DEEP_PLAN / DEEP_CRITIQUE and finally ANALYSIS_JSON and
+    ANALYSIS_MARKDOWN as SSE events as soon as each is available.
+    """
+    settings = load_settings()
+    if not settings.llm.api_key:
+        raise HTTPException(
+            status_code=500,
+            detail="LLM API key not configured. Please set POLYSEEK_LLM_API_KEY, OPENROUTER_API_KEY, or OPENAI_API_KEY environment variable."
+        )
+    return await _stream_agent(json.dumps(request.model_dump()))
+
+
 @app.get("/assist")
 async def assist_check():
     """
@@ -0,0 +1,251 @@
+"""Stale-while-revalidate cache of parsed market metadata."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Set
+
+from .coalesce import SingleFlight
+from .config import CacheSettings, Settings
+from .metrics import MARKET_CACHE_SERVED_AGE, REGISTRY
+
+if TYPE_CHECKING:
+    from .fetch_market import MarketData, MarketFetchResult
+
+logger = logging.getLogger(__name__)
+
+# Fetches a market, revalidating ``previous`` with a conditional request if given
+MarketFetcher = Callable[[Optional["MarketFetchResult"]], Awaitable["MarketFetchResult"]]
+
+
+@dataclass
+class _Entry:
+    result: MarketFetchResult
+    fetched_at: float
+
+
+class MarketMetadataCache:
+    """Caches ``MarketData`` with the upstream validators that produced it.
+
+    Within ``fresh_seconds`` an entry is served as-is. For the following
+    ``stale_seconds`` it is still served, while a background conditional
+    request revalidates it. Older entries are revalidated before returning;
+    an unchanged market (304) reuses the parsed data.
+    """
+
+    def __init__(self, fresh_seconds: float, stale_seconds: float = 0.0, max_entries: int = 2048):
+        self.fresh_seconds = fresh_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._flights = SingleFlight()
+        self._background: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        # Bulk prefetch lookups; kept out of hit_ratio, which tracks ``get``
+        self.prefetch_hits = 0
+        self.prefetch_misses = 0
+        self.expired = 0
+        self.revalidations = 0
+        self.not_modified = 0
+        self.errors = 0
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings) -> "MarketMetadataCache":
+        return cls(
+            fresh_seconds=settings.market_ttl_seconds,
+            stale_seconds=settings.market_stale_seconds,
+            max_entries=settings.market_max_entries,
+        )
+
+    async def get(self, key: str, url: str, fetch: MarketFetcher) -> MarketData:
+        """Cached market for ``key``, as a copy carrying the caller's ``url``.
+
+        Callers never share the cached object, so one URL's spelling or a
+        caller's edits cannot leak into another's result.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.time() - entry.fetched_at
+            if age <= self.fresh_seconds:
+                self.hits += 1
+                MARKET_CACHE_SERVED_AGE.observe(age)
+                self._entries.move_to_end(key)
+                return replace(entry.result.market, url=url)
+            if age <= self.fresh_seconds + self.stale_seconds:
+                self.stale_hits += 1
+                MARKET_CACHE_SERVED_AGE.observe(age)
+                self._entries.move_to_end(key)
+                self._revalidate_in_background(key, fetch)
+                return replace(entry.result.market, url=url)
+            self.expired += 1
+        else:
+            self.misses += 1
+        result = await self._flights.do(key, lambda: self._refresh(key, fetch))
+        return replace(result.market, url=url)
+
+    def peek(self, key: str) -> Optional[MarketFetchResult]:
+        """Return the entry for ``key`` if it is still fresh, without fetching."""
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry.fetched_at > self.fresh_seconds:
+            self.prefetch_misses += 1
+            return None
+        self.prefetch_hits += 1
+        self._entries.move_to_end(key)
+        return entry.result
+
+    def store(self, key: str, result: MarketFetchResult) -> None:
+        """Record a result fetched outside ``get``, e.g. by a bulk request."""
+        self._entries[key] = _Entry(result, time.time())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.stale_hits + self.misses + self.expired
+        now = time.time()
+        ages = [now - entry.fetched_at for entry in self._entries.values()]
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "prefetch_hits": self.prefetch_hits,
+            "prefetch_misses": self.prefetch_misses,
+            "revalidations": self.revalidations,
+            "not_modified": self.not_modified,
+            "errors": self.errors,
+            "entries": len(self._entries),
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            "max_age_seconds": round(max(ages), 1) if ages else 0.0,
+        }
+
+    async def _refresh(self, key: str, fetch: MarketFetcher) -> MarketFetchResult:
+        entry = self._entries.get(key)
+        previous = entry.result if entry is not None else None
+        if previous is not None:
+            self.revalidations += 1
+        try:
+            result = await fetch(previous)
+        except Exception:
+            self.errors += 1
+            raise
+        if previous is not None and result.market is previous.market:
+            self.not_modified += 1
+        self.store(key, result)
+        return result
+
+    def _revalidate_in_background(self, key: str, fetch: MarketFetcher) -> None:
+        async def _run() -> None:
+            try:
+                await self._flights.do(key, lambda: self._refresh(key, fetch))
+            except Exception as exc:
+                logger.warning(f"Background revalidation of {key} failed: {exc}")
+
+        task = asyncio.create_task(_run())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+
+class SlugKindMemo:
+    """Remembers whether a Polymarket slug resolves via ``/events`` or ``/markets``.
+
+    Kept in memory and, when ``sqlite_path`` is set, in SQLite so the memo
+    survives restarts. Slugs are case-insensitive. Writes are buffered and
+    committed in a worker thread when called from the event loop.
+    """
+
+    def __init__(self, sqlite_path: Optional[str] = None, max_entries: int = 50000):
+        self.max_entries = max_entries
+        self._kinds: "OrderedDict[str, str]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._pending: Dict[str, str] = {}
+        self._flush_scheduled = False
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS slug_kinds (slug TEXT PRIMARY KEY, kind TEXT NOT NULL)")
+            self._db.commit()
+            for slug, kind in self._db.execute("SELECT slug, kind FROM slug_kinds"):
+                self._kinds[slug.lower()] = kind
+
+    def get(self, slug: str) -> Optional[str]:
+        return self._kinds.get(slug.lower())
+
+    def set(self, slug: str, kind: str) -> None:
+        slug = slug.lower()
+        if self._kinds.get(slug) == kind:
+            return
+        self._kinds[slug] = kind
+        while len(self._kinds) > self.max_entries:
+            self._kinds.popitem(last=False)
+        if self._db is None:
+            return
+        with self._lock:
+            self._pending[slug] = kind
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+        else:
+            loop.run_in_executor(None, self.flush)
+
+    def flush(self) -> None:
+        """Write buffered slug kinds to SQLite; blocking."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._flush_scheduled = False
+        if not pending or self._db is None:
+            return
+        # Separate from _lock so set() never waits on a commit
+        with self._db_lock:
+            self._db.executemany("INSERT OR REPLACE INTO slug_kinds (slug, kind) VALUES (?, ?)", pending.items())
+            self._db.commit()
+
+
+@lru_cache(maxsize=None)
+def get_slug_memo(settings: Settings) -> SlugKindMemo:
+    """Return the process-wide slug-kind memo for ``settings``."""
+    return SlugKindMemo(settings.cache.slug_memo_path)
+
+
+# Caches handed out by get_market_cache, reported at metrics scrape time
+_caches: List[MarketMetadataCache] = []
+
+
+@lru_cache(maxsize=None)
+def get_market_cache(settings: Settings) -> Optional[MarketMetadataCache]:
+    """Return the process-wide market cache for ``settings``; ``None`` when disabled."""
+    if settings.cache.market_ttl_seconds <= 0:
+        return None
+    cache = MarketMetadataCache.from_settings(settings.cache)
+    _caches.append(cache)
+    return cache
+
+
+def _collect_market_cache_metrics():
+    for cache in _caches:
+        yield "polyseek_market_cache_lookups_total", {"result": "hit"}, cache.hits
+        yield "polyseek_market_cache_lookups_total", {"result": "stale"}, cache.stale_hits
+        yield "polyseek_market_cache_lookups_total", {"result": "miss"}, cache.misses
+        yield "polyseek_market_cache_lookups_total", {"result": "expired"}, cache.expired
+
+
+REGISTRY.add_collector(
+    "polyseek_market_cache_lookups_total",
+    "counter",
+    "Market metadata cache lookups.",
+    _collect_market_cache_metrics,
+)
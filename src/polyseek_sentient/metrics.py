@@ -0,0 +1,258 @@
+"""Minimal Prometheus-style metrics (counters, gauges, histograms)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+# (metric name, labels, value) produced on demand at scrape time
+Sample = Tuple[str, Dict[str, str], float]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, object]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: LabelValues, extra: Optional[Dict[str, str]] = None) -> str:
+        pairs = list(zip(self.labelnames, key)) + list((extra or {}).items())
+        return _format_labels(dict(pairs))
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {} if self.labelnames else {(): 0.0}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{self._labels(key)} {_format_value(v)}" for key, v in sorted(self._values.items())]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {} if self.labelnames else {(): 0.0}
+
+    def set(self, value: float, **labels: object) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: object) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    @contextmanager
+    def track_inprogress(self, **labels: object) -> Iterator[None]:
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{self._labels(key)} {_format_value(v)}" for key, v in sorted(self._values.items())]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: (bucket counts, sum, count)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            self._values[key] = (counts, total + value, count + 1)
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: object) -> int:
+        entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def render(self) -> List[str]:
+        lines: List[str] = []
+        for key, (counts, total, count) in sorted(self._values.items()):
+            for bound, bucket_count in zip(self.buckets, counts):
+                labels = self._labels(key, {"le": _format_value(bound)})
+                lines.append(f"{self.name}_bucket{labels} {bucket_count}")
+            lines.append(f"{self.name}_bucket{self._labels(key, {'le': '+Inf'})} {count}")
+            lines.append(f"{self.name}_sum{self._labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{self._labels(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metrics and scrape-time collectors and renders the text format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Tuple[str, str, str, Callable[[], Iterable[Sample]]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def add_collector(
+        self,
+        name: str,
+        kind: str,
+        documentation: str,
+        collect: Callable[[], Iterable[Sample]],
+    ) -> None:
+        """Register a callback that reports current values of ``name`` when scraped."""
+        self._collectors.append((name, kind, documentation, collect))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        for name, kind, documentation, collect in self._collectors:
+            samples = list(collect())
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_LATENCY = REGISTRY.register(Histogram(
+    "polyseek_stage_duration_seconds", "Pipeline stage latency.", ("stage",)
+))
+STAGE_ERRORS = REGISTRY.register(Counter(
+    "polyseek_stage_errors_total", "Pipeline stage failures.", ("stage",)
+))
+UPSTREAM_LATENCY = REGISTRY.register(Histogram(
+    "polyseek_upstream_request_duration_seconds", "Upstream HTTP latency to response headers.", ("host",)
+))
+UPSTREAM_ERRORS = REGISTRY.register(Counter(
+    "polyseek_upstream_errors_total", "Upstream HTTP transport errors and 5xx responses.", ("host",)
+))
+UPSTREAM_RETRIES = REGISTRY.register(Counter(
+    "polyseek_upstream_retries_total", "Upstream requests retried after a failure.", ("host", "reason")
+))
+UPSTREAM_HEDGES = REGISTRY.register(Counter(
+    "polyseek_upstream_hedged_requests_total", "Hedged second requests sent to slow upstreams.", ("host",)
+))
+CIRCUIT_REJECTIONS = REGISTRY.register(Counter(
+    "polyseek_circuit_breaker_rejections_total", "Upstream requests failed fast by an open circuit.", ("host",)
+))
+PROVIDER_LATENCY = REGISTRY.register(Histogram(
+    "polyseek_signal_provider_duration_seconds", "Signal provider search latency.", ("provider",)
+))
+PROVIDER_ERRORS = REGISTRY.register(Counter(
+    "polyseek_signal_provider_errors_total", "Signal provider search failures.", ("provider",)
+))
+EVIDENCE_DUPLICATES = REGISTRY.register(Counter(
+    "polyseek_evidence_duplicates_total", "Near-duplicate comments and signals collapsed before prompting.", ("kind",)
+))
+LLM_LATENCY = REGISTRY.register(Histogram(
+    "polyseek_llm_request_duration_seconds", "LLM completion latency.", ("model", "step")
+))
+LLM_ERRORS = REGISTRY.register(Counter(
+    "polyseek_llm_errors_total", "LLM completion failures.", ("model", "step")
+))
+PARSE_QUEUE_WAIT = REGISTRY.register(Histogram(
+    "polyseek_parse_queue_wait_seconds",
+    "Time parse jobs waited for an executor worker.",
+    ("workload",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+))
+PARSE_DURATION = REGISTRY.register(Histogram(
+    "polyseek_parse_duration_seconds", "Time spent parsing pages and feeds in a worker.", ("workload",)
+))
+ANALYSES_IN_FLIGHT = REGISTRY.register(Gauge(
+    "polyseek_analyses_in_flight", "Analysis pipelines currently running."
+))
+QUEUE_DEPTH = REGISTRY.register(Gauge(
+    "polyseek_queue_depth", "Work items waiting to start.", ("queue",)
+))
+ADMISSION_REJECTIONS = REGISTRY.register(Counter(
+    "polyseek_admission_rejections_total", "Requests turned away by admission control.", ("queue", "reason")
+))
+MARKET_CACHE_SERVED_AGE = REGISTRY.register(Histogram(
+    "polyseek_market_cache_served_age_seconds",
+    "Age of market metadata served from the cache.",
+    buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+))
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
@@ -0,0 +1,184 @@
+"""Incremental market page scanner, fed the HTML as it downloads."""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+# Elements HTMLParser never closes
+VOID_ELEMENTS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+)
+# Their text is left out of get_text() by BeautifulSoup
+HIDDEN_ELEMENTS = frozenset({"script", "style", "template"})
+
+AUTHOR_TESTID = re.compile("author", re.I)
+
+
+class _Capture:
+    """Text collected from one element, as ``get_text`` would see it."""
+
+    def __init__(self, kind: str, seq: int = 0):
+        self.kind = kind
+        self.seq = seq
+        self.strings: List[str] = []
+        self.author: Optional[_Capture] = None
+        self.done = False
+
+    def text(self, separator: str = " ") -> str:
+        return separator.join(self.strings)
+
+
+class PageScanner(HTMLParser):
+    """Finds the same rules and comment candidates as the DOM extraction.
+
+    Mirrors ``_extract_rules`` and ``_extract_comments`` without building a
+    tree: elements are tracked on a stack and only the text of interesting
+    ones is kept. The contents of a ``__NEXT_DATA__`` script are kept too.
+    ``complete`` turns true once the rules (the resolution criteria, or the
+    paragraph after a "Resolution" header when the page has no criteria
+    block) and ``max_comments`` usable comments have been seen, so the
+    caller can stop downloading.
+    """
+
+    def __init__(self, max_comments: int, min_comment_chars: int = 15):
+        super().__init__(convert_charrefs=True)
+        self.max_comments = max_comments
+        self.min_comment_chars = min_comment_chars
+        self.criteria: Optional[_Capture] = None
+        self.meta_description: Optional[str] = None
+        self.next_data: Optional[str] = None
+        self._stack: List[Tuple[str, List[_Capture]]] = []
+        self._active: List[_Capture] = []
+        self._text: List[str] = []
+        self._hidden = 0
+        self._seq = 0
+        self._seen_meta = False
+        self._resolution_header: Optional[_Capture] = None
+        self._header_found = False
+        self._header_rules: Optional[_Capture] = None
+        self._candidates: List[_Capture] = []
+        self._open_candidates = 0
+        self._usable = 0
+        self._next_data_parts: Optional[List[str]] = None
+
+    @property
+    def complete(self) -> bool:
+        rules = self.criteria if self.criteria is not None else self._header_rules
+        return (
+            rules is not None
+            and rules.done
+            and self._open_candidates == 0
+            and self._usable >= self.max_comments
+        )
+
+    def rules(self) -> Optional[str]:
+        if self.criteria is not None:
+            return self.criteria.text()
+        if self._header_rules is not None:
+            return self._header_rules.text()
+        return self.meta_description or None
+
+    def comments(self) -> List[Tuple[str, Optional[str]]]:
+        """``(text, author)`` of usable comment candidates, in document order."""
+        found = []
+        for capture in sorted(self._candidates, key=lambda capture: capture.seq):
+            if len(found) >= self.max_comments:
+                break
+            text = capture.text()
+            if len(text) < self.min_comment_chars:
+                continue
+            found.append((text, capture.author.text() if capture.author is not None else None))
+        return found
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+        while self._stack:
+            self._pop()
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        attributes = dict(attrs)
+        if tag == "meta":
+            if not self._seen_meta and attributes.get("name") == "description":
+                self._seen_meta = True
+                self.meta_description = attributes.get("content")
+            return
+        if tag == "script" and attributes.get("id") == "__NEXT_DATA__":
+            self._next_data_parts = []
+        if tag in VOID_ELEMENTS:
+            return
+
+        started: List[_Capture] = []
+        testid = attributes.get("data-testid") or ""
+        if self.criteria is None and testid == "resolution-criteria":
+            self.criteria = _Capture("criteria")
+            started.append(self.criteria)
+        if not self._header_found and tag in ("h2", "h3"):
+            self._resolution_header = _Capture("header")
+            started.append(self._resolution_header)
+        if tag == "p" and self._header_found and self._header_rules is None:
+            self._header_rules = _Capture("header_rules")
+            started.append(self._header_rules)
+        if AUTHOR_TESTID.search(testid):
+            for capture in self._active:
+                if capture.kind == "comment" and capture.author is None:
+                    capture.author = _Capture("author")
+                    started.append(capture.author)
+        if "comment" in testid or "Comment" in (attributes.get("class") or ""):
+            self._seq += 1
+            candidate = _Capture("comment", self._seq)
+            self._candidates.append(candidate)
+            self._open_candidates += 1
+            started.append(candidate)
+
+        if tag in HIDDEN_ELEMENTS:
+            self._hidden += 1
+        self._stack.append((tag, started))
+        self._active.extend(started)
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag == "script" and self._next_data_parts is not None:
+            self.next_data = "".join(self._next_data_parts)
+            self._next_data_parts = None
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                while len(self._stack) > index:
+                    self._pop()
+                break
+
+    def handle_data(self, data):
+        if self._next_data_parts is not None:
+            self._next_data_parts.append(data)
+        self._text.append(data)
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def _flush(self) -> None:
+        # One text node may arrive in several handle_data calls across chunks
+        if not self._text:
+            return
+        text = "".join(self._text).strip()
+        self._text = []
+        if not text or self._hidden:
+            return
+        for capture in self._active:
+            capture.strings.append(text)
+
+    def _pop(self) -> None:
+        tag, started = self._stack.pop()
+        if tag in HIDDEN_ELEMENTS:
+            self._hidden -= 1
+        for capture in started:
+            capture.done = True
+            self._active.remove(capture)
+            if capture.kind == "comment":
+                self._open_candidates -= 1
+                if len(capture.text()) >= self.min_comment_chars:
+                    self._usable += 1
+            elif capture is self._resolution_header:
+                self._header_found = "resolution" in capture.text("").lower()
@@ -0,0 +1,129 @@
+"""Executors for CPU-bound parsing: the default thread pool or warm worker processes."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Set, Tuple, TypeVar
+
+from .config import ParseSettings, Settings, load_settings
+from .metrics import PARSE_DURATION, PARSE_QUEUE_WAIT
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Modules each workload's workers import up front, so the first task is not slow.
+# Named from this package, which deployments import as ``src.polyseek_sentient``.
+WORKLOAD_MODULES: Dict[str, Tuple[str, ...]] = {
+    "scrape": (f"{__package__}.scrape_context",),
+    "rss": (f"{__package__}.signals_client",),
+}
+
+
+def _import_modules(modules: Tuple[str, ...]) -> None:
+    for module in modules:
+        importlib.import_module(module)
+
+
+def _noop() -> None:
+    return None
+
+
+def _timed_call(submitted_at: float, fn: Callable[..., T], args: tuple) -> Tuple[float, float, T]:
+    """Run ``fn`` in the executor and report how long it queued and ran."""
+    started = time.time()
+    result = fn(*args)
+    return max(0.0, started - submitted_at), time.time() - started, result
+
+
+class ParserPools:
+    """One executor per parsing workload.
+
+    In ``thread`` mode parsers share the loop's default thread pool. In
+    ``process`` mode each workload gets its own ``ProcessPoolExecutor`` sized
+    by ``ParseSettings``, so HTML and feed parsing scale across cores without
+    competing for the GIL. Parsers and their arguments and results must be
+    picklable in that mode. Workers are started and warmed by ``start``.
+    A pool that breaks before finishing any task (its workers cannot start)
+    is not recreated; that workload parses in threads from then on.
+    """
+
+    def __init__(self, settings: ParseSettings):
+        self.settings = settings
+        self.sizes = {"scrape": settings.scrape_workers, "rss": settings.rss_workers}
+        self._pools: Dict[str, ProcessPoolExecutor] = {}
+        # Workloads whose current pool has finished a task, and those given up on
+        self._proven: Set[str] = set()
+        self._disabled: Set[str] = set()
+
+    @property
+    def uses_processes(self) -> bool:
+        return self.settings.mode == "process"
+
+    def start(self) -> None:
+        if not self.uses_processes:
+            return
+        for workload in self.sizes:
+            if workload in self._disabled:
+                continue
+            pool = self._pool(workload)
+            for _ in range(max(1, self.sizes[workload])):
+                pool.submit(_noop)
+
+    def shutdown(self) -> None:
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, workload: str, fn: Callable[..., T], *args) -> T:
+        loop = asyncio.get_running_loop()
+        pool = self._pool(workload) if self.uses_processes and workload not in self._disabled else None
+        try:
+            waited, elapsed, result = await loop.run_in_executor(pool, _timed_call, time.time(), fn, args)
+        except BrokenProcessPool:
+            if workload in self._proven:
+                logger.error(f"{workload} parser pool broke; restarting it and parsing in a thread")
+            else:
+                logger.error(f"{workload} parser workers failed to start; parsing in threads from now on")
+                self._disabled.add(workload)
+            self._proven.discard(workload)
+            broken = self._pools.pop(workload, None)
+            if broken is not None:
+                broken.shutdown(wait=False, cancel_futures=True)
+            waited, elapsed, result = await loop.run_in_executor(None, _timed_call, time.time(), fn, args)
+        else:
+            if pool is not None:
+                self._proven.add(workload)
+        PARSE_QUEUE_WAIT.observe(waited, workload=workload)
+        PARSE_DURATION.observe(elapsed, workload=workload)
+        return result
+
+    def _pool(self, workload: str) -> ProcessPoolExecutor:
+        pool = self._pools.get(workload)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=max(1, self.sizes.get(workload, 1)),
+                mp_context=multiprocessing.get_context(self.settings.start_method),
+                initializer=_import_modules,
+                initargs=(WORKLOAD_MODULES.get(workload, ()),),
+            )
+            self._pools[workload] = pool
+        return pool
+
+
+@lru_cache(maxsize=None)
+def get_parser_pools(settings: Settings) -> ParserPools:
+    """Return the process-wide parser pools for ``settings``."""
+    return ParserPools(settings.parse)
+
+
+async def run_parser(workload: str, fn: Callable[..., T], *args, settings: Optional[Settings] = None) -> T:
+    """Run the parser ``fn(*args)`` on the executor configured for ``workload``."""
+    return await get_parser_pools(settings or load_settings()).run(workload, fn, *args)
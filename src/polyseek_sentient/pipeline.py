@@ -0,0 +1,304 @@
+"""Concurrent orchestration of the analysis pipeline stages."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .analysis_agent import AnalysisRequest, AnalysisStepHook, run_analysis
+from .config import Settings, load_settings
+from .metrics import ANALYSES_IN_FLIGHT, STAGE_ERRORS, STAGE_LATENCY
+
+# The stage implementations pull in httpx, bs4 and feedparser; they are
+# imported on first use so the app can start (and cold-start) without them.
+if TYPE_CHECKING:
+    from .fetch_market import MarketData
+    from .http_clients import HTTPClientRegistry
+    from .report_formatter import AnalysisModel
+    from .result_cache import AnalysisCache
+    from .scrape_context import Comment, MarketContext
+    from .signals_client import SignalRecord
+
+StageStartHook = Callable[[str], Awaitable[None]]
+StageCompleteHook = Callable[[str, Any], Awaitable[None]]
+
+
+@dataclass
+class Stage:
+    """A pipeline step that runs once all of its dependencies have finished."""
+
+    name: str
+    run: Callable[[Dict[str, Any]], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+
+
+class StageError(RuntimeError):
+    """Raised when a pipeline stage fails; wraps the original exception."""
+
+    def __init__(self, stage: str, error: BaseException):
+        super().__init__(f"{stage} stage failed: {error}")
+        self.stage = stage
+        self.error = error
+
+
+@dataclass
+class PipelineResult:
+    market: MarketData
+    context: Optional[MarketContext]
+    signals: List[SignalRecord]
+    analysis: Dict
+    model: AnalysisModel
+    markdown: str
+    timings: Dict[str, float] = field(default_factory=dict)
+    cached: bool = False
+
+
+async def run_stages(
+    stages: Iterable[Stage],
+    on_start: Optional[StageStartHook] = None,
+    on_complete: Optional[StageCompleteHook] = None,
+    stop_when: Optional[Callable[[str, Any], bool]] = None,
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """Run a stage dependency graph, overlapping every independent stage.
+
+    Returns the stage results and the wall-clock duration of each stage in
+    milliseconds. The first failing stage cancels the rest and is re-raised as
+    a ``StageError``. When ``stop_when`` returns true for a finished stage, the
+    unfinished stages are cancelled and only completed results are returned.
+    """
+    ordered = _topological_order(list(stages))
+    tasks: Dict[str, asyncio.Task] = {}
+    timings: Dict[str, float] = {}
+
+    def _cancel_unfinished() -> None:
+        current = asyncio.current_task()
+        for task in tasks.values():
+            if task is not current:
+                task.cancel()
+
+    async def _execute(stage: Stage) -> Any:
+        # Shielded so cancelling a dependent never cancels its dependencies
+        inputs = {dep: await asyncio.shield(tasks[dep]) for dep in stage.depends_on}
+        if on_start:
+            await on_start(stage.name)
+        started = time.perf_counter()
+        try:
+            result = await stage.run(inputs)
+        except Exception as exc:
+            _record_timing(timings, stage.name, started)
+            STAGE_ERRORS.inc(stage=stage.name)
+            raise StageError(stage.name, exc) from exc
+        _record_timing(timings, stage.name, started)
+        if on_complete:
+            await on_complete(stage.name, result)
+        if stop_when and stop_when(stage.name, result):
+            _cancel_unfinished()
+        return result
+
+    for stage in ordered:
+        tasks[stage.name] = asyncio.create_task(_execute(stage), name=f"stage:{stage.name}")
+    try:
+        _, pending = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+    except BaseException:
+        _cancel_unfinished()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+    if pending:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    # Dependents re-raise their dependency's error; retrieve them all and
+    # surface the earliest stage in dependency order.
+    errors = [task.exception() for task in tasks.values() if not task.cancelled()]
+    for error in errors:
+        if error is not None:
+            raise error
+    results = {name: task.result() for name, task in tasks.items() if not task.cancelled()}
+    return results, timings
+
+
+def build_analysis_stages(
+    market_url: str,
+    depth: str,
+    perspective: str,
+    settings: Settings,
+    clients: Optional[HTTPClientRegistry] = None,
+    cache: Optional[AnalysisCache] = None,
+    on_analysis_step: Optional[AnalysisStepHook] = None,
+) -> List[Stage]:
+    """Return the stage graph for a single market analysis.
+
+    The page scrape only needs the URL, so it overlaps with the market API call;
+    comments API paging and signal search start as soon as the market is known,
+    and the ``context`` stage swaps the API comments in for the page's. Upstream calls
+    reuse the pooled clients from ``clients`` when one is provided. The
+    ``cache`` stage yields ``(key, payload)``; a payload means a cached verdict
+    still within the price threshold exists.
+    """
+    from .fetch_market import detect_market_source, fetch_market_data
+    from .report_formatter import format_response
+    from .scrape_context import fetch_api_comments, fetch_page_context, with_api_comments
+    from .signals_client import gather_signals
+
+    async def _market(_: Dict[str, Any]) -> MarketData:
+        client = clients.get(detect_market_source(market_url).value) if clients else None
+        return await fetch_market_data(market_url, settings, client)
+
+    async def _page(_: Dict[str, Any]) -> MarketContext:
+        client = clients.get("scrape") if clients else None
+        return await fetch_page_context(market_url, settings, client)
+
+    async def _comments(inputs: Dict[str, Any]) -> Optional[List[Comment]]:
+        client = clients.get("scrape") if clients else None
+        return await fetch_api_comments(market_url, settings, client, inputs["market"])
+
+    async def _context(inputs: Dict[str, Any]) -> MarketContext:
+        return with_api_comments(inputs["page"], inputs["comments"])
+
+    async def _signals(inputs: Dict[str, Any]) -> List[SignalRecord]:
+        return await gather_signals(inputs["market"], settings, clients=clients)
+
+    async def _cache(inputs: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict]]:
+        if cache is None:
+            return None, None
+        key = cache.key(inputs["market"], depth, perspective)
+        return key, await cache.aget(key, inputs["market"].prices.yes)
+
+    async def _analysis(inputs: Dict[str, Any]) -> Dict:
+        payload = await run_analysis(
+            AnalysisRequest(
+                market=inputs["market"],
+                context=inputs["context"],
+                signals=inputs["signals"],
+                depth=depth,
+                perspective=perspective,
+            ),
+            settings,
+            on_step=on_analysis_step,
+        )
+        key, _ = inputs["cache"]
+        if key is not None and not (payload.get("metadata") or {}).get("error"):
+            await cache.aset(key, payload, inputs["market"].prices.yes)
+        return payload
+
+    async def _format(inputs: Dict[str, Any]) -> Tuple[AnalysisModel, str]:
+        return format_response(inputs["analysis"])
+
+    return [
+        Stage("market", _market),
+        Stage("page", _page),
+        Stage("comments", _comments, ("market",)),
+        Stage("context", _context, ("page", "comments")),
+        Stage("cache", _cache, ("market",)),
+        Stage("signals", _signals, ("market",)),
+        Stage("analysis", _analysis, ("market", "context", "signals", "cache")),
+        Stage("format", _format, ("analysis",)),
+    ]
+
+
+async def run_analysis_pipeline(
+    market_url: str,
+    depth: str = "quick",
+    perspective: str = "neutral",
+    settings: Optional[Settings] = None,
+    on_start: Optional[StageStartHook] = None,
+    on_complete: Optional[StageCompleteHook] = None,
+    clients: Optional[HTTPClientRegistry] = None,
+    cache: Optional[AnalysisCache] = None,
+    on_analysis_step: Optional[AnalysisStepHook] = None,
+) -> PipelineResult:
+    """Fetch, analyze and format a market, running independent stages together.
+
+    On a result-cache hit the scrape, signal and LLM stages are cancelled and
+    the cached verdict is formatted instead. Per-stage timings are attached to
+    the model's ``metadata["stage_timings_ms"]``.
+    """
+    from .http_clients import current_http_clients
+    from .report_formatter import format_response
+    from .result_cache import get_analysis_cache
+
+    settings = settings or load_settings()
+    clients = clients or current_http_clients()
+    cache = cache or get_analysis_cache(settings)
+    stages = build_analysis_stages(
+        market_url, depth, perspective, settings, clients, cache, on_analysis_step
+    )
+    with ANALYSES_IN_FLIGHT.track_inprogress():
+        results, timings = await run_stages(
+            stages,
+            on_start=on_start,
+            on_complete=on_complete,
+            stop_when=lambda stage, result: stage == "cache" and result[1] is not None,
+        )
+    _, cached = results["cache"]
+    if cached is not None:
+        started = time.perf_counter()
+        model, markdown = format_response(cached)
+        _record_timing(timings, "format", started)
+        model.metadata = {**(model.metadata or {}), "stage_timings_ms": timings}
+        return PipelineResult(
+            market=results["market"],
+            context=results.get("context"),
+            signals=results.get("signals", []),
+            analysis=cached,
+            model=model,
+            markdown=markdown,
+            timings=timings,
+            cached=True,
+        )
+    model, markdown = results["format"]
+    model.metadata = {**(model.metadata or {}), "stage_timings_ms": timings}
+    return PipelineResult(
+        market=results["market"],
+        context=results["context"],
+        signals=results["signals"],
+        analysis=results["analysis"],
+        model=model,
+        markdown=markdown,
+        timings=timings,
+    )
+
+
+def analysis_key(market_url: str, depth: str, perspective: str) -> Tuple[str, str, str]:
+    """Return the key identifying equivalent analysis requests."""
+    from .fetch_market import MarketFetchError, canonical_market_key
+
+    try:
+        market_key = canonical_market_key(market_url)
+    except MarketFetchError:
+        market_key = market_url.strip()
+    return market_key, depth, perspective
+
+
+def _record_timing(timings: Dict[str, float], stage: str, started: float) -> None:
+    elapsed = time.perf_counter() - started
+    timings[stage] = round(elapsed * 1000, 1)
+    STAGE_LATENCY.observe(elapsed, stage=stage)
+
+
+def _topological_order(stages: List[Stage]) -> List[Stage]:
+    by_name = {stage.name: stage for stage in stages}
+    if len(by_name) != len(stages):
+        raise ValueError("Duplicate stage names in pipeline")
+    ordered: List[Stage] = []
+    state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+
+    def _visit(stage: Stage) -> None:
+        mark = state.get(stage.name)
+        if mark == 2:
+            return
+        if mark == 1:
+            raise ValueError(f"Cycle in pipeline at stage '{stage.name}'")
+        state[stage.name] = 1
+        for dep in stage.depends_on:
+            if dep not in by_name:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+            _visit(by_name[dep])
+        state[stage.name] = 2
+        ordered.append(stage)
+
+    for stage in stages:
+        _visit(stage)
+    return ordered
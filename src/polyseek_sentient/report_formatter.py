@@ -30,6 +30,24 @@ class DriverModel(BaseModel):
     source_ids: List[str] = Field(default_factory=list)
 
 
+class OutcomeModel(BaseModel):
+    """One outcome of a multi-market event, as assessed in event mode."""
+
+    label: str
+    market_id: str | None = None
+    verdict: str = "UNCERTAIN"
+    probability_pct: float
+    market_price: float | None = None
+    rationale: str = ""
+
+    @field_validator("probability_pct")
+    @classmethod
+    def validate_probability(cls, value: float) -> float:
+        if not 0 <= value <= 100:
+            raise ValueError("probability_pct must be between 0 and 100")
+        return round(value, 1)
+
+
 class AnalysisModel(BaseModel):
     verdict: str
     confidence_pct: float
@@ -40,6 +58,8 @@ class AnalysisModel(BaseModel):
     sources: List[SourceModel]
     analysis_timestamp: str | None = None
     metadata: dict | None = None
+    # Set in event mode: one entry per market of the event
+    outcomes: List[OutcomeModel] | None = None
 
     @field_validator("confidence_pct")
     @classmethod
@@ -86,8 +106,14 @@ def render_markdown(model: AnalysisModel) -> str:
         "#### Summary",
         model.summary.strip(),
         "",
-        "#### Key Drivers",
     ]
+    if model.outcomes:
+        lines.extend(["#### Outcomes", "| Outcome | Verdict | Probability | Market |", "| --- | --- | --- | --- |"])
+        for outcome in model.outcomes:
+            market = f"{outcome.market_price * 100:.1f}%" if outcome.market_price is not None else "-"
+            lines.append(f"| {outcome.label} | {outcome.verdict} | {outcome.probability_pct:.1f}% | {market} |")
+        lines.append("")
+    lines.append("#### Key Drivers")
     if model.key_drivers:
         # Show all drivers for deep mode, up to 5 for quick mode
         max_drivers = 5 if model.metadata and model.metadata.get("mode") == "deep" else 3
@@ -0,0 +1,261 @@
+"""Retries, hedged requests and per-host circuit breakers for upstream HTTP calls."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional
+
+import httpx
+
+from .config import HTTPSettings
+from .metrics import CIRCUIT_REJECTIONS, REGISTRY, UPSTREAM_HEDGES, UPSTREAM_RETRIES
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+# Reported as the value of polyseek_circuit_breaker_state
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of contacting a host whose circuit is open."""
+
+
+@dataclass(frozen=True)
+class ResiliencePolicy:
+    attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+    hedge: bool = True
+    hedge_min_samples: int = 20
+    breaker_failures: int = 5
+    breaker_reset_seconds: float = 30.0
+
+    @classmethod
+    def from_settings(cls, settings: HTTPSettings, hedge: bool = True) -> "ResiliencePolicy":
+        """Policy from ``settings``; ``hedge=False`` turns hedging off for this upstream."""
+        return cls(
+            attempts=max(1, settings.retry_attempts),
+            base_delay=settings.retry_base_delay,
+            max_delay=settings.retry_max_delay,
+            hedge=hedge and settings.hedge_requests,
+            hedge_min_samples=settings.hedge_min_samples,
+            breaker_failures=settings.breaker_failures,
+            breaker_reset_seconds=settings.breaker_reset_seconds,
+        )
+
+    def backoff(self, previous: float) -> float:
+        """Next delay with decorrelated jitter: uniform in [base, 3 * previous], capped."""
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+
+class CircuitBreaker:
+    """Opens after ``failure_threshold`` consecutive failures to a host.
+
+    While open, requests fail fast with ``CircuitOpenError``. After
+    ``reset_seconds`` a single probe is let through; its outcome closes the
+    circuit or opens it again.
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def before_request(self) -> None:
+        if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_seconds:
+            self.state = HALF_OPEN
+        if self.state == OPEN or (self.state == HALF_OPEN and self._probing):
+            CIRCUIT_REJECTIONS.inc(host=self.host)
+            raise CircuitOpenError(f"Circuit open for {self.host}")
+        if self.state == HALF_OPEN:
+            self._probing = True
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def record_abandoned(self) -> None:
+        """The request was cancelled (e.g. a losing hedge); it proves nothing."""
+        self._probing = False
+
+
+class LatencyWindow:
+    """Recent response latencies for one host, for estimating the hedge delay."""
+
+    def __init__(self, size: int = 200):
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float, min_samples: int = 1) -> Optional[float]:
+        if len(self._samples) < max(1, min_samples):
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+# Shared by every transport so all clients see the same view of a host
+_breakers: Dict[str, CircuitBreaker] = {}
+_latencies: Dict[str, LatencyWindow] = {}
+
+
+def get_breaker(host: str, policy: ResiliencePolicy) -> CircuitBreaker:
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = CircuitBreaker(host, policy.breaker_failures, policy.breaker_reset_seconds)
+    return breaker
+
+
+def breaker_states() -> Dict[str, str]:
+    return {host: breaker.state for host, breaker in _breakers.items()}
+
+
+class ResilientTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper adding retries, hedging and circuit breaking.
+
+    Only idempotent methods are retried or hedged. Transport errors and
+    429/502/503/504 responses are retried; a ``Retry-After`` longer than
+    ``max_delay`` ends the retries and the response is returned as is.
+    When the policy allows hedging, a GET still unanswered after the host's
+    p95 latency gets a second copy; whichever answers first wins and the
+    other is cancelled.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, policy: ResiliencePolicy):
+        self._transport = transport
+        self.policy = policy
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        breaker = get_breaker(host, self.policy)
+        if request.method not in IDEMPOTENT_METHODS:
+            return await self._send(request, breaker)
+
+        delay = 0.0
+        for attempt in range(1, self.policy.attempts + 1):
+            retry_after = None
+            try:
+                response = await self._send_hedged(request, breaker)
+            except CircuitOpenError:
+                raise
+            except httpx.TransportError as exc:
+                if attempt == self.policy.attempts:
+                    raise
+                reason = type(exc).__name__
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == self.policy.attempts:
+                    return response
+                retry_after = _retry_after(response)
+                if retry_after is not None and retry_after > self.policy.max_delay:
+                    # The host asked for a longer pause than we are willing to
+                    # wait; hand its answer back rather than hammer it early
+                    return response
+                await response.aclose()
+                reason = str(response.status_code)
+            delay = self.policy.backoff(delay)
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            UPSTREAM_RETRIES.inc(host=host, reason=reason)
+            await asyncio.sleep(delay)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    async def _send(self, request: httpx.Request, breaker: CircuitBreaker) -> httpx.Response:
+        breaker.before_request()
+        started = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.record_abandoned()
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+            _latencies.setdefault(request.url.host, LatencyWindow()).observe(time.perf_counter() - started)
+        return response
+
+    async def _send_hedged(self, request: httpx.Request, breaker: CircuitBreaker) -> httpx.Response:
+        window = _latencies.get(request.url.host)
+        hedge_after = (
+            window.quantile(0.95, self.policy.hedge_min_samples)
+            if self.policy.hedge and window is not None and request.method == "GET"
+            else None
+        )
+        if hedge_after is None or breaker.state != CLOSED:
+            return await self._send(request, breaker)
+
+        first = asyncio.create_task(self._send(request, breaker))
+        pending = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_after)
+            if done:
+                return first.result()
+            UPSTREAM_HEDGES.inc(host=request.url.host)
+            pending.add(asyncio.create_task(self._send(request, breaker)))
+            winner: Optional[httpx.Response] = None
+            error: Optional[BaseException] = None
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                    elif winner is None:
+                        winner = task.result()
+                    else:
+                        await task.result().aclose()
+            if winner is None:
+                raise error
+            return winner
+        finally:
+            for task in pending:
+                task.cancel()
+            for result in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(result, httpx.Response):
+                    await result.aclose()
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    try:
+        return max(0.0, float(response.headers.get("retry-after", "")))
+    except ValueError:
+        return None
+
+
+def _collect_breaker_states():
+    for host, state in breaker_states().items():
+        yield "polyseek_circuit_breaker_state", {"host": host}, STATE_VALUES[state]
+
+
+REGISTRY.add_collector(
+    "polyseek_circuit_breaker_state",
+    "gauge",
+    "Upstream circuit breaker state per host (0 closed, 1 half-open, 2 open).",
+    _collect_breaker_states,
+)
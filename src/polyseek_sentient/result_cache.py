@@ -0,0 +1,194 @@
+"""TTL cache for analysis payloads keyed on market and options, invalidated by price moves."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .config import CacheSettings, Settings
+from .metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from .fetch_market import MarketData
+
+# (expires_at, YES price at analysis time, payload JSON)
+Entry = Tuple[float, Optional[float], str]
+
+
+class AnalysisCache:
+    """Two-tier (LRU memory + optional SQLite) cache of ``run_analysis`` output.
+
+    Entries are stored as JSON text so callers always get an independent copy
+    and the disk tier survives restarts. Each entry remembers the YES price it
+    was computed at; a lookup misses once the price has moved by more than
+    ``price_threshold`` from it.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = 512,
+        price_threshold: float = 0.02,
+        sqlite_path: Optional[str] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.price_threshold = price_threshold
+        # key -> (expires_at, price, payload JSON)
+        self._memory: "OrderedDict[str, Entry]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if sqlite_path:
+            self._db = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_cache ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires_at REAL NOT NULL, price REAL)"
+            )
+            columns = {row[1] for row in self._db.execute("PRAGMA table_info(analysis_cache)")}
+            if "price" not in columns:
+                self._db.execute("ALTER TABLE analysis_cache ADD COLUMN price REAL")
+            self._db.commit()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.price_misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings) -> "AnalysisCache":
+        return cls(
+            ttl_seconds=settings.analysis_ttl_seconds,
+            max_entries=settings.analysis_max_entries,
+            price_threshold=settings.analysis_price_threshold,
+            sqlite_path=settings.analysis_sqlite_path,
+        )
+
+    def key(self, market: MarketData, depth: str, perspective: str) -> str:
+        """Build the cache key; the price is checked on lookup, not keyed."""
+        return f"{market.source.value}:{market.market_id}|{depth}|{perspective}"
+
+    def get(self, key: str, price: Optional[float] = None) -> Optional[Dict]:
+        """Return the payload for ``key`` unless it expired or ``price`` moved too far."""
+        entry = self._memory_entry(key)
+        if entry is None and self._db is not None:
+            entry = self._load(key)
+            if entry is not None:
+                self.disk_hits += 1
+                self._remember(key, entry)
+        return self._lookup(key, entry, price)
+
+    async def aget(self, key: str, price: Optional[float] = None) -> Optional[Dict]:
+        """Like ``get``, reading the SQLite tier in a worker thread."""
+        entry = self._memory_entry(key)
+        if entry is None and self._db is not None:
+            entry = await asyncio.to_thread(self._load, key)
+            if entry is not None:
+                self.disk_hits += 1
+                self._remember(key, entry)
+        return self._lookup(key, entry, price)
+
+    def set(self, key: str, payload: Dict, price: Optional[float] = None) -> None:
+        entry = (time.time() + self.ttl_seconds, price, json.dumps(payload, default=str))
+        self._remember(key, entry)
+        if self._db is not None:
+            self._store(key, entry)
+
+    async def aset(self, key: str, payload: Dict, price: Optional[float] = None) -> None:
+        """Like ``set``, writing the SQLite tier in a worker thread."""
+        entry = (time.time() + self.ttl_seconds, price, json.dumps(payload, default=str))
+        self._remember(key, entry)
+        if self._db is not None:
+            await asyncio.to_thread(self._store, key, entry)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "price_misses": self.price_misses,
+            "evictions": self.evictions,
+            "entries": len(self._memory),
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _memory_entry(self, key: str) -> Optional[Entry]:
+        entry = self._memory.get(key)
+        if entry is not None and entry[0] <= time.time():
+            del self._memory[key]
+            return None
+        return entry
+
+    def _lookup(self, key: str, entry: Optional[Entry], price: Optional[float]) -> Optional[Dict]:
+        if entry is not None and not self._price_holds(entry[1], price):
+            self.price_misses += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._memory.move_to_end(key)
+        self.hits += 1
+        return json.loads(entry[2])
+
+    def _price_holds(self, cached: Optional[float], current: Optional[float]) -> bool:
+        if self.price_threshold <= 0:
+            return True
+        if cached is None or current is None:
+            # A price appearing or disappearing is a move too
+            return cached is None and current is None
+        return abs(current - cached) <= self.price_threshold
+
+    def _load(self, key: str) -> Optional[Entry]:
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT expires_at, price, payload FROM analysis_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return (row[0], row[1], row[2]) if row is not None else None
+
+    def _store(self, key: str, entry: Entry) -> None:
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, payload, expires_at, price) VALUES (?, ?, ?, ?)",
+                (key, entry[2], entry[0], entry[1]),
+            )
+            self._db.execute("DELETE FROM analysis_cache WHERE expires_at <= ?", (time.time(),))
+            self._db.commit()
+
+    def _remember(self, key: str, entry: Entry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+
+# Caches handed out by get_analysis_cache, reported at metrics scrape time
+_caches: List[AnalysisCache] = []
+
+
+@lru_cache(maxsize=None)
+def get_analysis_cache(settings: Settings) -> Optional[AnalysisCache]:
+    """Return the process-wide cache for ``settings``; ``None`` when disabled."""
+    if settings.cache.analysis_ttl_seconds <= 0:
+        return None
+    cache = AnalysisCache.from_settings(settings.cache)
+    _caches.append(cache)
+    return cache
+
+
+def _collect_cache_metrics():
+    for cache in _caches:
+        yield "polyseek_analysis_cache_lookups_total", {"result": "hit"}, cache.hits
+        yield "polyseek_analysis_cache_lookups_total", {"result": "miss"}, cache.misses
+
+
+REGISTRY.add_collector(
+    "polyseek_analysis_cache_lookups_total", "counter", "Analysis cache lookups.", _collect_cache_metrics
+)
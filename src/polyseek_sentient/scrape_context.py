@@ -3,15 +3,35 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
+import hashlib
+import json
+import logging
 import re
-import uuid
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Awaitable, Callable, List, Optional, Tuple
 
 import httpx
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
 
 from .config import Settings, ScrapeSettings, load_settings
+from .fetch_market import MarketData, MarketSource, detect_market_source, fetch_market_data
+from .page_scanner import PageScanner
+from .parse_pool import run_parser
+from .sentiment import score_texts
+
+logger = logging.getLogger(__name__)
+
+# Tree builders in order of preference for "auto"; lxml is C-accelerated
+HTML_PARSERS = ("lxml", "html.parser")
+
+# Id of the script tag holding a Next.js page's serialized state
+NEXT_DATA_ID = "__NEXT_DATA__"
+
+# ``next_cursor`` values Polymarket APIs return on the last page
+END_CURSORS = ("", "LTE=")
 
 
 @dataclass
@@ -22,6 +42,10 @@ class Comment:
     language: str
     sentiment: str
     mentions_ratio: float
+    # Lexicon polarity behind ``sentiment``, from -1 (con) to 1 (pro)
+    sentiment_score: float = 0.0
+    # Near-duplicates of this comment collapsed into it, itself included
+    duplicate_count: int = 1
 
 
 @dataclass
@@ -30,49 +54,341 @@ class MarketContext:
     comments: List[Comment]
 
 
+# (body, author) of a comment as extracted, before it becomes a ``Comment``
+RawComment = Tuple[str, Optional[str]]
+
+
 async def fetch_market_context(
     url: str,
     settings: Optional[Settings] = None,
     client: Optional[httpx.AsyncClient] = None,
+    market: Optional[MarketData] = None,
+) -> MarketContext:
+    """Scrape resolution criteria and comments.
+
+    Polymarket comments come from the comments API, fetched concurrently
+    with a single scan of the page; the page's own comments are the fallback
+    when the API fails or has none. ``market`` saves looking the market up
+    again when the caller already has it.
+    """
+    settings = settings or load_settings()
+    page, api_comments = await asyncio.gather(
+        fetch_page_context(url, settings, client),
+        fetch_api_comments(url, settings, client, market),
+    )
+    return with_api_comments(page, api_comments)
+
+
+async def fetch_page_context(
+    url: str,
+    settings: Optional[Settings] = None,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> MarketContext:
-    """Scrape resolution criteria and comments."""
+    """Resolution criteria and comments from the market page alone."""
     settings = settings or load_settings()
     if settings.app.offline_mode:
         return _offline_context()
-    html = await _download_html(url, settings, client)
-    
-    # Run CPU-bound parsing in a thread pool to avoid blocking the event loop
-    loop = asyncio.get_running_loop()
-    rules, comments = await loop.run_in_executor(
-        None, 
-        lambda: _parse_html_content(html, settings.scrape)
-    )
-    
+    rules, comments = await _page_context(url, settings, client)
     return MarketContext(resolution_rules=rules, comments=comments)
 
 
+async def fetch_api_comments(
+    url: str,
+    settings: Settings,
+    client: Optional[httpx.AsyncClient] = None,
+    market: Optional[MarketData] = None,
+) -> Optional[List[Comment]]:
+    """Comments for a Polymarket ``url`` from the comments API.
+
+    ``None`` when the API does not apply or fails; failures are logged so
+    the caller can fall back to the page's comments.
+    """
+    if (
+        settings.app.offline_mode
+        or not settings.scrape.comments_api
+        or detect_market_source(url) != MarketSource.POLYMARKET
+    ):
+        return None
+    try:
+        raw_comments = await _api_comments(url, settings, client, market)
+    except Exception as exc:
+        logger.warning(f"Comments API failed for {url}; using page comments: {exc}")
+        return None
+    return _to_comments(raw_comments, settings.scrape)
+
+
+def with_api_comments(page: MarketContext, api_comments: Optional[List[Comment]]) -> MarketContext:
+    """``page`` with its comments replaced by the API's, when there are any."""
+    if not api_comments:
+        return page
+    return replace(page, comments=api_comments)
+
+
+async def _page_context(
+    url: str,
+    settings: Settings,
+    client: Optional[httpx.AsyncClient],
+) -> tuple[Optional[str], List[Comment]]:
+    if settings.scrape.streaming:
+        return await _scan_market_page(url, settings, client)
+    html = await _download_html(url, settings, client)
+
+    # Run CPU-bound parsing off the event loop, in a worker process if configured
+    rules, raw_comments = await run_parser("scrape", _parse_html_raw, html, settings.scrape, settings=settings)
+    return rules, _to_comments(raw_comments, settings.scrape)
+
+
+async def _api_comments(
+    url: str,
+    settings: Settings,
+    client: Optional[httpx.AsyncClient],
+    market: Optional[MarketData] = None,
+) -> List[RawComment]:
+    """Page through the gamma comments API for the event or market at ``url``.
+
+    Pages follow ``next_cursor`` when the response carries one and fall back
+    to ``offset`` paging for bare lists. Paging stops at
+    ``ScrapeSettings.max_comments`` usable comments.
+    """
+    if market is None:
+        market = await fetch_market_data(url, settings, client)
+    if market.event_id is not None:
+        entity_type, entity_id = "Event", market.event_id
+    else:
+        entity_type, entity_id = "market", market.market_id
+    params = {
+        "parent_entity_type": entity_type,
+        "parent_entity_id": entity_id,
+        "limit": max(1, settings.scrape.comments_page_size),
+        "order": "createdAt",
+        "ascending": "false",
+    }
+    endpoint = f"{settings.apis.polymarket_base}/comments"
+    close_client = client is None
+    client = client or httpx.AsyncClient(timeout=settings.scrape.timeout_seconds)
+    comments: List[RawComment] = []
+    try:
+        page_params: Optional[dict] = params
+        while page_params is not None and len(comments) < settings.scrape.max_comments:
+            resp = await client.get(endpoint, params=page_params)
+            resp.raise_for_status()
+            items, page_params = _next_comments_page(resp.json(), page_params)
+            for item in items:
+                comment = _node_comment(item, settings.scrape) if isinstance(item, dict) else None
+                if comment is not None:
+                    comments.append(comment)
+                    if len(comments) >= settings.scrape.max_comments:
+                        break
+    finally:
+        if close_client:
+            await client.aclose()
+    return comments
+
+
+def _next_comments_page(payload, params: dict) -> tuple[list, Optional[dict]]:
+    """Split a comments response into its items and the next page's params."""
+    if isinstance(payload, dict):
+        items = payload.get("data") or payload.get("comments") or []
+        cursor = payload.get("next_cursor")
+        if not items or cursor is None or cursor in END_CURSORS:
+            return items, None
+        return items, {**params, "next_cursor": cursor}
+    items = payload if isinstance(payload, list) else []
+    if len(items) < params["limit"]:
+        return items, None
+    return items, {**params, "offset": params.get("offset", 0) + len(items)}
+
+
 def _parse_html_content(html: str, settings: ScrapeSettings) -> tuple[Optional[str], List[Comment]]:
-    """Helper for CPU-bound parsing."""
-    soup = BeautifulSoup(html, "html.parser")
+    """Parse a market page into resolution rules and comments."""
+    rules, raw_comments = _parse_html_raw(html, settings)
+    return rules, _to_comments(raw_comments, settings)
+
+
+def _parse_html_raw(html: str, settings: ScrapeSettings) -> tuple[Optional[str], List[RawComment]]:
+    """Helper for CPU-bound parsing; returns plain tuples so it can run in a worker process.
+
+    Next.js pages are read from their embedded ``__NEXT_DATA__`` JSON; the
+    DOM is only parsed when that blob is missing or holds nothing useful.
+    """
+    data = _extract_next_data(html)
+    if data is not None:
+        rules, comments = _parse_next_data(data, settings)
+        if rules or comments:
+            return rules, comments
+    return _parse_dom(html, settings)
+
+
+def _parse_dom(html: str, settings: ScrapeSettings) -> tuple[Optional[str], List[RawComment]]:
+    soup = BeautifulSoup(html, resolve_html_parser(settings.html_parser))
     rules = _extract_rules(soup)
     comments = _extract_comments(soup, settings)
     return rules, comments
 
 
+def _extract_next_data(html: str) -> Optional[dict]:
+    """Decode the ``<script id="__NEXT_DATA__">`` JSON blob without parsing the page."""
+    marker = html.find(NEXT_DATA_ID)
+    while marker != -1:
+        tag_start = html.rfind("<", 0, marker)
+        # The id must sit inside a <script ...> start tag, not in other text
+        if html.startswith("<script", tag_start) and ">" not in html[tag_start:marker]:
+            body_start = html.find(">", marker) + 1
+            body_end = html.find("</script>", body_start)
+            if body_start == 0 or body_end == -1:
+                return None
+            return _decode_next_data(html[body_start:body_end])
+        marker = html.find(NEXT_DATA_ID, marker + len(NEXT_DATA_ID))
+    return None
+
+
+def _decode_next_data(raw: str) -> Optional[dict]:
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _parse_next_blob(raw: str, settings: ScrapeSettings) -> tuple[Optional[str], List[RawComment]]:
+    """Decode and parse a ``__NEXT_DATA__`` script body; picklable for worker processes."""
+    data = _decode_next_data(raw)
+    if data is None:
+        return None, []
+    return _parse_next_data(data, settings)
+
+
+def _parse_next_data(data: dict, settings: ScrapeSettings) -> tuple[Optional[str], List[RawComment]]:
+    """Pull resolution rules and comments out of decoded ``__NEXT_DATA__``.
+
+    Rules come from the first object carrying both a ``slug`` and a
+    ``description`` (the event or market); comments are objects with a text
+    ``body`` and an ``id`` or ``createdAt``. Once ``max_comments`` are held,
+    further comments are skipped but the walk goes on until rules are found.
+    """
+    rules: Optional[str] = None
+    comments: List[RawComment] = []
+    stack: List[object] = [data]
+    while stack and (rules is None or len(comments) < settings.max_comments):
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
+        description = node.get("description")
+        if rules is None and isinstance(description, str) and description.strip() and "slug" in node:
+            rules = description.strip()
+        if isinstance(node.get("body"), str) and ("id" in node or "createdAt" in node):
+            comment = _node_comment(node, settings) if len(comments) < settings.max_comments else None
+            if comment is not None:
+                comments.append(comment)
+            continue
+        stack.extend(reversed(list(node.values())))
+    return rules, comments
+
+
+def _node_comment(node: dict, settings: ScrapeSettings) -> Optional[RawComment]:
+    """Comment from a Polymarket comment object, as in ``__NEXT_DATA__`` or the comments API."""
+    body = node.get("body")
+    if not isinstance(body, str):
+        return None
+    profile = node.get("profile") if isinstance(node.get("profile"), dict) else {}
+    author = profile.get("name") or profile.get("pseudonym") or node.get("author") or node.get("userAddress")
+    return _raw_comment(" ".join(body.split()), author if isinstance(author, str) else None, settings)
+
+
+@lru_cache(maxsize=None)
+def resolve_html_parser(name: str = "auto") -> str:
+    """Return the BeautifulSoup feature to parse with for the configured backend.
+
+    Any tree builder known to bs4 (``lxml``, ``html5lib``, ``html.parser``)
+    may be named; one that is not installed falls back to ``html.parser``.
+    """
+    if name == "auto":
+        return next(parser for parser in HTML_PARSERS if builder_registry.lookup(parser) is not None)
+    if builder_registry.lookup(name) is None:
+        logger.warning(f"HTML parser {name!r} is not available, using html.parser")
+        return "html.parser"
+    return name
+
+
 async def _download_html(
     url: str,
     settings: Settings,
     client: Optional[httpx.AsyncClient],
 ) -> str:
+    parts: List[str] = []
+
+    async def collect(text: str) -> bool:
+        parts.append(text)
+        return False
+
+    await _read_page(url, settings, client, collect)
+    return "".join(parts)
+
+
+async def _scan_market_page(
+    url: str,
+    settings: Settings,
+    client: Optional[httpx.AsyncClient],
+) -> tuple[Optional[str], List[Comment]]:
+    """Download a page through ``PageScanner``, stopping once it has what it needs.
+
+    A complete ``__NEXT_DATA__`` blob is preferred, as in ``_parse_html_content``.
+    """
+    scanner = PageScanner(settings.scrape.max_comments)
+    loop = asyncio.get_running_loop()
+
+    async def feed(text: str) -> bool:
+        # Scanning is CPU-bound; keep it off the event loop like the DOM parse
+        await loop.run_in_executor(None, scanner.feed, text)
+        return scanner.complete
+
+    await _read_page(url, settings, client, feed)
+    scanner.close()
+    if scanner.next_data is not None:
+        rules, raw_comments = await run_parser(
+            "scrape", _parse_next_blob, scanner.next_data, settings.scrape, settings=settings
+        )
+        if rules or raw_comments:
+            return rules, _to_comments(raw_comments, settings.scrape)
+    raw_comments = [_raw_comment(text, author, settings.scrape) for text, author in scanner.comments()]
+    usable = [comment for comment in raw_comments if comment is not None]
+    return scanner.rules(), _to_comments(usable, settings.scrape)
+
+
+async def _read_page(
+    url: str,
+    settings: Settings,
+    client: Optional[httpx.AsyncClient],
+    consume: Callable[[str], Awaitable[bool]],
+) -> None:
+    """Stream ``url`` into ``consume`` as decoded text.
+
+    Reading stops when ``consume`` returns true or after
+    ``ScrapeSettings.max_bytes``; the rest of the body is never downloaded.
+    """
+    max_bytes = settings.scrape.max_bytes
     close_client = client is None
     client = client or httpx.AsyncClient(timeout=settings.scrape.timeout_seconds)
     try:
-        resp = await client.get(url)
-        resp.raise_for_status()
-        return resp.text
+        async with client.stream("GET", url) as resp:
+            resp.raise_for_status()
+            decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+            received = 0
+            async for chunk in resp.aiter_bytes():
+                if max_bytes and received + len(chunk) >= max_bytes:
+                    await consume(decoder.decode(chunk[: max_bytes - received]))
+                    logger.info(f"Stopped reading {url} at the {max_bytes}-byte cap")
+                    return
+                received += len(chunk)
+                if await consume(decoder.decode(chunk)):
+                    return
+            await consume(decoder.decode(b"", final=True))
     except httpx.HTTPError as exc:
         if settings.app.offline_mode:
-            return ""
+            return
         raise RuntimeError(f"Failed to download market page: {exc}") from exc
     finally:
         if close_client:
@@ -96,10 +412,12 @@ def _extract_rules(soup: BeautifulSoup) -> Optional[str]:
     return None
 
 
-def _extract_comments(soup: BeautifulSoup, settings: ScrapeSettings) -> List[Comment]:
-    raw_comments: List[Comment] = []
+def _extract_comments(soup: BeautifulSoup, settings: ScrapeSettings) -> List[RawComment]:
+    raw_comments: List[RawComment] = []
     candidates = soup.select('[data-testid*="comment"], [class*="Comment"]')
     for node in candidates:
+        if len(raw_comments) >= settings.max_comments:
+            break
         text = node.get_text(" ", strip=True)
         if not text or len(text) < 15:
             continue
@@ -107,22 +425,64 @@ def _extract_comments(soup: BeautifulSoup, settings: ScrapeSettings) -> List[Com
         author_node = node.find(attrs={"data-testid": re.compile("author", re.I)})
         if author_node:
             author = author_node.get_text(" ", strip=True)
-        trimmed = text[:settings.max_comment_chars]
-        sentiment = _heuristic_sentiment(trimmed)
-        mentions_ratio = _mentions_ratio(trimmed)
-        raw_comments.append(
+        raw_comments.append(_raw_comment(text, author, settings))
+    return raw_comments
+
+
+def _raw_comment(text: str, author: Optional[str], settings: ScrapeSettings) -> Optional[RawComment]:
+    if not text or len(text) < 15:
+        return None
+    return text[:settings.max_comment_chars], author
+
+
+def _to_comments(raw_comments: List[RawComment], settings: ScrapeSettings) -> List[Comment]:
+    """Build ``Comment`` objects, dropping repeats of the same author and text."""
+    comments: List[Comment] = []
+    seen = set()
+    unique = []
+    for body, author in raw_comments:
+        comment_id = comment_identity(body, author, settings.identity_key)
+        if comment_id not in seen:
+            seen.add(comment_id)
+            unique.append((comment_id, body, author))
+    scores = score_texts([body for _, body, _ in unique])
+    for (comment_id, body, author), score in zip(unique, scores):
+        comments.append(
             Comment(
-                comment_id=str(uuid.uuid4()),
-                author=_anonymize(author),
-                body=trimmed,
+                comment_id=comment_id,
+                author=_anonymize(author, settings.identity_key),
+                body=body,
                 language="unknown",
-                sentiment=sentiment,
-                mentions_ratio=mentions_ratio,
+                sentiment=score.label,
+                mentions_ratio=score.mentions_ratio,
+                sentiment_score=score.polarity,
             )
         )
-        if len(raw_comments) >= settings.max_comments:
-            break
-    return raw_comments
+    return comments
+
+
+@lru_cache(maxsize=8)
+def _identity_key(secret: str) -> bytes:
+    # blake2b keys are at most 64 bytes; any configured secret is condensed to 32
+    return hashlib.blake2b(secret.encode(), digest_size=32, person=b"polyseek-key").digest()
+
+
+def comment_identity(body: str, author: Optional[str], secret: str = "") -> str:
+    """Content-addressed comment id: the same author and text always map to the same id.
+
+    A keyed blake2b of the whitespace-normalized text and the author, so ids
+    are stable across scrapes and worker processes. Only a secret
+    ``COMMENT_ID_KEY`` stops others from recomputing them from public
+    comments; with the default empty key anyone can link an id (or an
+    author alias) back to its comment.
+    """
+    digest = hashlib.blake2b(
+        f"{author or ''}\x00{' '.join(body.split())}".encode(),
+        digest_size=8,
+        key=_identity_key(secret),
+        person=b"comment-id",
+    )
+    return f"c_{digest.hexdigest()}"
 
 
 def _offline_context() -> MarketContext:
@@ -140,26 +500,9 @@ def _offline_context() -> MarketContext:
     )
 
 
-def _heuristic_sentiment(text: str) -> str:
-    text_lower = text.lower()
-    pro_words = ("yes", "win", "likely", "bull")
-    con_words = ("no", "lose", "unlikely", "bear")
-    pro_score = sum(word in text_lower for word in pro_words)
-    con_score = sum(word in text_lower for word in con_words)
-    if pro_score > con_score:
-        return "pro"
-    if con_score > pro_score:
-        return "con"
-    return "neutral"
-
-
-def _mentions_ratio(text: str) -> float:
-    mentions = len(re.findall(r"@[\w:-]+", text))
-    words = max(len(text.split()), 1)
-    return min(1.0, mentions / words)
-
-
-def _anonymize(author: Optional[str]) -> Optional[str]:
+def _anonymize(author: Optional[str], secret: str = "") -> Optional[str]:
+    """Stable alias for ``author``, keyed like ``comment_identity``."""
     if not author:
         return None
-    return f"user_{abs(hash(author)) % 10000:04d}"
+    digest = hashlib.blake2b(author.encode(), digest_size=4, key=_identity_key(secret), person=b"author-alias")
+    return f"user_{digest.hexdigest()}"
@@ -0,0 +1,75 @@
+"""Lexicon sentiment and mention scoring shared by comments and signals."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence
+
+PRO_WORDS = (
+    "yes", "win", "wins", "winning", "won", "likely", "bull", "bullish",
+    "rise", "rises", "rising", "rose", "approve", "approves", "approved", "approval",
+    "gain", "gains", "gained",
+)
+CON_WORDS = (
+    "no", "lose", "loses", "losing", "lost", "unlikely", "bear", "bearish",
+    "fall", "falls", "falling", "fell", "reject", "rejects", "rejected", "rejection",
+    "decline", "declines", "declined",
+)
+
+
+@dataclass(frozen=True)
+class TextScore:
+    # (pro - con) / (pro + con) over lexicon hits; 0.0 when there are none
+    polarity: float
+    label: str
+    mentions_ratio: float
+
+
+# A mention is one token, so "@likely" counts as a mention and not a pro word
+_TOKEN = re.compile(r"@[\w:-]+|\w+")
+
+
+class LexiconScorer:
+    """Scores texts against a pro/con lexicon with whole-word matching.
+
+    Each text is lowercased and split into word and ``@mention`` tokens once,
+    and every word is looked up in a dict, so "no" does not match inside
+    "know". On the fixture comments (``scripts/bench_sentiment.py``) this
+    is faster than one compiled alternation over the whole lexicon.
+    """
+
+    def __init__(self, pro_words: Iterable[str], con_words: Iterable[str]):
+        self._weights = {word.lower(): 1 for word in pro_words}
+        self._weights.update({word.lower(): -1 for word in con_words})
+
+    def score(self, text: str) -> TextScore:
+        pro_hits = con_hits = mention_hits = 0
+        weights = self._weights
+        for token in _TOKEN.findall(text.lower()):
+            if token[0] == "@":
+                mention_hits += 1
+                continue
+            weight = weights.get(token)
+            if weight is None:
+                continue
+            if weight > 0:
+                pro_hits += 1
+            else:
+                con_hits += 1
+        hits = pro_hits + con_hits
+        polarity = (pro_hits - con_hits) / hits if hits else 0.0
+        label = "pro" if polarity > 0 else "con" if polarity < 0 else "neutral"
+        ratio = min(1.0, mention_hits / max(len(text.split()), 1))
+        return TextScore(round(polarity, 4), label, ratio)
+
+    def score_many(self, texts: Sequence[str]) -> List[TextScore]:
+        return [self.score(text) for text in texts]
+
+
+DEFAULT_SCORER = LexiconScorer(PRO_WORDS, CON_WORDS)
+
+
+def score_texts(texts: Sequence[str]) -> List[TextScore]:
+    """Score ``texts`` with the shared lexicon."""
+    return DEFAULT_SCORER.score_many(texts)
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import datetime as dt
+import time
 import urllib.parse
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Protocol
+from typing import TYPE_CHECKING, Iterable, List, Optional, Protocol, Tuple
 
 import httpx
 
@@ -16,6 +17,12 @@ except ImportError:
 
 from .config import Settings, load_settings
 from .fetch_market import MarketData
+from .metrics import PROVIDER_ERRORS, PROVIDER_LATENCY
+from .parse_pool import run_parser
+from .sentiment import score_texts
+
+if TYPE_CHECKING:
+    from .http_clients import HTTPClientRegistry
 
 
 @dataclass
@@ -30,6 +37,10 @@ class SignalRecord:
     credibility_score: float
     engagement: Optional[int] = None
     language: str = "en"
+    # Lexicon polarity behind ``sentiment``, from -1 (con) to 1 (pro)
+    sentiment_score: float = 0.0
+    # Near-duplicates of this record collapsed into it, itself included
+    duplicate_count: int = 1
 
 
 class SignalProvider(Protocol):
@@ -39,9 +50,15 @@ class SignalProvider(Protocol):
 class TwitterSignalProvider:
     """Twitter/X API v2 integration for real-time social signals."""
 
-    def __init__(self, bearer_token: Optional[str], max_results: int = 10):
+    def __init__(
+        self,
+        bearer_token: Optional[str],
+        max_results: int = 10,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.bearer_token = bearer_token
         self.max_results = max_results
+        self.client = client
         self.api_base = "https://api.twitter.com/2"
 
     @property
@@ -76,16 +93,22 @@ class TwitterSignalProvider:
         }
         
         records: List[SignalRecord] = []
+        close_client = self.client is None
+        client = self.client or httpx.AsyncClient(timeout=10)
         try:
-            async with httpx.AsyncClient(timeout=10) as client:
+            try:
                 resp = await client.get(url, headers=headers, params=params)
                 resp.raise_for_status()
                 data = resp.json()
+            finally:
+                if close_client:
+                    await client.aclose()
             
             tweets = data.get("data", [])
             users = {u["id"]: u for u in data.get("includes", {}).get("users", [])}
             
-            for tweet in tweets:
+            scores = score_texts([tweet.get("text", "") for tweet in tweets])
+            for tweet, score in zip(tweets, scores):
                 author_id = tweet.get("author_id")
                 author = users.get(author_id, {})
                 username = author.get("username", "unknown")
@@ -127,7 +150,8 @@ class TwitterSignalProvider:
                         url=tweet_url,
                         snippet=text[:280],
                         timestamp=timestamp,
-                        sentiment=_heuristic_sentiment(text),
+                        sentiment=score.label,
+                        sentiment_score=score.polarity,
                         credibility_score=min(credibility, 1.0),
                         engagement=engagement,
                         language=tweet.get("lang", "en"),
@@ -152,8 +176,15 @@ class RSSSignalProvider:
     Supports multiple RSS sources including Google News and major news sites.
     """
 
-    def __init__(self, max_results: int = 10):
+    def __init__(
+        self,
+        max_results: int = 10,
+        client: Optional[httpx.AsyncClient] = None,
+        settings: Optional[Settings] = None,
+    ):
         self.max_results = max_results
+        self.client = client
+        self.settings = settings
         # Multiple RSS sources for comprehensive coverage
         self.rss_sources = [
             # Google News RSS (query-based)
@@ -227,39 +258,31 @@ class RSSSignalProvider:
         try:
             # Use httpx to fetch RSS (with SSL verification disabled for compatibility)
             # Note: In production, you might want to handle SSL properly
-            async with httpx.AsyncClient(timeout=15, verify=False, follow_redirects=True) as client:
+            close_client = self.client is None
+            client = self.client or httpx.AsyncClient(timeout=15, verify=False, follow_redirects=True)
+            try:
                 resp = await client.get(rss_url, headers={"User-Agent": "Mozilla/5.0"})
                 resp.raise_for_status()
                 rss_content = resp.text
+            finally:
+                if close_client:
+                    await client.aclose()
             
-            # Parse RSS content with feedparser
-            import asyncio
-            loop = asyncio.get_event_loop()
-            feed = await loop.run_in_executor(None, feedparser.parse, rss_content)
-            
-            # Check if parsing was successful
-            if feed.bozo and feed.bozo_exception:
-                # Log but continue - sometimes feedparser reports bozo but still has entries
-                if "SSL" not in str(feed.bozo_exception) and "certificate" not in str(feed.bozo_exception).lower():
-                    # Only skip if it's not an SSL error (we already handled that)
-                    if not feed.entries:
-                        return records  # Skip feeds with no entries
-            
-            feed_title = feed.feed.get("title", source_name) or source_name
+            # Parse RSS content with feedparser, off the event loop
+            feed_title, entries = await run_parser(
+                "rss", _parse_feed, rss_content, self.max_results, settings=self.settings
+            )
+            feed_title = feed_title or source_name
             
-            for entry in feed.entries[:self.max_results]:
-                published = entry.get("published_parsed")
+            scores = score_texts([snippet for _, _, snippet, _ in entries])
+            for (title, link, snippet, published), score in zip(entries, scores):
                 timestamp = None
                 if published:
                     try:
-                        timestamp = dt.datetime(*published[:6], tzinfo=dt.timezone.utc)
+                        timestamp = dt.datetime(*published, tzinfo=dt.timezone.utc)
                     except (ValueError, TypeError):
                         timestamp = None
                 
-                snippet = (entry.get("summary", "") or entry.get("description", "") or entry.get("title", ""))[:280]
-                title = entry.get("title", "Untitled")
-                link = entry.get("link", "")
-                
                 # Clean up Google News links (they're redirects)
                 if "news.google.com" in link:
                     # Try to extract actual URL from Google News redirect
@@ -273,7 +296,8 @@ class RSSSignalProvider:
                         url=link,
                         snippet=snippet,
                         timestamp=timestamp,
-                        sentiment=_heuristic_sentiment(snippet),
+                        sentiment=score.label,
+                        sentiment_score=score.polarity,
                         credibility_score=0.75,  # RSS feeds are generally reliable
                     )
                 )
@@ -284,13 +308,50 @@ class RSSSignalProvider:
         return records
 
 
+# (title, link, snippet, published[:6]) of one feed entry
+FeedEntry = Tuple[str, str, str, Optional[Tuple[int, ...]]]
+
+
+def _parse_feed(content: str, max_results: int) -> Tuple[Optional[str], List[FeedEntry]]:
+    """Parse an RSS document into plain tuples, so it can run in a worker process."""
+    feed = feedparser.parse(content)
+    
+    # Check if parsing was successful
+    if feed.bozo and feed.bozo_exception:
+        # Log but continue - sometimes feedparser reports bozo but still has entries
+        if "SSL" not in str(feed.bozo_exception) and "certificate" not in str(feed.bozo_exception).lower():
+            # Only skip if it's not an SSL error (we already handled that)
+            if not feed.entries:
+                return None, []  # Skip feeds with no entries
+    
+    entries: List[FeedEntry] = []
+    for entry in feed.entries[:max_results]:
+        published = entry.get("published_parsed")
+        entries.append(
+            (
+                entry.get("title", "Untitled"),
+                entry.get("link", ""),
+                (entry.get("summary", "") or entry.get("description", "") or entry.get("title", ""))[:280],
+                tuple(published[:6]) if published else None,
+            )
+        )
+    return feed.feed.get("title"), entries
+
+
 class NewsAPISignalProvider:
     """Thin wrapper around newsapi.org/v2/everything."""
 
-    def __init__(self, api_key: Optional[str], window_days: int = 30, max_results: int = 5):
+    def __init__(
+        self,
+        api_key: Optional[str],
+        window_days: int = 30,
+        max_results: int = 5,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.api_key = api_key
         self.window_days = window_days
         self.max_results = max_results
+        self.client = client
 
     @property
     def available(self) -> bool:
@@ -308,13 +369,19 @@ class NewsAPISignalProvider:
         }
         if self.window_days:
             params["from"] = (dt.datetime.utcnow() - dt.timedelta(days=self.window_days)).strftime("%Y-%m-%d")
-        async with httpx.AsyncClient(timeout=10) as client:
+        close_client = self.client is None
+        client = self.client or httpx.AsyncClient(timeout=10)
+        try:
             resp = await client.get(url, params=params, headers={"X-Api-Key": self.api_key})
             resp.raise_for_status()
             data = resp.json()
+        finally:
+            if close_client:
+                await client.aclose()
         articles = data.get("articles") or []
         records: List[SignalRecord] = []
-        for article in articles:
+        snippets = [(article.get("description") or article.get("content") or "")[:280] for article in articles]
+        for article, snippet, score in zip(articles, snippets, score_texts(snippets)):
             published = article.get("publishedAt")
             timestamp = None
             if published:
@@ -322,7 +389,6 @@ class NewsAPISignalProvider:
                     timestamp = dt.datetime.fromisoformat(published.replace("Z", "+00:00"))
                 except ValueError:
                     timestamp = None
-            snippet = (article.get("description") or article.get("content") or "")[:280]
             records.append(
                 SignalRecord(
                     source=article.get("source", {}).get("name") or "newsapi",
@@ -331,7 +397,8 @@ class NewsAPISignalProvider:
                     url=article.get("url") or "",
                     snippet=snippet,
                     timestamp=timestamp,
-                    sentiment=_heuristic_sentiment(snippet),
+                    sentiment=score.label,
+                    sentiment_score=score.polarity,
                     credibility_score=0.8,
                 )
             )
@@ -342,28 +409,30 @@ async def gather_signals(
     market: MarketData,
     settings: Optional[Settings] = None,
     extra_providers: Optional[Iterable[SignalProvider]] = None,
+    clients: Optional[HTTPClientRegistry] = None,
 ) -> List[SignalRecord]:
-    """Fetch external signals using the configured providers."""
+    """Fetch external signals using the configured providers.
+
+    When ``clients`` is given, providers reuse its pooled connections instead of
+    opening a fresh client per request.
+    """
     settings = settings or load_settings()
     query = _build_query(market)
     providers: List[SignalProvider] = []
     if settings.app.offline_mode:
         return _offline_signals(market)
     
-    # News API provider
-    news_provider = NewsAPISignalProvider(settings.apis.news_api_key)
-    if news_provider.available:
-        providers.append(news_provider)
-    
-    # Twitter/X API provider
-    twitter_provider = TwitterSignalProvider(settings.apis.x_bearer_token)
-    if twitter_provider.available:
-        providers.append(twitter_provider)
-    
-    # RSS Feed provider (completely free, no API key needed)
-    rss_provider = RSSSignalProvider()
-    if rss_provider.available:
-        providers.append(rss_provider)
+    # Providers are checked for availability before their pooled client is
+    # opened, so unconfigured providers never open a connection pool
+    candidates = (
+        ("newsapi", NewsAPISignalProvider(settings.apis.news_api_key)),  # News API
+        ("twitter", TwitterSignalProvider(settings.apis.x_bearer_token)),  # Twitter/X API
+        ("rss", RSSSignalProvider(settings=settings)),  # RSS feeds (free, no API key needed)
+    )
+    for upstream, provider in candidates:
+        if provider.available:
+            provider.client = clients.get(upstream) if clients else None
+            providers.append(provider)
     
     # Extra providers (for extensibility)
     if extra_providers:
@@ -371,10 +440,15 @@ async def gather_signals(
 
     records: List[SignalRecord] = []
     for provider in providers:
+        name = provider.__class__.__name__
+        started = time.perf_counter()
         try:
             records.extend(await provider.search(query))
         except Exception as exc:  # pragma: no cover - defensive logging
-            print(f"[signals] provider {provider.__class__.__name__} failed: {exc}")
+            PROVIDER_ERRORS.inc(provider=name)
+            print(f"[signals] provider {name} failed: {exc}")
+        finally:
+            PROVIDER_LATENCY.observe(time.perf_counter() - started, provider=name)
     return records
 
 
@@ -390,15 +464,6 @@ def _build_query(market: MarketData) -> str:
     return query.strip()
 
 
-def _heuristic_sentiment(text: str) -> str:
-    lowered = (text or "").lower()
-    if any(word in lowered for word in ("rise", "win", "approve", "gain")):
-        return "pro"
-    if any(word in lowered for word in ("fall", "lose", "reject", "decline")):
-        return "con"
-    return "neutral"
-
-
 def _offline_signals(market: MarketData) -> List[SignalRecord]:
     return [
         SignalRecord(
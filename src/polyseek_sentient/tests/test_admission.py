@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from polyseek_sentient.admission import AdmissionController, AdmissionRejected
+
+
+def test_admission_queues_then_rejects_when_full():
+    async def main():
+        controller = AdmissionController("test", max_concurrent=1, max_queue=1, retry_after=7)
+        first = await controller.acquire()
+        queued = asyncio.create_task(controller.acquire())
+        await asyncio.sleep(0)
+        assert controller.waiting == 1
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire()
+        assert rejected.value.status_code == 429
+        assert rejected.value.retry_after == 7
+
+        first.release()
+        second = await queued
+        assert controller.active == 1 and controller.waiting == 0
+        second.release()
+        assert controller.active == 0
+
+    asyncio.run(main())
+
+
+def test_admission_times_out_queued_callers():
+    async def main():
+        controller = AdmissionController("test", max_concurrent=1, max_queue=4, queue_timeout=0.01)
+        held = await controller.acquire()
+        with pytest.raises(AdmissionRejected) as rejected:
+            await controller.acquire()
+        assert rejected.value.status_code == 503
+        assert controller.waiting == 0
+        held.release()
+        assert controller.active == 0
+
+    asyncio.run(main())
+
+
+def test_stream_takes_its_slot_only_when_it_starts_the_flight(monkeypatch):
+    from fastapi import HTTPException
+
+    from polyseek_sentient import main as app_main
+
+    async def main():
+        before = app_main._admission.active
+        # The client went away before the body was sent: no producer, no slot
+        await app_main._stream_agent('{"market_url": "https://polymarket.com/event/never-read"}')
+        assert app_main._admission.active == before
+
+        full = AdmissionController("test", max_concurrent=1, max_queue=0)
+        await full.acquire()
+        monkeypatch.setattr(app_main, "_admission", full)
+        with pytest.raises(HTTPException) as rejected:
+            await app_main._stream_agent('{"market_url": "https://polymarket.com/event/busy"}')
+        assert rejected.value.status_code == 429 and full.active == 1
+
+    asyncio.run(main())
@@ -0,0 +1,26 @@
+import asyncio
+
+from polyseek_sentient.batch import map_unordered
+
+
+def test_map_unordered_bounds_concurrency_and_isolates_errors():
+    active = []
+    peak = []
+
+    async def work(item):
+        active.append(item)
+        peak.append(len(active))
+        await asyncio.sleep(0.01 * item)
+        active.remove(item)
+        if item == 3:
+            raise ValueError("bad market")
+        return item * 10
+
+    async def main():
+        return [entry async for entry in map_unordered([4, 3, 2, 1], work, concurrency=2)]
+
+    results = asyncio.run(main())
+    assert max(peak) == 2
+    by_index = {index: result for index, _, result in results}
+    assert by_index[0] == 40 and by_index[2] == 20 and by_index[3] == 10
+    assert isinstance(by_index[1], ValueError)
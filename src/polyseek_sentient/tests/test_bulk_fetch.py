@@ -0,0 +1,78 @@
+import asyncio
+
+import httpx
+
+from polyseek_sentient.config import Settings
+from polyseek_sentient.fetch_market import MarketFetchError, fetch_markets_bulk
+from polyseek_sentient.market_cache import MarketMetadataCache, SlugKindMemo
+
+
+class _Clients:
+    def __init__(self, handler):
+        self._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    def get(self, upstream):
+        return self._client
+
+
+def test_bulk_fetch_batches_by_source_and_isolates_missing_markets():
+    requests = []
+
+    def handler(request):
+        requests.append((request.url.host, request.url.path))
+        params = request.url.params
+        if request.url.path == "/events":
+            return httpx.Response(200, json=[{
+                "slug": "big-event",
+                "title": "Big event",
+                "markets": [{"id": 1, "active": True, "outcomes": '["Yes","No"]', "outcomePrices": '["0.7","0.3"]'}],
+            }])
+        if request.url.path == "/markets":
+            assert sorted(params.get_list("slug")) == ["nowhere", "plain-market"]
+            return httpx.Response(200, json=[{"id": 2, "slug": "plain-market", "question": "Plain?"}])
+        assert params["tickers"].split(",") == ["ABC-1", "XYZ-9"]
+        return httpx.Response(200, json={"markets": [{"ticker": "ABC-1", "title": "ABC"}]})
+
+    urls = [
+        "https://polymarket.com/event/big-event",
+        "https://polymarket.com/market/plain-market",
+        "https://polymarket.com/event/nowhere",
+        "https://kalshi.com/markets/abc-1",
+        "https://kalshi.com/markets/xyz-9",
+        "https://example.com/not-a-market",
+    ]
+    # Private cache and memo, so earlier tests cannot pre-resolve any of these
+    cache = MarketMetadataCache(fresh_seconds=60, stale_seconds=0)
+    results = asyncio.run(fetch_markets_bulk(urls, Settings(), _Clients(handler), cache=cache, memo=SlugKindMemo()))
+
+    assert results[urls[0]].prices.yes == 0.7
+    assert results[urls[1]].title == "Plain?"
+    assert results[urls[3]].title == "ABC" and results[urls[3]].url == urls[3]
+    for url in (urls[2], urls[4], urls[5]):
+        assert isinstance(results[url], MarketFetchError)
+    # One /events query, one /markets fallback and one Kalshi listing
+    assert len(requests) == 3
+    stats = cache.stats()
+    assert stats["prefetch_misses"] == 5 and stats["misses"] == 0 and stats["entries"] == 3
+
+
+def test_malformed_kalshi_payload_fails_only_the_kalshi_urls():
+    def handler(request):
+        if request.url.path == "/events":
+            return httpx.Response(200, json=[{"slug": "big-event", "title": "Big event", "markets": [{"id": 1}]}])
+        if request.url.params["tickers"] == "ABC-1":
+            return httpx.Response(200, json=["not", "an", "object"])
+        return httpx.Response(200, text="<html>maintenance</html>")
+
+    urls = ["https://polymarket.com/event/big-event", "https://kalshi.com/markets/abc-1"]
+    settings = Settings()
+    cache = MarketMetadataCache(fresh_seconds=60)
+
+    results = asyncio.run(fetch_markets_bulk(urls, settings, _Clients(handler), cache=cache, memo=SlugKindMemo()))
+    assert results[urls[0]].title == "Big event"
+    assert isinstance(results[urls[1]], MarketFetchError) and "JSON object" in str(results[urls[1]])
+
+    broken = asyncio.run(
+        fetch_markets_bulk(["https://kalshi.com/markets/xyz-9"], settings, _Clients(handler), cache=cache, memo=SlugKindMemo())
+    )
+    assert isinstance(broken["https://kalshi.com/markets/xyz-9"], MarketFetchError)
@@ -0,0 +1,44 @@
+import asyncio
+
+from polyseek_sentient.coalesce import SingleFlight, StreamCoalescer
+
+
+def test_single_flight_shares_one_computation():
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "verdict"
+
+    async def main():
+        flights = SingleFlight()
+        results = await asyncio.gather(*(flights.do("key", compute) for _ in range(5)))
+        assert flights.in_flight() == 0
+        return results
+
+    assert asyncio.run(main()) == ["verdict"] * 5
+    assert len(calls) == 1
+
+
+def test_stream_late_joiner_replays_events():
+    calls = []
+
+    async def produce(broadcast):
+        calls.append(1)
+        await broadcast.put("first")
+        await asyncio.sleep(0.02)
+        await broadcast.put("second")
+        await broadcast.put(None)
+
+    async def collect(coalescer, delay):
+        await asyncio.sleep(delay)
+        return [item async for item in coalescer.subscribe("key", produce)]
+
+    async def main():
+        coalescer = StreamCoalescer()
+        return await asyncio.gather(collect(coalescer, 0), collect(coalescer, 0.01))
+
+    early, late = asyncio.run(main())
+    assert early == late == ["first", "second"]
+    assert len(calls) == 1
@@ -0,0 +1,109 @@
+import asyncio
+import dataclasses
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from polyseek_sentient.config import APISettings, CacheSettings, ScrapeSettings, Settings
+from polyseek_sentient import scrape_context
+from polyseek_sentient.scrape_context import Comment, _api_comments, _next_comments_page, fetch_market_context
+
+EVENT = [{"id": 9, "slug": "who-wins", "title": "Who wins?", "markets": [{"id": 1, "outcomePrices": ["0.5", "0.5"]}]}]
+
+
+def _page(number):
+    bodies = [f"Comment number {number}-{index} with enough text" for index in range(2)]
+    if number == 1:
+        bodies[0] = "too short"
+    return [{"id": f"{number}-{index}", "body": body, "profile": {"name": f"user{index}"}} for index, body in enumerate(bodies)]
+
+
+class _GammaStandIn(BaseHTTPRequestHandler):
+    """Serves ``/events`` and cursor-paged ``/comments`` like the gamma API."""
+
+    requests = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.requests.append((url.path, query))
+        if url.path == "/events":
+            payload = EVENT if query.get("slug") == "who-wins" else []
+        else:
+            assert query["parent_entity_type"] == "Event" and query["parent_entity_id"] == "9"
+            number = int(query.get("next_cursor", "1"))
+            payload = {"data": _page(number), "next_cursor": str(number + 1) if number < 5 else "LTE="}
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_comments_api_pages_with_cursors_and_stops_at_max_comments():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GammaStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        settings = Settings(
+            apis=dataclasses.replace(APISettings(), polymarket_base=f"http://127.0.0.1:{server.server_port}"),
+            scrape=dataclasses.replace(ScrapeSettings(), max_comments=5, comments_page_size=2),
+            cache=dataclasses.replace(CacheSettings(), market_ttl_seconds=0),
+        )
+        comments = asyncio.run(_api_comments("https://polymarket.com/event/who-wins", settings, None))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [body for body, _ in comments] == [
+        "Comment number 1-1 with enough text",
+        "Comment number 2-0 with enough text",
+        "Comment number 2-1 with enough text",
+        "Comment number 3-0 with enough text",
+        "Comment number 3-1 with enough text",
+    ]
+    assert comments[0][1] == "user1"
+    pages = [query for path, query in _GammaStandIn.requests if path == "/comments"]
+    assert [query.get("next_cursor") for query in pages] == [None, "2", "3"]
+    assert all(query["limit"] == "2" for query in pages)
+
+
+def test_bare_list_responses_page_by_offset():
+    params = {"limit": 2}
+    items, following = _next_comments_page([{"body": "a"}, {"body": "b"}], params)
+    assert len(items) == 2 and following == {"limit": 2, "offset": 2}
+    assert _next_comments_page([{"body": "c"}], following) == ([{"body": "c"}], None)
+    assert _next_comments_page({"data": [{"body": "d"}], "next_cursor": "LTE="}, params)[1] is None
+
+
+@pytest.mark.parametrize("api_result", [[("Comment from the comments API", "amy")], [], RuntimeError("down")])
+def test_page_is_scanned_once_and_its_comments_back_up_the_api(monkeypatch, api_result):
+    scans, markets = [], []
+    known_market = object()
+
+    async def page_context(url, settings, client):
+        scans.append(url)
+        return "Rules", [Comment("c_1", None, "Comment from the page", "unknown", "neutral", 0.0)]
+
+    async def api_comments(url, settings, client, market=None):
+        markets.append(market)
+        if isinstance(api_result, Exception):
+            raise api_result
+        return api_result
+
+    monkeypatch.setattr(scrape_context, "_page_context", page_context)
+    monkeypatch.setattr(scrape_context, "_api_comments", api_comments)
+    context = asyncio.run(
+        fetch_market_context("https://polymarket.com/event/who-wins", Settings(), market=known_market)
+    )
+
+    assert context.resolution_rules == "Rules"
+    assert len(scans) == 1 and markets == [known_market]
+    expected = "Comment from the comments API" if api_result and not isinstance(api_result, Exception) else "Comment from the page"
+    assert [c.body for c in context.comments] == [expected]
@@ -0,0 +1,101 @@
+import datetime as dt
+
+from polyseek_sentient.analysis_agent import (
+    COMMENTS_LEGEND,
+    SIGNALS_LEGEND,
+    AnalysisRequest,
+    _build_user_prompt,
+    _collapse_evidence,
+)
+from polyseek_sentient.config import DedupSettings
+from polyseek_sentient.dedup import collapse_near_duplicates, max_distance, simhash
+from polyseek_sentient.fetch_market import _parse_polymarket_events
+from polyseek_sentient.scrape_context import Comment, MarketContext
+from polyseek_sentient.sentiment import score_texts
+from polyseek_sentient.signals_client import SignalRecord
+
+STORY = "Trump wins Pennsylvania primary as turnout surges - Reuters"
+
+
+def _signal(title, url):
+    return SignalRecord(
+        source="Google News RSS",
+        source_type="news",
+        title=title,
+        url=url,
+        snippet="",
+        timestamp=dt.datetime(2024, 4, 23),
+        sentiment="pro",
+        credibility_score=0.75,
+        sentiment_score=1.0,
+    )
+
+
+def _comment(comment_id, body, sentiment="pro"):
+    return Comment(comment_id, "user_1", body, "unknown", sentiment, 0.0)
+
+
+def test_simhash_ignores_case_and_punctuation():
+    assert simhash(STORY) == simhash("trump WINS pennsylvania primary, as turnout surges!! | reuters")
+    assert (simhash(STORY) ^ simhash("Senate passes the crypto market structure bill")).bit_count() > 20
+    assert max_distance(1.0) == 0 and max_distance(0.85) == 9
+
+
+def test_collapse_keeps_first_copy_and_distinct_items_in_order():
+    texts = [
+        STORY,
+        "Senate passes the crypto market structure bill",
+        "Trump wins Pennsylvania primary as turnout surges",
+        "Trump loses Pennsylvania primary as turnout surges - Reuters",
+        "TRUMP WINS PENNSYLVANIA PRIMARY AS TURNOUT SURGES - REUTERS",
+    ]
+    groups = collapse_near_duplicates(texts, str, similarity=0.85)
+
+    assert [group[0] for group in groups] == [texts[0], texts[1], texts[3]]
+    assert groups[0] == [texts[0], texts[2], texts[4]]
+    assert len(collapse_near_duplicates(texts, str, similarity=1.0)) == 4
+    assert collapse_near_duplicates([], str) == []
+
+
+def test_opposite_stances_and_short_texts_stay_apart():
+    yes, no = "I think YES will win this market easily", "I think NO will win this market easily"
+    assert len(collapse_near_duplicates([yes, no], str, similarity=0.85)) == 1
+    labelled = [(text, score.label) for text, score in zip([yes, no], score_texts([yes, no]))]
+    assert len(collapse_near_duplicates(labelled, lambda item: item[0], 0.85, key=lambda item: item[1])) == 2
+
+    market = _parse_polymarket_events(
+        [{"id": 9, "slug": "pa", "title": "PA primary", "markets": [{"id": 1, "outcomePrices": ["0.5", "0.5"]}]}],
+        "pa",
+        "https://polymarket.com/event/pa",
+    )
+    comments = [_comment("c_1", "Very bullish on this one", "pro"), _comment("c_2", "Very bearish on this one", "con")]
+    request = AnalysisRequest(market, MarketContext("Rules", comments), [], "quick", "neutral")
+    assert len(_collapse_evidence(request, DedupSettings(enabled=True, similarity=0.5)).context.comments) == 2
+
+    short = ["Buy yes now", "buy YES now!", "Buy yes today"]
+    assert collapse_near_duplicates(short, str, similarity=0.5) == [short[:2], short[2:]]
+
+
+def test_collapsed_evidence_is_prompted_once_with_a_count():
+    market = _parse_polymarket_events(
+        [{"id": 9, "slug": "pa", "title": "PA primary", "markets": [{"id": 1, "outcomePrices": ["0.5", "0.5"]}]}],
+        "pa",
+        "https://polymarket.com/event/pa",
+    )
+    comments = [
+        _comment("c_1", "Trump is going to win this one easily"),
+        _comment("c_2", "trump is going to win this one, easily!"),
+    ]
+    signals = [_signal(STORY, "https://a.example/1"), _signal(STORY + "!", "https://b.example/2")]
+    request = AnalysisRequest(market, MarketContext("Rules", comments), signals, "quick", "neutral")
+
+    collapsed = _collapse_evidence(request, DedupSettings(enabled=True, similarity=0.85))
+    prompt = _build_user_prompt(collapsed)
+
+    assert [c.duplicate_count for c in collapsed.context.comments] == [2]
+    assert [s.url for s in collapsed.signals] == ["https://a.example/1"]
+    assert "[c_1] (x2)" in prompt and "c_2" not in prompt
+    assert f"PLATFORM COMMENTS {COMMENTS_LEGEND}:" in prompt and f"EXTERNAL SIGNALS {SIGNALS_LEGEND}:" in prompt
+    assert "[pro +1.00] (x2) (https://a.example/1)" in prompt and "b.example" not in prompt
+    assert len(request.signals) == 2
+    assert _collapse_evidence(request, DedupSettings(enabled=False)) is request
@@ -0,0 +1,55 @@
+import asyncio
+
+from polyseek_sentient.analysis_agent import AnalysisRequest, _reconcile_outcomes, run_analysis
+from polyseek_sentient.config import AppSettings, Settings
+from polyseek_sentient.fetch_market import _parse_polymarket_events
+from polyseek_sentient.report_formatter import format_response
+from polyseek_sentient.scrape_context import MarketContext
+
+EVENT = {
+    "id": 9,
+    "slug": "who-wins",
+    "title": "Who wins?",
+    "negRisk": True,
+    "markets": [
+        {"id": 1, "groupItemTitle": "Alice", "active": True, "outcomes": ["Yes", "No"], "outcomePrices": ["0.30", "0.70"]},
+        {"id": 2, "groupItemTitle": "Bob", "active": True, "outcomes": ["Yes", "No"], "outcomePrices": ["0.60", "0.40"]},
+        {"id": 3, "groupItemTitle": "Carol", "active": True, "outcomes": ["Yes", "No"], "outcomePrices": ["0.10", "0.90"]},
+    ],
+}
+
+
+def _market():
+    return _parse_polymarket_events([EVENT], "who-wins", "https://polymarket.com/event/who-wins")
+
+
+def test_reconcile_outcomes_matches_labels_and_fills_gaps():
+    llm_outcomes = [
+        {"label": "alice ", "verdict": "YES", "probability_pct": 55, "rationale": "Polling lead."},
+        {"label": "Dave", "verdict": "NO", "probability_pct": 5},
+        {"label": "Carol", "probability_pct": "n/a"},
+    ]
+    rows = _reconcile_outcomes(llm_outcomes, _market().event)
+
+    assert [row["label"] for row in rows] == ["Bob", "Alice", "Carol"]
+    bob, alice, carol = rows
+    assert alice["probability_pct"] == 55 and alice["verdict"] == "YES" and alice["market_id"] == "1"
+    assert bob["verdict"] == "UNCERTAIN" and round(bob["probability_pct"], 1) == 60.0
+    assert carol["rationale"].startswith("Not assessed")
+
+
+def test_offline_event_analysis_renders_outcome_table():
+    request = AnalysisRequest(
+        market=_market(),
+        context=MarketContext(resolution_rules=None, comments=[]),
+        signals=[],
+        depth="event",
+        perspective="neutral",
+    )
+    payload = asyncio.run(run_analysis(request, Settings(app=AppSettings(offline_mode=True))))
+    model, markdown = format_response(payload)
+
+    assert len(model.outcomes) == 3
+    assert model.outcomes[0].label == "Bob" and model.outcomes[0].market_price == 0.6
+    assert "#### Outcomes" in markdown
+    assert "| Bob | UNCERTAIN | 60.0% | 60.0% |" in markdown
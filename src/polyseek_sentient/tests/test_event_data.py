@@ -0,0 +1,35 @@
+import math
+
+from polyseek_sentient.fetch_market import _parse_polymarket_events
+
+EVENT = {
+    "id": 9,
+    "slug": "who-wins",
+    "title": "Who wins?",
+    "negRisk": True,
+    "markets": [
+        {"id": 1, "groupItemTitle": "Alice", "active": True, "volume24hr": "1200",
+         "outcomes": '["Yes","No"]', "outcomePrices": '["0.55","0.47"]'},
+        {"id": 2, "groupItemTitle": "Bob", "active": True,
+         "outcomes": ["Yes", "No"], "outcomePrices": ["0.40", "0.61"]},
+        {"id": 3, "groupItemTitle": "Carol", "active": False, "outcomes": "[]", "outcomePrices": "[]"},
+    ],
+}
+
+
+def test_event_outcome_table_and_probability_helpers():
+    market = _parse_polymarket_events([EVENT], "who-wins", "https://polymarket.com/event/who-wins")
+    event = market.event
+
+    assert market.prices.yes == 0.55
+    assert len(event) == 3 and event.labels == ["Alice", "Bob", "Carol"]
+    assert list(event.outcome_market) == [0, 0, 1, 1]
+    assert event.market_outcomes(1) == [("Yes", 0.40), ("No", 0.61)]
+    assert math.isnan(event.yes_prices[2])
+
+    assert math.isclose(event.overround(), -0.05)
+    probabilities = event.implied_probabilities()
+    assert math.isclose(probabilities[0] + probabilities[1], 1.0)
+    assert [round(x, 2) for x in event.market_overrounds()] == [0.02, 0.01, -1.0]
+    assert event.top_markets(1) == [("Alice", 0.55)]
+    assert event.to_dict()["markets"][2]["yes_price"] is None
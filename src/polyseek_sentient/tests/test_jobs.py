@@ -0,0 +1,78 @@
+import asyncio
+import dataclasses
+
+from polyseek_sentient import main as app_main
+from polyseek_sentient.config import JobSettings, Settings
+from polyseek_sentient.jobs import FAILED, QUEUED, RUNNING, SUCCEEDED, JobStore, JobWorkerPool
+
+
+def test_worker_pool_runs_jobs_and_records_stages(tmp_path):
+    async def handler(job, progress):
+        await progress("market", {"title": job.request["market_url"]})
+        if job.request["market_url"] == "bad":
+            raise ValueError("no such market")
+        return {"verdict": "YES"}
+
+    async def main():
+        pool = JobWorkerPool(JobStore(str(tmp_path / "jobs.sqlite")), handler, workers=2)
+        await pool.start()
+        good = await pool.submit({"market_url": "good"})
+        bad = await pool.submit({"market_url": "bad"})
+        for _ in range(100):
+            if all(pool.store.get(job.id).status in (SUCCEEDED, FAILED) for job in (good, bad)):
+                break
+            await asyncio.sleep(0.01)
+        done, failed = pool.store.get(good.id), pool.store.get(bad.id)
+        await pool.stop()
+        return done, failed
+
+    done, failed = asyncio.run(main())
+    assert done.status == SUCCEEDED and done.result == {"verdict": "YES"}
+    assert done.stages == {"market": {"title": "good"}}
+    assert failed.status == FAILED and failed.error == "no such market"
+
+
+def test_only_jobs_with_lapsed_leases_are_taken_over(tmp_path):
+    path = str(tmp_path / "jobs.sqlite")
+    live = JobStore(path, lease_seconds=60, owner="live")
+    crashed = JobStore(path, lease_seconds=0, owner="crashed")
+    running = live.create({"market_url": "running"})
+    orphaned = live.create({"market_url": "orphaned"})
+    assert live.claim(running.id) and crashed.claim(orphaned.id)
+    crashed.close()
+
+    # A restarting worker leaves the live owner's job alone
+    restarted = JobStore(path, lease_seconds=60, owner="restarted")
+    assert restarted.unfinished() == [orphaned.id]
+    assert not restarted.claim(running.id)
+    assert restarted.claim(orphaned.id) and restarted.get(orphaned.id).status == RUNNING
+    assert live.renew(running.id) and not live.renew(orphaned.id)
+
+    restarted.release(orphaned.id)
+    assert restarted.get(orphaned.id).status == QUEUED
+
+
+def test_a_worker_that_lost_its_lease_cannot_finish_the_job(tmp_path):
+    path = str(tmp_path / "jobs.sqlite")
+    stale = JobStore(path, lease_seconds=0, owner="stale")
+    job = stale.create({"market_url": "m"})
+    assert stale.claim(job.id)
+    current = JobStore(path, lease_seconds=60, owner="current")
+    assert current.claim(job.id)
+
+    stale.record_stage(job.id, "market", {"title": "stale"})
+    assert not stale.set_status(job.id, SUCCEEDED, result={"verdict": "NO"})
+    assert current.set_status(job.id, SUCCEEDED, result={"verdict": "YES"})
+    finished = current.get(job.id)
+    assert finished.result == {"verdict": "YES"} and finished.stages == {}
+
+
+def test_unusable_job_store_disables_jobs_instead_of_failing_startup(tmp_path):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    settings = Settings(jobs=dataclasses.replace(JobSettings(), store_path=str(blocker / "jobs.sqlite")))
+
+    assert asyncio.run(app_main._start_job_pool(settings)) is None
+    disabled = Settings(jobs=dataclasses.replace(JobSettings(), enabled=False, store_path=str(tmp_path / "j.sqlite")))
+    assert asyncio.run(app_main._start_job_pool(disabled)) is None
+    assert not (tmp_path / "j.sqlite").exists()
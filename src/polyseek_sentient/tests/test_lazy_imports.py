@@ -0,0 +1,11 @@
+import subprocess
+import sys
+
+
+def test_app_import_defers_heavy_dependencies():
+    code = (
+        "import sys, polyseek_sentient.main; "
+        "print(','.join(m for m in ('httpx', 'bs4', 'feedparser', 'litellm') if m in sys.modules))"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert proc.stdout.strip() == ""
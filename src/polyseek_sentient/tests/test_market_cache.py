@@ -0,0 +1,46 @@
+import asyncio
+from dataclasses import replace
+
+import httpx
+
+from polyseek_sentient.config import Settings
+from polyseek_sentient.fetch_market import _fetch_kalshi_data
+from polyseek_sentient.market_cache import MarketMetadataCache
+
+URL = "https://kalshi.com/markets/abc-1"
+
+
+def test_revalidates_with_etag_and_serves_stale_while_refreshing():
+    requests = []
+
+    def handler(request):
+        requests.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(200, headers={"etag": '"v1"'}, json={"market": {"ticker": "ABC-1", "title": "ABC"}})
+
+    async def main():
+        settings = Settings()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        cache = MarketMetadataCache(fresh_seconds=60, stale_seconds=60)
+        fetch = lambda previous: _fetch_kalshi_data(URL, settings, client, previous)
+
+        first = await cache.get("kalshi:ABC-1", URL, fetch)
+        again = await cache.get("kalshi:ABC-1", URL.upper(), fetch)
+        assert again == replace(first, url=URL.upper()) and again is not first and first.url == URL
+        assert requests == [None]
+
+        # Stale: served immediately, revalidated in the background
+        cache._entries["kalshi:ABC-1"].fetched_at -= 90
+        assert await cache.get("kalshi:ABC-1", URL, fetch) == first
+        await asyncio.sleep(0.01)
+        assert requests == [None, '"v1"']
+
+        # Expired: revalidated before returning; a 304 reuses the parsed market
+        cache._entries["kalshi:ABC-1"].fetched_at -= 500
+        assert await cache.get("kalshi:ABC-1", URL, fetch) == first
+        return cache.stats()
+
+    stats = asyncio.run(main())
+    assert stats["hits"] == 1 and stats["stale_hits"] == 1 and stats["misses"] == 1 and stats["expired"] == 1
+    assert stats["not_modified"] == 2
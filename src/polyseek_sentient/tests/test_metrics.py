@@ -0,0 +1,18 @@
+from polyseek_sentient.metrics import Counter, Histogram, MetricsRegistry
+
+
+def test_render_histogram_and_counter():
+    registry = MetricsRegistry()
+    latency = registry.register(Histogram("demo_seconds", "Demo latency.", ("stage",), buckets=(0.1, 1.0)))
+    errors = registry.register(Counter("demo_errors_total", "Demo errors.", ("stage",)))
+    latency.observe(0.05, stage="market")
+    latency.observe(0.5, stage="market")
+    errors.inc(stage="market")
+
+    text = registry.render()
+    assert '# TYPE demo_seconds histogram' in text
+    assert 'demo_seconds_bucket{stage="market",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{stage="market",le="1"} 2' in text
+    assert 'demo_seconds_bucket{stage="market",le="+Inf"} 2' in text
+    assert 'demo_seconds_count{stage="market"} 2' in text
+    assert 'demo_errors_total{stage="market"} 1' in text
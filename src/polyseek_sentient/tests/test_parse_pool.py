@@ -0,0 +1,86 @@
+import asyncio
+import dataclasses
+import os
+import subprocess
+import sys
+from concurrent.futures.process import BrokenProcessPool
+
+from polyseek_sentient.config import ParseSettings, ScrapeSettings
+from polyseek_sentient.metrics import PARSE_QUEUE_WAIT
+from polyseek_sentient.parse_pool import ParserPools
+from polyseek_sentient.scrape_context import _parse_html_raw
+
+PAGE = """<html><body><div data-testid="resolution-criteria">Resolves Yes on signing.</div>
+<div data-testid="comment-item"><span data-testid="comment-author">alice</span> I think this is very likely</div>
+</body></html>"""
+
+
+def _parse_in(mode):
+    pools = ParserPools(dataclasses.replace(ParseSettings(), mode=mode, scrape_workers=1))
+    pools.start()
+    try:
+        return asyncio.run(pools.run("scrape", _parse_html_raw, PAGE, ScrapeSettings()))
+    finally:
+        pools.shutdown()
+
+
+def test_process_pool_returns_compact_results():
+    before = PARSE_QUEUE_WAIT.render()
+    result = _parse_in("process")
+
+    assert result == ("Resolves Yes on signing.", [("alice I think this is very likely", "alice")])
+    assert result == _parse_in("thread")
+    assert PARSE_QUEUE_WAIT.render() != before
+
+
+class _BrokenPool:
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_broken_pool_is_shut_down_and_parse_falls_back_to_a_thread():
+    pools = ParserPools(dataclasses.replace(ParseSettings(), mode="process"))
+    broken = pools._pools["scrape"] = _BrokenPool()
+
+    result = asyncio.run(pools.run("scrape", _parse_html_raw, PAGE, ScrapeSettings()))
+
+    assert result[0] == "Resolves Yes on signing."
+    assert broken.shut_down and "scrape" not in pools._pools
+
+    # It never finished a task, so its workers cannot start: stay on threads
+    asyncio.run(pools.run("scrape", _parse_html_raw, PAGE, ScrapeSettings()))
+    assert "scrape" not in pools._pools
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+SRC_IMPORT_SCRIPT = """
+import asyncio, dataclasses
+from src.polyseek_sentient.config import ParseSettings, ScrapeSettings
+from src.polyseek_sentient.parse_pool import ParserPools
+from src.polyseek_sentient.scrape_context import _parse_html_raw
+
+pools = ParserPools(dataclasses.replace(ParseSettings(), mode="process", scrape_workers=1))
+pools.start()
+try:
+    result = asyncio.run(pools.run("scrape", _parse_html_raw, "<p data-testid='resolution-criteria'>Rules</p>", ScrapeSettings()))
+finally:
+    pools.shutdown()
+assert result == ("Rules", []), result
+assert "scrape" in pools._proven, "parsed in a thread instead of a worker"
+"""
+
+
+def test_process_pool_works_under_the_deployed_src_import_path():
+    env = {**os.environ, "PYTHONPATH": ROOT}
+    completed = subprocess.run(
+        [sys.executable, "-c", SRC_IMPORT_SCRIPT], cwd=ROOT, env=env, capture_output=True, text=True, timeout=60
+    )
+
+    assert completed.returncode == 0, completed.stderr
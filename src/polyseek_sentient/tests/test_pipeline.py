@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from polyseek_sentient.config import Settings
+from polyseek_sentient.pipeline import Stage, StageError, build_analysis_stages, run_stages
+
+
+def test_run_stages_overlaps_independent_stages():
+    started = []
+
+    def make(name, value, delay):
+        async def _run(inputs):
+            started.append(name)
+            await asyncio.sleep(delay)
+            return value(inputs)
+        return _run
+
+    stages = [
+        Stage("market", make("market", lambda _: "title", 0.05)),
+        Stage("context", make("context", lambda _: "rules", 0.05)),
+        Stage("signals", make("signals", lambda i: f"signals:{i['market']}", 0.0), ("market",)),
+    ]
+    results, timings = asyncio.run(run_stages(stages))
+
+    assert started[:2] == ["market", "context"]
+    assert results["signals"] == "signals:title"
+    assert set(timings) == {"market", "context", "signals"}
+
+
+def test_run_stages_wraps_failures():
+    async def _boom(_):
+        raise ValueError("no market")
+
+    async def _never(_):
+        raise AssertionError("dependent stage must not run")
+
+    stages = [Stage("market", _boom), Stage("signals", _never, ("market",))]
+    with pytest.raises(StageError) as excinfo:
+        asyncio.run(run_stages(stages))
+    assert excinfo.value.stage == "market"
+    assert isinstance(excinfo.value.error, ValueError)
+
+
+def test_run_stages_stop_when_cancels_unfinished_stages():
+    async def _fast(_):
+        return "hit"
+
+    async def _slow(_):
+        await asyncio.sleep(5)
+        return "scraped"
+
+    async def _after(_):
+        return "analysis"
+
+    stages = [
+        Stage("cache", _fast),
+        Stage("context", _slow),
+        Stage("analysis", _after, ("cache", "context")),
+    ]
+    results, timings = asyncio.run(
+        run_stages(stages, stop_when=lambda name, result: name == "cache" and result == "hit")
+    )
+    assert results == {"cache": "hit"}
+    assert set(timings) == {"cache"}
+
+
+def test_page_scan_overlaps_the_market_lookup_and_api_comments_reuse_it():
+    stages = build_analysis_stages("https://polymarket.com/event/x", "quick", "neutral", Settings())
+    depends = {stage.name: stage.depends_on for stage in stages}
+
+    assert depends["page"] == () and depends["comments"] == ("market",)
+    assert depends["context"] == ("page", "comments")
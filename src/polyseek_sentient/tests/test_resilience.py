@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from polyseek_sentient import resilience
+from polyseek_sentient.config import HTTPSettings
+from polyseek_sentient.http_clients import UPSTREAMS
+from polyseek_sentient.resilience import CircuitOpenError, ResiliencePolicy, ResilientTransport
+
+POLICY = ResiliencePolicy(attempts=3, base_delay=0.0, max_delay=0.0, hedge_min_samples=1, breaker_failures=2)
+
+
+def _client(handler, policy=POLICY):
+    return httpx.AsyncClient(transport=ResilientTransport(httpx.MockTransport(handler), policy))
+
+
+def test_retries_idempotent_requests_only():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503 if len(calls) == 1 else 200)
+
+    async def run():
+        async with _client(handler, ResiliencePolicy(base_delay=0.0, max_delay=0.0, breaker_failures=10)) as client:
+            ok = await client.get("https://retry.test/a")
+            posted = await client.post("https://retry.test/b")
+            return ok.status_code, posted.status_code
+
+    assert asyncio.run(run()) == (200, 200)
+    assert calls == ["GET", "GET", "POST"]
+
+
+def test_breaker_opens_and_fails_fast():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        raise httpx.ConnectError("down", request=request)
+
+    async def run():
+        async with _client(handler, ResiliencePolicy(attempts=1, breaker_failures=2)) as client:
+            for _ in range(2):
+                with pytest.raises(httpx.ConnectError):
+                    await client.get("https://breaker.test/x")
+            with pytest.raises(CircuitOpenError):
+                await client.get("https://breaker.test/x")
+
+    asyncio.run(run())
+    assert len(calls) == 2
+    assert resilience.breaker_states()["breaker.test"] == resilience.OPEN
+
+
+def test_half_open_probe_closes_circuit():
+    breaker = resilience.CircuitBreaker("probe.test", failure_threshold=1, reset_seconds=0.0)
+    breaker.record_failure()
+    breaker.before_request()
+    assert breaker.state == resilience.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == resilience.CLOSED
+
+
+def test_slow_get_is_hedged():
+    calls = []
+
+    async def handler(request):
+        calls.append(time.perf_counter())
+        if len(calls) == 1:
+            await asyncio.sleep(1.0)
+        return httpx.Response(200, text=str(len(calls)))
+
+    window = resilience._latencies.setdefault("hedge.test", resilience.LatencyWindow())
+    window.observe(0.02)
+
+    async def run():
+        async with _client(handler) as client:
+            started = time.perf_counter()
+            response = await client.get("https://hedge.test/slow")
+            return response.text, time.perf_counter() - started
+
+    text, elapsed = asyncio.run(run())
+    assert text == "2" and len(calls) == 2
+    assert elapsed < 0.5
+
+
+def test_long_retry_after_returns_response_without_retrying():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(429, headers={"Retry-After": "30"})
+
+    async def run():
+        async with _client(handler) as client:
+            return (await client.get("https://throttled.test/x")).status_code
+
+    assert asyncio.run(run()) == 429
+    assert calls == ["/x"]
+
+
+def test_hedging_is_opt_in_per_upstream():
+    settings = HTTPSettings()
+    assert {name for name, config in UPSTREAMS.items() if config.hedge} == {"polymarket", "scrape"}
+    assert ResiliencePolicy.from_settings(settings, hedge=False).hedge is False
+    assert ResiliencePolicy.from_settings(settings).hedge is settings.hedge_requests
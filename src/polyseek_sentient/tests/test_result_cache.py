@@ -0,0 +1,60 @@
+import asyncio
+
+from polyseek_sentient.fetch_market import MarketData, MarketPrices, MarketSource
+from polyseek_sentient.result_cache import AnalysisCache
+
+
+def _market(yes):
+    return MarketData(
+        market_id="123",
+        title="Will it rain?",
+        category=None,
+        rules=None,
+        deadline=None,
+        liquidity=None,
+        volume_24h=None,
+        source=MarketSource.POLYMARKET,
+        url="https://polymarket.com/event/rain",
+        prices=MarketPrices(yes=yes, no=None),
+    )
+
+
+def test_price_move_beyond_threshold_misses():
+    cache = AnalysisCache(ttl_seconds=60, price_threshold=0.02)
+    key = cache.key(_market(0.40), "quick", "neutral")
+    assert key == cache.key(_market(0.45), "quick", "neutral")
+    cache.set(key, {"verdict": "YES"}, price=0.3999)
+
+    # Crossing a round number is not a move; drifting past the threshold is
+    assert cache.get(key, 0.4001) == {"verdict": "YES"}
+    assert cache.get(key, 0.419) == {"verdict": "YES"}
+    assert cache.get(key, 0.421) is None
+    assert cache.get(key, None) is None
+    assert cache.stats()["price_misses"] == 2
+
+
+def test_async_access_uses_the_disk_tier(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    asyncio.run(AnalysisCache(ttl_seconds=60, sqlite_path=path).aset("a", {"verdict": "NO"}, 0.5))
+    reopened = AnalysisCache(ttl_seconds=60, sqlite_path=path)
+    assert asyncio.run(reopened.aget("a", 0.51)) == {"verdict": "NO"}
+    assert reopened.stats()["disk_hits"] == 1
+
+
+def test_lru_eviction_and_counters():
+    cache = AnalysisCache(ttl_seconds=60, max_entries=2)
+    cache.set("a", {"verdict": "YES"})
+    cache.set("b", {"verdict": "NO"})
+    assert cache.get("a") == {"verdict": "YES"}
+    cache.set("c", {"verdict": "UNCERTAIN"})
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["evictions"] == 1
+
+
+def test_sqlite_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    AnalysisCache(ttl_seconds=60, sqlite_path=path).set("a", {"verdict": "YES"})
+    reopened = AnalysisCache(ttl_seconds=60, sqlite_path=path)
+    assert reopened.get("a") == {"verdict": "YES"}
+    assert reopened.stats()["disk_hits"] == 1
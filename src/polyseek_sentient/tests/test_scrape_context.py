@@ -0,0 +1,149 @@
+import asyncio
+import dataclasses
+
+import httpx
+
+from polyseek_sentient.config import ScrapeSettings, Settings
+from polyseek_sentient.scrape_context import (
+    HTML_PARSERS,
+    _anonymize,
+    _download_html,
+    _parse_html_content,
+    _parse_next_data,
+    _scan_market_page,
+    comment_identity,
+    resolve_html_parser,
+)
+
+PAGE = """<html><head><meta name="description" content="Fallback text"></head><body>
+<div data-testid="resolution-criteria"><p>Resolves Yes if the bill is signed.</p></div>
+<div data-testid="comment-item"><a data-testid="comment-author">alice</a><p>Very likely to win this one honestly</p></div>
+<div class="CommentCard"><p>short</p></div>
+</body></html>"""
+
+
+def test_resolve_html_parser_falls_back_when_missing():
+    assert resolve_html_parser("auto") in HTML_PARSERS
+    assert resolve_html_parser("html.parser") == "html.parser"
+    assert resolve_html_parser("no-such-parser") == "html.parser"
+
+
+def test_parse_html_content_with_configured_backend():
+    settings = dataclasses.replace(ScrapeSettings(), html_parser="auto")
+    rules, comments = _parse_html_content(PAGE, settings)
+
+    assert rules == "Resolves Yes if the bill is signed."
+    assert [comment.body for comment in comments] == ["alice Very likely to win this one honestly"]
+    assert comments[0].sentiment == "pro" and comments[0].author.startswith("user_")
+
+
+NEXT_PAGE = """<html><body><script>window.__NEXT_DATA__ = window.__NEXT_DATA__ || {};</script>
+<div class="Comment">This DOM comment must not be read at all</div>
+<script id="__NEXT_DATA__" type="application/json">{"props": {"pageProps": {"queries": [
+  {"state": {"data": {"slug": "who-wins", "description": "Resolves to the winner.",
+                      "markets": [{"slug": "alice", "description": "Nested market text"}]}}},
+  {"state": {"data": {"pages": [[
+    {"id": "1", "body": "Alice looks likely to win   comfortably", "profile": {"name": "bob"}},
+    {"id": "2", "body": "too short"}
+  ]]}}}
+]}}}</script></body></html>"""
+
+
+def test_next_data_fast_path_skips_the_dom():
+    rules, comments = _parse_html_content(NEXT_PAGE, ScrapeSettings())
+
+    assert rules == "Resolves to the winner."
+    assert [comment.body for comment in comments] == ["Alice looks likely to win comfortably"]
+    assert comments[0].author.startswith("user_")
+
+
+def test_next_data_keeps_walking_for_rules_after_comments_fill_up():
+    comments = [{"id": str(index), "body": f"Comment number {index} with enough text"} for index in range(4)]
+    data = {"props": {"comments": comments, "event": {"slug": "who-wins", "description": "Resolves to the winner."}}}
+    settings = dataclasses.replace(ScrapeSettings(), max_comments=2)
+
+    rules, raw_comments = _parse_next_data(data, settings)
+
+    assert rules == "Resolves to the winner."
+    assert [body for body, _ in raw_comments] == ["Comment number 0 with enough text", "Comment number 1 with enough text"]
+
+
+def test_falls_back_to_dom_without_usable_next_data():
+    broken = PAGE.replace("</body>", '<script id="__NEXT_DATA__">{"props": {}}</script></body>')
+    rules, comments = _parse_html_content(broken, ScrapeSettings())
+
+    assert rules == "Resolves Yes if the bill is signed."
+    assert len(comments) == 1
+
+
+def _streaming_client(chunks, pulled):
+    async def body():
+        for chunk in chunks:
+            pulled.append(chunk)
+            yield chunk
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body())))
+
+
+def test_streaming_scan_stops_once_rules_and_comments_are_found():
+    page = PAGE.encode()
+    chunks = [page[i:i + 16] for i in range(0, len(page), 16)] + [b"<p>" + b"x" * 1000 + b"</p>"] * 50
+    pulled = []
+    settings = Settings(scrape=dataclasses.replace(ScrapeSettings(), max_comments=1))
+
+    client = _streaming_client(chunks, pulled)
+    rules, comments = asyncio.run(_scan_market_page("https://example.com/m", settings, client))
+
+    assert rules == "Resolves Yes if the bill is signed."
+    assert [comment.body for comment in comments] == ["alice Very likely to win this one honestly"]
+    assert len(pulled) < len(chunks) - 40
+
+
+def test_streaming_scan_stops_on_header_rules_and_reads_next_data():
+    page = """<html><body><h2>Resolution</h2><p>Resolves Yes on a signed bill.</p>
+<div class="Comment">Very likely to win this one honestly</div>""".encode()
+    chunks = [page] + [b"<p>" + b"x" * 1000 + b"</p>"] * 50
+    pulled = []
+    settings = Settings(scrape=dataclasses.replace(ScrapeSettings(), max_comments=1))
+
+    rules, comments = asyncio.run(_scan_market_page("https://example.com/m", settings, _streaming_client(chunks, pulled)))
+
+    assert rules == "Resolves Yes on a signed bill."
+    assert len(comments) == 1 and len(pulled) < 5
+
+    rules, comments = asyncio.run(_scan_market_page("https://example.com/m", settings, _streaming_client([NEXT_PAGE.encode()], [])))
+    assert rules == "Resolves to the winner."
+    assert [comment.body for comment in comments] == ["Alice looks likely to win comfortably"]
+
+
+def test_rules_only_scan_collects_no_comments():
+    rules_only = dataclasses.replace(ScrapeSettings(), max_comments=0)
+
+    assert _parse_html_content(PAGE, rules_only) == ("Resolves Yes if the bill is signed.", [])
+    assert _parse_html_content(NEXT_PAGE, rules_only) == ("Resolves to the winner.", [])
+
+
+def test_download_stops_at_byte_cap():
+    pulled = []
+    settings = Settings(scrape=dataclasses.replace(ScrapeSettings(), max_bytes=100))
+    html = asyncio.run(_download_html("https://example.com/m", settings, _streaming_client([b"a" * 60] * 10, pulled)))
+
+    assert html == "a" * 100
+    assert len(pulled) == 2
+
+
+def test_comment_ids_and_aliases_are_deterministic():
+    doubled = PAGE.replace("</body>", '<div class="Comment">Very likely to win this one honestly</div></body>')
+    first = _parse_html_content(doubled, ScrapeSettings())[1]
+    second = _parse_html_content(doubled, ScrapeSettings())[1]
+
+    assert [c.comment_id for c in first] == [c.comment_id for c in second]
+    assert len(first) == 2
+    assert first[0].comment_id == comment_identity("alice   Very likely to win this one honestly", "alice")
+    assert first[0].author == _anonymize("alice") != _anonymize("alice", "other-key")
+    assert comment_identity("same text here", "bob", "k1") != comment_identity("same text here", "bob", "k2")
+
+    # The same author posting the same text twice is one comment
+    comment = '<div data-testid="comment-item"><a data-testid="comment-author">bob</a><p>Same words again and again</p></div>'
+    repeated = PAGE.replace("</body>", comment * 2 + "</body>")
+    assert len(_parse_html_content(repeated, ScrapeSettings())[1]) == 2
@@ -0,0 +1,34 @@
+from polyseek_sentient.sentiment import LexiconScorer, score_texts
+
+
+def test_words_match_only_on_word_boundaries():
+    know, eyes = score_texts(["I know nothing about this", "All eyes on the vote"])
+
+    assert (know.label, know.polarity) == ("neutral", 0.0)
+    assert (eyes.label, eyes.polarity) == ("neutral", 0.0)
+
+
+def test_polarity_and_labels():
+    pro, con, mixed = score_texts(
+        ["Likely to WIN, very bullish", "Unlikely; the bill will be rejected", "Could win or lose"]
+    )
+
+    assert (pro.label, pro.polarity) == ("pro", 1.0)
+    assert (con.label, con.polarity) == ("con", -1.0)
+    assert (mixed.label, mixed.polarity) == ("neutral", 0.0)
+    assert score_texts(["yes yes no"])[0].polarity == 0.3333
+
+
+def test_batch_matches_single_text_scoring():
+    scorer = LexiconScorer(["gain"], ["fall"])
+    texts = ["gain", "", "@amy prices fall-again", "fall fall gain @bo @cy"]
+
+    assert scorer.score_many(texts) == [scorer.score(text) for text in texts]
+    assert scorer.score_many([]) == []
+
+
+def test_mentions_ratio():
+    score = score_texts(["@alice @bob:x agreed, likely"])[0]
+
+    assert score.mentions_ratio == 0.5
+    assert score.label == "pro"
@@ -0,0 +1,64 @@
+import asyncio
+from dataclasses import replace
+
+import httpx
+
+from polyseek_sentient.config import Settings
+from polyseek_sentient.fetch_market import _fetch_polymarket_data
+from polyseek_sentient.market_cache import SlugKindMemo, get_slug_memo
+
+URL = "https://polymarket.com/market/plain-market"
+
+
+def _handler(paths):
+    def handler(request):
+        paths.append(request.url.path)
+        if request.url.path == "/events":
+            return httpx.Response(200, json=[])
+        return httpx.Response(200, json=[{"id": 7, "question": "Plain market?", "yesPrice": "0.4"}])
+
+    return handler
+
+
+def _fetch_twice(settings, paths):
+    async def main():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(_handler(paths)))
+        first = await _fetch_polymarket_data(URL, settings, client)
+        second = await _fetch_polymarket_data(URL, settings, client)
+        return first.market, second.market
+
+    return asyncio.run(main())
+
+
+def test_memo_skips_events_lookup_for_known_market_slugs(tmp_path):
+    settings = Settings()
+    settings = replace(settings, cache=replace(settings.cache, slug_memo_path=str(tmp_path / "slugs.sqlite")))
+    paths = []
+    first, second = _fetch_twice(settings, paths)
+    assert first.title == second.title == "Plain market?"
+    assert paths == ["/events", "/markets", "/markets"]
+    assert get_slug_memo(settings).get("plain-market") == "markets"
+    assert SlugKindMemo(str(tmp_path / "slugs.sqlite")).get("plain-market") == "markets"
+
+
+def test_memo_slugs_are_case_insensitive(tmp_path):
+    memo = SlugKindMemo(str(tmp_path / "slugs.sqlite"))
+    memo.set("plain-market", "markets")
+    memo.set("Plain-Market", "markets")
+    assert memo.get("PLAIN-MARKET") == "markets"
+
+    async def set_on_loop():
+        memo.set("Loop-Slug", "events")
+
+    asyncio.run(set_on_loop())
+    reopened = SlugKindMemo(str(tmp_path / "slugs.sqlite"))
+    assert reopened.get("plain-market") == "markets" and reopened.get("loop-slug") == "events"
+
+
+def test_parallel_lookup_queries_both_endpoints_on_cold_miss():
+    settings = Settings()
+    settings = replace(settings, apis=replace(settings.apis, polymarket_parallel_lookup=True))
+    paths = []
+    first, _ = _fetch_twice(settings, paths)
+    assert first.market_id == "7"
+    assert sorted(paths[:2]) == ["/events", "/markets"] and paths[2:] == ["/markets"]
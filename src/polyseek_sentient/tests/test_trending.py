@@ -0,0 +1,62 @@
+import asyncio
+
+import httpx
+
+from polyseek_sentient.config import Settings
+from polyseek_sentient.trending import TrendingCatalog
+
+
+class _Clients:
+    def __init__(self, handler):
+        self._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    def get(self, upstream):
+        return self._client
+
+
+def test_refresh_merges_sources_and_keeps_last_good_data(monkeypatch):
+    kalshi_up = True
+
+    def handler(request):
+        if "polymarket" in request.url.host:
+            return httpx.Response(200, json=[{
+                "slug": "big-event",
+                "title": "Big event",
+                "volume24hr": 2_500_000,
+                "markets": [{"active": True, "outcomes": '["Yes","No"]', "outcomePrices": '["0.31","0.69"]'}],
+            }])
+        if not kalshi_up:
+            return httpx.Response(503)
+        if request.url.params.get("cursor") is None:
+            return httpx.Response(200, json={"cursor": "page-2", "markets": [
+                {"ticker": "PENNY-1", "title": "Penny", "volume_24h": 5000, "last_price": 1},
+                {"ticker": "ZERO-1", "title": "Zero", "volume_24h": 10, "last_price": 0, "yes_bid": 40},
+            ]})
+        return httpx.Response(200, json={"cursor": "", "markets": [
+            {"ticker": "SMALL-1", "title": "Small", "volume_24h": 900, "last_price": 55},
+        ]})
+
+    clients = _Clients(handler)
+    monkeypatch.setattr("polyseek_sentient.http_clients.current_http_clients", lambda: clients)
+    catalog = TrendingCatalog(Settings())
+    seed_etag = catalog.snapshot.etag
+
+    asyncio.run(catalog.refresh())
+    first = catalog.snapshot
+    assert first.etag != seed_etag
+    assert [m["url"] for m in first.markets] == [
+        "https://polymarket.com/event/big-event",
+        "https://kalshi.com/markets/SMALL-1",
+        "https://kalshi.com/markets/PENNY-1",
+        "https://kalshi.com/markets/ZERO-1",
+    ]
+    assert first.markets[0]["price"] == "0.31" and first.markets[0]["volume"] == "$2.5M"
+    # Kalshi cents are always divided, contracts are valued at the YES price, and 0 is a price
+    small, penny, zero = first.markets[1:]
+    assert small["price"] == "0.55" and small["volume"] == "$495" and small["volume_contracts"] == 900
+    assert penny["price"] == "0.01" and penny["volume_24h"] == 50
+    assert zero["price"] == "0.00" and zero["volume_24h"] == 0
+
+    kalshi_up = False
+    asyncio.run(catalog.refresh())
+    assert catalog.snapshot.markets == first.markets
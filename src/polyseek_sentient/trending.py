@@ -0,0 +1,250 @@
+"""Trending markets catalog, refreshed in the background and served from memory."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .config import Settings, load_settings
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Served until the first refresh lands, and whenever refreshing is disabled
+SEED_MARKETS: List[Dict] = [
+    {
+        "id": 1,
+        "title": "Will Bitcoin hit $100k in 2024?",
+        "price": "0.65",
+        "volume": "$12M",
+        "url": "https://polymarket.com/event/will-bitcoin-hit-100k-in-2024",
+    },
+    {
+        "id": 2,
+        "title": "Russia x Ukraine Ceasefire in 2025?",
+        "price": "0.15",
+        "volume": "$5M",
+        "url": "https://polymarket.com/event/russia-x-ukraine-ceasefire-in-2025",
+    },
+    {
+        "id": 3,
+        "title": "Will AI surpass human performance in coding by 2026?",
+        "price": "0.42",
+        "volume": "$1.8M",
+        "url": "https://polymarket.com/event/ai-coding-2026",
+    },
+]
+
+
+@dataclass(frozen=True)
+class TrendingSnapshot:
+    """An immutable, pre-serialized catalog; replaced wholesale on refresh."""
+
+    markets: Tuple[Dict, ...]
+    body: bytes
+    etag: str
+    refreshed_at: float
+
+    @classmethod
+    def build(cls, markets: List[Dict], refreshed_at: float) -> "TrendingSnapshot":
+        body = json.dumps(markets, separators=(",", ":")).encode()
+        etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        return cls(tuple(markets), body, etag, refreshed_at)
+
+
+class TrendingCatalog:
+    """Keeps the top markets by 24h volume from Polymarket and Kalshi.
+
+    ``snapshot`` never touches the network; a background task refreshes it
+    every ``refresh_seconds``. A source that fails keeps its previous markets.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or load_settings()
+        self.snapshot = TrendingSnapshot.build(SEED_MARKETS, refreshed_at=0.0)
+        self._by_source: Dict[str, List[Dict]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def age_seconds(self) -> Optional[float]:
+        """Seconds since the last successful refresh; ``None`` while seeded."""
+        if not self.snapshot.refreshed_at:
+            return None
+        return time.time() - self.snapshot.refreshed_at
+
+    def start(self) -> None:
+        if self.settings.app.offline_mode or self.settings.trending.refresh_seconds <= 0:
+            return
+        self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def refresh(self) -> None:
+        from .http_clients import current_http_clients
+
+        clients = current_http_clients()
+        fetchers = {
+            "polymarket": _fetch_polymarket_trending,
+            "kalshi": _fetch_kalshi_trending,
+        }
+        results = await asyncio.gather(
+            *(
+                fetch(self.settings, clients.get(source) if clients else None)
+                for source, fetch in fetchers.items()
+            ),
+            return_exceptions=True,
+        )
+        for source, result in zip(fetchers, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Trending refresh from {source} failed: {result}")
+            else:
+                self._by_source[source] = result
+        markets = sorted(
+            (market for markets in self._by_source.values() for market in markets),
+            key=lambda market: market["volume_24h"],
+            reverse=True,
+        )[: self.settings.trending.limit]
+        if markets:
+            self.snapshot = TrendingSnapshot.build(markets, refreshed_at=time.time())
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as exc:
+                logger.error(f"Trending refresh failed: {exc}")
+            await asyncio.sleep(self.settings.trending.refresh_seconds)
+
+
+async def _fetch_polymarket_trending(settings: Settings, client: Optional[httpx.AsyncClient]) -> List[Dict]:
+    import httpx
+
+    from .fetch_market import _to_float, parse_outcome_prices
+
+    endpoint = f"{settings.apis.polymarket_base}/events"
+    params = {
+        "active": "true",
+        "closed": "false",
+        "order": "volume24hr",
+        "ascending": "false",
+        "limit": settings.trending.limit,
+    }
+    close_client = client is None
+    client = client or httpx.AsyncClient(timeout=10)
+    try:
+        resp = await client.get(endpoint, params=params)
+        resp.raise_for_status()
+        events = resp.json()
+    finally:
+        if close_client:
+            await client.aclose()
+
+    markets = []
+    for event in events if isinstance(events, list) else []:
+        slug = event.get("slug")
+        if not slug:
+            continue
+        listed = event.get("markets") or []
+        market = next((m for m in listed if m.get("active")), listed[0]) if listed else {}
+        volume = _to_float(event.get("volume24hr")) or 0.0
+        markets.append(
+            _trending_entry(
+                market_id=f"polymarket:{slug}",
+                title=event.get("title") or market.get("question") or slug,
+                yes_price=parse_outcome_prices(market).yes if market else None,
+                volume_24h=volume,
+                url=f"https://polymarket.com/event/{slug}",
+                source="polymarket",
+            )
+        )
+    return markets
+
+
+async def _fetch_kalshi_trending(settings: Settings, client: Optional[httpx.AsyncClient]) -> List[Dict]:
+    import httpx
+
+    from .fetch_market import _to_float
+
+    # The markets listing has no volume ordering; page through it and sort here
+    endpoint = f"{settings.apis.kalshi_base}/trade-api/v2/markets"
+    params = {"status": "open", "limit": 1000}
+    close_client = client is None
+    client = client or httpx.AsyncClient(timeout=10)
+    listed: List[Dict] = []
+    try:
+        for _ in range(max(1, settings.trending.kalshi_max_pages)):
+            resp = await client.get(endpoint, params=params, headers={"accept": "application/json"})
+            resp.raise_for_status()
+            page = resp.json()
+            listed.extend(page.get("markets") or [])
+            cursor = page.get("cursor")
+            if not cursor:
+                break
+            params = {**params, "cursor": cursor}
+        else:
+            logger.info(f"Ranked the first {len(listed)} open Kalshi markets; the listing has more")
+    finally:
+        if close_client:
+            await client.aclose()
+
+    markets = []
+    for market in listed:
+        ticker = market.get("ticker")
+        if not ticker:
+            continue
+        # Kalshi quotes prices in cents
+        price = _to_float(market.get("last_price"))
+        if price is None:
+            price = _to_float(market.get("yes_bid"))
+        yes_price = price / 100 if price is not None else None
+        # Volume is a contract count; at the YES price it compares with Polymarket's USD volume
+        contracts = _to_float(market.get("volume_24h")) or 0.0
+        entry = _trending_entry(
+            market_id=f"kalshi:{ticker}",
+            title=market.get("title") or ticker,
+            yes_price=yes_price,
+            volume_24h=contracts * (yes_price or 0.0),
+            url=f"https://kalshi.com/markets/{ticker}",
+            source="kalshi",
+        )
+        entry["volume_contracts"] = contracts
+        markets.append(entry)
+    markets.sort(key=lambda market: market["volume_24h"], reverse=True)
+    return markets[: settings.trending.limit]
+
+
+def _trending_entry(
+    market_id: str,
+    title: str,
+    yes_price: Optional[float],
+    volume_24h: float,
+    url: str,
+    source: str,
+) -> Dict:
+    # ``price`` and ``volume`` are display strings, as the frontend renders them as-is
+    return {
+        "id": market_id,
+        "title": title,
+        "price": f"{yes_price:.2f}" if yes_price is not None else "-",
+        "volume": _format_volume(volume_24h),
+        "url": url,
+        "source": source,
+        "volume_24h": volume_24h,
+    }
+
+
+def _format_volume(value: float) -> str:
+    for threshold, suffix in ((1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if value >= threshold:
+            return f"${value / threshold:.1f}".rstrip("0").rstrip(".") + suffix
+    return f"${value:.0f}"